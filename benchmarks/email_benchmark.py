@@ -0,0 +1,110 @@
+"""
+Benchmark of the notification email renderer.
+
+Renders per-spider emails and digests for growing numbers of jobs and
+reports the time per job, which stays flat while rendering is linear.
+No SMTP server is contacted.
+
+Usage:
+    poetry run python benchmarks/email_benchmark.py --jobs 100 1000 10000
+"""
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+
+from jobsearchtools.config.settings import settings
+from jobsearchtools.notifications.email_notifier import EmailNotifier
+
+
+def make_jobs(count: int) -> list[dict]:
+    """
+    Build new-job dictionaries like the ones the pipeline reports.
+
+    Args:
+        count: Number of jobs.
+
+    Returns:
+        Jobs spread over ten companies, sorted by company.
+    """
+    return sorted(
+        (
+            {
+                "title": f"Data Engineer {n}",
+                "company": f"Company {n % 10}",
+                "location": "Bogotá, Colombia",
+                "url": f"https://jobs.example.com/job/{n}/",
+                "date_posted": "2026-01-01",
+                "salary": None,
+                "description": "Build and run data pipelines. " * 15,
+            }
+            for n in range(count)
+        ),
+        key=lambda job: job["company"],
+    )
+
+
+def measure(render, repeat: int) -> tuple[float, int]:
+    """
+    Time a render call and measure its peak memory.
+
+    Args:
+        render: Callable returning the rendered HTML.
+        repeat: Number of timed runs, the best is kept.
+
+    Returns:
+        Tuple of (best seconds, peak traced bytes).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--jobs", type=int, nargs="*", default=[100, 1_000, 10_000], help="Job counts"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    # Render every job instead of stopping at the configured caps
+    settings.email.max_jobs = max(args.jobs)
+    notifier = EmailNotifier()
+
+    header = f"{'email':<10}{'jobs':>8}{'seconds':>10}{'us/job':>10}{'peak MiB':>10}"
+    print(f"Rendering emails, best of {args.repeat} runs")
+    print(header)
+    print("-" * len(header))
+    for count in args.jobs:
+        jobs = make_jobs(count)
+        renders = {
+            "spider": lambda jobs=jobs: notifier._generate_html_email(jobs, "bench"),
+            "digest": lambda jobs=jobs: notifier._generate_digest_html(
+                jobs, len(jobs), 10
+            ),
+        }
+        for name, render in renders.items():
+            seconds, peak = measure(render, args.repeat)
+            print(
+                f"{name:<10}{count:>8}{seconds:>10.4f}"
+                f"{seconds / count * 1e6:>10.1f}{peak / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
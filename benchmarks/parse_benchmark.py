@@ -0,0 +1,129 @@
+"""
+Offline benchmark of spider parse callbacks.
+
+Runs every callback in ``parse_fixtures.PARSE_FIXTURES`` against recorded
+pages scaled to ``--rows`` listings and reports throughput and memory.
+Detail callbacks parse one job per page, so they are called ``--rows``
+times instead. No network access is needed.
+
+Usage:
+    poetry run python benchmarks/parse_benchmark.py --rows 10000
+"""
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from parse_fixtures import PARSE_FIXTURES, ParseFixture, build_response, run_callback
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one callback."""
+
+    name: str
+    results: int
+    seconds: float
+    peak_bytes: int
+    retained_blocks: int
+
+    @property
+    def per_second(self) -> float:
+        """Yielded items and requests per second."""
+        return self.results / self.seconds if self.seconds else 0.0
+
+    @property
+    def blocks_per_result(self) -> float:
+        """Memory blocks still allocated per yielded result."""
+        return self.retained_blocks / self.results if self.results else 0.0
+
+
+def _run(parse_fixture: ParseFixture, rows: int) -> list:
+    """Run a callback over a freshly built page (or pages) of ``rows`` jobs."""
+    if parse_fixture.scalable:
+        return run_callback(parse_fixture, build_response(parse_fixture, rows))
+
+    spider = parse_fixture.spider_class()
+    responses = [build_response(parse_fixture) for _ in range(rows)]
+    results = []
+    for response in responses:
+        results.extend(run_callback(parse_fixture, response, spider))
+    return results
+
+
+def benchmark(parse_fixture: ParseFixture, rows: int, repeat: int) -> BenchmarkResult:
+    """
+    Measure a callback.
+
+    Timing takes the best of ``repeat`` runs. Memory is measured in a
+    separate run under tracemalloc, which would otherwise skew the timing.
+
+    Args:
+        parse_fixture: Callback and fixture to benchmark.
+        rows: Listings per page, or detail pages to parse.
+        repeat: Number of timed runs.
+
+    Returns:
+        Benchmark measurements.
+    """
+    best = float("inf")
+    results = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        results = _run(parse_fixture, rows)
+        best = min(best, time.perf_counter() - started)
+    count = len(results)
+    del results
+
+    gc.collect()
+    tracemalloc.start()
+    results = _run(parse_fixture, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count for stat in snapshot.statistics("filename"))
+    del results
+
+    return BenchmarkResult(parse_fixture.name, count, best, peak, retained)
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="Jobs per page")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs")
+    parser.add_argument(
+        "--only", nargs="*", help="Benchmark names or spider names to run"
+    )
+    args = parser.parse_args()
+
+    # Spiders log per job, which would dominate the measurements
+    logging.disable(logging.WARNING)
+
+    header = (
+        f"{'callback':<28}{'results':>9}{'seconds':>10}{'results/s':>12}"
+        f"{'peak MiB':>10}{'blocks/result':>15}"
+    )
+    print(f"Parsing {args.rows} jobs per callback, best of {args.repeat} runs")
+    print(header)
+    print("-" * len(header))
+    for parse_fixture in PARSE_FIXTURES:
+        if args.only and not {
+            parse_fixture.name,
+            parse_fixture.spider_class.name,
+        } & set(args.only):
+            continue
+        result = benchmark(parse_fixture, args.rows, args.repeat)
+        print(
+            f"{result.name:<28}{result.results:>9}{result.seconds:>10.3f}"
+            f"{result.per_second:>12.0f}{result.peak_bytes / 2**20:>10.1f}"
+            f"{result.blocks_per_result:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
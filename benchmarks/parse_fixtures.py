@@ -0,0 +1,275 @@
+"""
+Recorded pages for running spider callbacks offline.
+
+Each fixture marks one listing with ``<!-- row -->`` / ``<!-- /row -->``.
+The marked block is repeated to scale a page to any number of rows, with
+``__N__`` replaced by the row number so every job gets a unique id.
+"""
+
+import asyncio
+import inspect
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scrapy.http import HtmlResponse, Request
+
+from jobsearchtools.job_scraper.job_scraper.items import JobScraperItem
+from jobsearchtools.job_scraper.job_scraper.spiders.dynamic.bbva import BbvaSpider
+from jobsearchtools.job_scraper.job_scraper.spiders.dynamic.visa import VisaSpider
+from jobsearchtools.job_scraper.job_scraper.spiders.static.avianca import (
+    AviancaSpider,
+)
+from jobsearchtools.job_scraper.job_scraper.spiders.static.bancolombia import (
+    BancolombiaSpider,
+)
+from jobsearchtools.job_scraper.job_scraper.spiders.static.citi import CitiSpider
+from jobsearchtools.job_scraper.job_scraper.spiders.static.ecopetrol import (
+    EcopetrolSpider,
+)
+from jobsearchtools.job_scraper.job_scraper.spiders.static.mastercard import (
+    MastercardSpider,
+)
+from jobsearchtools.job_scraper.job_scraper.spiders.static.nequi import NequiSpider
+from jobsearchtools.job_scraper.job_scraper.spiders.static.scotiabank import (
+    ScotiabankSpider,
+)
+from jobsearchtools.job_scraper.job_scraper.spiders.static.sura import SuraSpider
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+ROW_PATTERN = re.compile(r"<!-- row -->\n?(.*?)<!-- /row -->\n?", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class ParseFixture:
+    """A spider callback and the recorded page it parses."""
+
+    spider_class: type
+    callback: str
+    fixture: str
+    url: str
+    # Separator between repeated rows, e.g. "," inside a JSON array
+    row_separator: str = ""
+    # Builds callback keyword arguments, e.g. the item for detail pages
+    cb_kwargs: Callable[[], dict[str, Any]] = field(default=dict)
+
+    @property
+    def name(self) -> str:
+        """Identifier used in benchmark reports and test ids."""
+        return f"{self.spider_class.name}.{self.callback}"
+
+    @property
+    def scalable(self) -> bool:
+        """Whether the fixture has a row block that can be repeated."""
+        return ROW_PATTERN.search(load_fixture(self.fixture)) is not None
+
+
+def _detail_item() -> dict[str, Any]:
+    """Build the partial item passed to detail page callbacks."""
+    return {"item": JobScraperItem(job_id="fixture_1", title="Fixture")}
+
+
+PARSE_FIXTURES = [
+    ParseFixture(
+        AviancaSpider,
+        "parse",
+        "successfactors_listing.html",
+        "https://jobs.avianca.com/search/",
+    ),
+    ParseFixture(
+        AviancaSpider,
+        "parse_detail",
+        "avianca_detail.html",
+        "https://jobs.avianca.com/job/Bogota-Analista-de-Datos/101/",
+        cb_kwargs=_detail_item,
+    ),
+    ParseFixture(
+        BancolombiaSpider,
+        "parse",
+        "successfactors_listing.html",
+        "https://empleo.grupobancolombia.com/search/",
+    ),
+    ParseFixture(
+        ScotiabankSpider,
+        "parse",
+        "successfactors_listing.html",
+        "https://jobs.scotiabank.com/search/",
+    ),
+    ParseFixture(
+        SuraSpider,
+        "parse",
+        "successfactors_listing.html",
+        "https://trabajaconnosotros.sura.com/search/",
+    ),
+    ParseFixture(
+        EcopetrolSpider,
+        "parse",
+        "ecopetrol_listing.html",
+        "https://jobs.ecopetrol.com.co/search/",
+    ),
+    ParseFixture(
+        CitiSpider,
+        "parse",
+        "citi_listing.html",
+        "https://jobs.citi.com/location/bogota-jobs/287/3686110-3688685-3688689/4",
+    ),
+    ParseFixture(
+        MastercardSpider,
+        "parse",
+        "mastercard_listing.html",
+        "https://careers.mastercard.com/us/en/bogota-colombia",
+        row_separator=",",
+    ),
+    ParseFixture(
+        MastercardSpider,
+        "parse_detail",
+        "mastercard_detail.html",
+        "https://careers.mastercard.com/us/en/job/R-20001/Software-Engineer-1",
+        cb_kwargs=_detail_item,
+    ),
+    ParseFixture(
+        NequiSpider,
+        "parse",
+        "nequi_listing.html",
+        "https://lapipolnequi.buk.co/trabaja-con-nosotros",
+    ),
+    ParseFixture(
+        NequiSpider,
+        "parse_job_details",
+        "nequi_detail.html",
+        "https://lapipolnequi.buk.co/trabaja-con-nosotros/jobs/30001",
+    ),
+    ParseFixture(
+        BbvaSpider,
+        "parse_api",
+        "bbva_api.json",
+        BbvaSpider.api_url,
+        row_separator=",",
+        cb_kwargs=lambda: {"offset": 0},
+    ),
+    ParseFixture(
+        BbvaSpider,
+        "parse",
+        "bbva_listing.html",
+        BbvaSpider.start_urls[0],
+    ),
+    ParseFixture(
+        VisaSpider,
+        "parse",
+        "visa_listing.html",
+        VisaSpider.start_urls[0],
+    ),
+]
+
+
+def load_fixture(name: str) -> str:
+    """
+    Read a recorded page.
+
+    Args:
+        name: File name inside the fixtures directory.
+
+    Returns:
+        Page source.
+    """
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def scale_page(html: str, rows: int, separator: str = "") -> str:
+    """
+    Repeat the marked row block of a page.
+
+    Args:
+        html: Page source with a ``<!-- row -->`` block.
+        rows: Number of rows in the resulting page.
+        separator: Text inserted between repeated rows.
+
+    Returns:
+        Page source with ``rows`` numbered copies of the block.
+    """
+    match = ROW_PATTERN.search(html)
+    if match is None:
+        return html
+    block = match.group(1)
+    repeated = separator.join(
+        block.replace("__N__", str(n)) for n in range(1, rows + 1)
+    )
+    return html[: match.start()] + repeated + html[match.end() :]
+
+
+class FakePlaywrightPage:
+    """Stand-in for a Playwright page that serves already rendered HTML."""
+
+    def __init__(self, content: str):
+        """
+        Initialize the page.
+
+        Args:
+            content: Rendered page source.
+        """
+        self._content = content
+        self.closed = False
+
+    async def content(self) -> str:
+        """Return the rendered page source."""
+        return self._content
+
+    async def close(self) -> None:
+        """Mark the page as closed."""
+        self.closed = True
+
+
+def build_response(parse_fixture: ParseFixture, rows: int = 1) -> HtmlResponse:
+    """
+    Build the response a callback receives for a fixture.
+
+    Dynamic spiders read the page through ``playwright_page``, so a fake
+    page serving the same HTML is attached to the request meta.
+
+    Args:
+        parse_fixture: Callback and fixture to load.
+        rows: Number of listing rows in the page.
+
+    Returns:
+        Response ready to pass to the callback.
+    """
+    html = scale_page(
+        load_fixture(parse_fixture.fixture), rows, parse_fixture.row_separator
+    )
+    request = Request(
+        parse_fixture.url,
+        meta={"playwright_page": FakePlaywrightPage(html)},
+    )
+    return HtmlResponse(
+        url=parse_fixture.url, body=html, encoding="utf-8", request=request
+    )
+
+
+def run_callback(
+    parse_fixture: ParseFixture, response: HtmlResponse, spider=None
+) -> list:
+    """
+    Run a spider callback and collect everything it yields.
+
+    Args:
+        parse_fixture: Callback to run.
+        response: Response built by ``build_response``.
+        spider: Spider instance to reuse, created if omitted.
+
+    Returns:
+        Items and requests yielded by the callback.
+    """
+    spider = spider or parse_fixture.spider_class()
+    callback = getattr(spider, parse_fixture.callback)
+    results = callback(response, **parse_fixture.cb_kwargs())
+    if inspect.isasyncgen(results):
+        return asyncio.run(_collect(results))
+    return list(results)
+
+
+async def _collect(results) -> list:
+    """Drain an async generator callback."""
+    return [result async for result in results]
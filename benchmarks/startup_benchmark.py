@@ -0,0 +1,110 @@
+"""
+Startup benchmark of the project's entry modules.
+
+Imports each module in a fresh interpreter with ``python -X importtime``
+and reports the cumulative import time of the module, the total of every
+import the interpreter made, and the slowest modules it pulled in.
+
+Usage:
+    poetry run python benchmarks/startup_benchmark.py
+    poetry run python benchmarks/startup_benchmark.py jobsearchtools.scheduler --top 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+DEFAULT_MODULES = [
+    "jobsearchtools.config.settings",
+    "jobsearchtools.notifications",
+    "jobsearchtools.scheduler",
+]
+
+
+@dataclass
+class ImportTiming:
+    """Import times of one interpreter run, in microseconds."""
+
+    module_us: int
+    total_us: int
+    # (cumulative microseconds, module) of every import
+    imports: list[tuple[int, str]]
+
+
+def parse_importtime(output: str, module: str) -> ImportTiming:
+    """
+    Parse the ``-X importtime`` report of an interpreter.
+
+    Args:
+        output: Standard error of the interpreter.
+        module: Module whose cumulative time is reported.
+
+    Returns:
+        Parsed timings.
+    """
+    module_us = total_us = 0
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        total_us += int(self_us)
+        name = name.strip()
+        imports.append((int(cumulative_us), name))
+        if name == module:
+            module_us = int(cumulative_us)
+    return ImportTiming(module_us, total_us, imports)
+
+
+def time_import(module: str) -> ImportTiming:
+    """
+    Import a module in a fresh interpreter and time it.
+
+    Args:
+        module: Dotted module name.
+
+    Returns:
+        Import timings of the run.
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(result.stderr, module)
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per module")
+    parser.add_argument("--top", type=int, default=0, help="Slowest imports shown")
+    args = parser.parse_args()
+
+    header = f"{'module':<40}{'module ms':>12}{'all imports ms':>16}"
+    print(f"Import time in a fresh interpreter, best of {args.repeat} runs")
+    print(header)
+    print("-" * len(header))
+    for module in args.modules:
+        best = min(
+            (time_import(module) for _ in range(args.repeat)),
+            key=lambda timing: timing.total_us,
+        )
+        print(
+            f"{module:<40}{best.module_us / 1000:>12.1f}{best.total_us / 1000:>16.1f}"
+        )
+        for cumulative_us, name in sorted(best.imports, reverse=True)[: args.top]:
+            print(f"    {name:<52}{cumulative_us / 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Lazily built module-level singletons.
+
+Modules expose shared instances such as ``settings`` or ``email_notifier``
+as globals. Building them at import time read the environment, created
+directories and opened files for every importer, even ones that only
+needed a helper function. ``Lazy`` defers that work to the first attribute
+access while keeping attribute access on the global unchanged.
+
+This does not make the modules themselves cheaper to import, that cost is
+pydantic and the other module-level imports. The globals are annotated as
+``Lazy[...]`` because they are proxies: ``isinstance`` and ``type()`` see
+the proxy, so code that needs the object itself calls ``resolve()``.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Lazy(Generic[T]):
+    """
+    Proxy that builds its object on first attribute access.
+
+    Attribute reads and writes are forwarded to the object. Special methods
+    such as ``len()``, ``isinstance`` and ``type()`` are not, use
+    ``resolve()`` to get the object itself.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        """
+        Initialize the proxy.
+
+        Args:
+            factory: Callable building the object, called at most once.
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def initialized(self) -> bool:
+        """Whether the object has been built."""
+        return self._instance is not None
+
+    def resolve(self) -> T:
+        """
+        Return the object, building it if needed.
+
+        Returns:
+            The proxied object.
+        """
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    object.__setattr__(self, "_instance", self._factory())
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute reads to the object."""
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Forward attribute writes to the object."""
+        setattr(self.resolve(), name, value)
+
+    def __repr__(self) -> str:
+        """Describe the proxy without building the object."""
+        if self._instance is None:
+            return f"<Lazy {getattr(self._factory, '__name__', self._factory)}>"
+        return repr(self._instance)
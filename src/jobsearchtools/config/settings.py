@@ -7,15 +7,21 @@ This module provides type-safe configuration management with support for:
 - Email notification settings
 - Scheduler configuration
 - Scrapy settings integration
+
+The global ``settings`` is built on first use, so importing this module
+neither reads the environment nor creates directories.
 """
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from jobsearchtools.config.lazy import Lazy
+from jobsearchtools.job_scraper.job_scraper.spider_registry import SPIDERS
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +38,27 @@ class DatabaseSettings(BaseSettings):
     password: str = Field(default="", description="Database password")
     pool_size: int = Field(default=5, description="Connection pool size")
     max_overflow: int = Field(default=10, description="Max pool overflow")
+    write_mode: Literal["immediate", "batch", "copy"] = Field(
+        default="immediate",
+        description=(
+            "Pipeline write strategy: per-item commits, buffered batches, "
+            "or COPY into a staging table merged at spider close"
+        ),
+    )
+    batch_size: int = Field(
+        default=500, ge=1, description="Items buffered before a batch flush or COPY"
+    )
+    batch_flush_seconds: float = Field(
+        default=30.0, gt=0, description="Max seconds between batch flushes"
+    )
+    known_jobs_index: bool = Field(
+        default=True, description="Preload stored job ids to skip known jobs"
+    )
+    known_jobs_max_ids: int = Field(
+        default=200_000,
+        ge=0,
+        description="Max job ids held in memory before per-item queries are used",
+    )
 
     @property
     def connection_string(self) -> str:
@@ -59,6 +86,50 @@ class EmailSettings(BaseSettings):
         default="recipient@example.com", description="Recipient email address"
     )
     use_tls: bool = Field(default=True, description="Use TLS for SMTP")
+    smtp_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Timeout of each SMTP connect, command and reply (seconds)",
+    )
+    smtp_keepalive_interval: float = Field(
+        default=30.0,
+        ge=0,
+        description="Idle time after which a reused SMTP session is checked (seconds)",
+    )
+    smtp_idle_timeout: float = Field(
+        default=300.0,
+        gt=0,
+        description="Idle time after which the SMTP session is closed (seconds)",
+    )
+    max_jobs: int = Field(
+        default=200, ge=1, description="Maximum jobs listed in one spider's email"
+    )
+    digest: bool = Field(
+        default=False,
+        description="Send one email per scheduler cycle instead of one per spider",
+    )
+    digest_max_jobs: int = Field(
+        default=50, ge=1, description="Maximum jobs listed in one digest email"
+    )
+    digest_split: bool = Field(
+        default=True,
+        description="Send jobs beyond the cap as further digest emails",
+    )
+    queue_max_size: int = Field(
+        default=500, ge=1, description="Pending notifications kept on disk"
+    )
+    queue_max_attempts: int = Field(
+        default=8, ge=1, description="Delivery attempts before a notification fails"
+    )
+    queue_retry_backoff: float = Field(
+        default=30.0, gt=0, description="Delay before the first retry (seconds)"
+    )
+    queue_max_backoff: float = Field(
+        default=3600.0, gt=0, description="Longest delay between retries (seconds)"
+    )
+    queue_poll_interval: float = Field(
+        default=5.0, gt=0, description="How often the queue worker checks for mail"
+    )
 
 
 class SchedulerSettings(BaseSettings):
@@ -71,7 +142,63 @@ class SchedulerSettings(BaseSettings):
         default=4, description="Interval between spider runs (hours)"
     )
     timezone: str = Field(default="America/Bogota", description="Scheduler timezone")
+    adaptive: bool = Field(
+        default=False, description="Schedule each spider on its own adaptive interval"
+    )
+    min_interval_hours: float = Field(
+        default=1.0, gt=0, description="Shortest adaptive interval (hours)"
+    )
+    max_interval_hours: float = Field(
+        default=168.0, gt=0, description="Longest adaptive interval (hours)"
+    )
     max_instances: int = Field(default=1, description="Max concurrent spider instances")
+    workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Spider worker processes per cycle (defaults to CPU count)",
+    )
+    cycle_timeout_minutes: int = Field(
+        default=120, ge=1, description="Minutes before a spider worker is terminated"
+    )
+
+
+class DomainPolicy(BaseModel):
+    """Politeness budget for one crawled host."""
+
+    concurrency: int = Field(default=1, ge=1, description="Concurrent requests")
+    min_delay: float = Field(default=1.0, ge=0, description="Lowest delay (seconds)")
+    max_delay: float = Field(
+        default=60.0, ge=0, description="Highest delay after backing off (seconds)"
+    )
+    target_latency: float = Field(
+        default=2.0,
+        gt=0,
+        description="Response time above which the delay grows (seconds)",
+    )
+
+
+# Budgets of the spiders that request all their result pages at once, by the
+# ``budget`` key of their registry entry (see spider_registry.py)
+DOWNLOAD_BUDGETS: dict[str, dict[str, float]] = {
+    # SAP SuccessFactors boards, served by the vendor's CDN (successfactors.py)
+    "successfactors": {
+        "concurrency": 4,
+        "min_delay": 0.25,
+        "max_delay": 30.0,
+        "target_latency": 1.0,
+    },
+    # Paged JSON APIs and result pages of a single company's site
+    "paged_api": {
+        "concurrency": 2,
+        "min_delay": 0.5,
+        "max_delay": 30.0,
+        "target_latency": 1.5,
+    },
+}
+# Built-in budgets by host, taken from the spiders' registry entries
+DEFAULT_DOMAIN_POLICIES: dict[str, dict[str, float]] = {
+    spec.domain: DOWNLOAD_BUDGETS[spec.budget] for spec in SPIDERS if spec.budget
+}
 
 
 class ScrapySettings(BaseSettings):
@@ -84,9 +211,86 @@ class ScrapySettings(BaseSettings):
         default=1, description="Concurrent requests per domain"
     )
     download_delay: float = Field(default=1.0, description="Download delay in seconds")
+    throttle_enabled: bool = Field(
+        default=True, description="Adapt per-domain delays to latency and 429/503"
+    )
+    throttle_max_delay: float = Field(
+        default=60.0, ge=0, description="Highest delay for hosts without a policy"
+    )
+    throttle_target_latency: float = Field(
+        default=2.0, gt=0, description="Target latency for hosts without a policy"
+    )
+    domain_policies: dict[str, DomainPolicy] = Field(
+        default={},
+        validate_default=True,
+        description=("Politeness budgets by host, merged over DEFAULT_DOMAIN_POLICIES"),
+    )
     robotstxt_obey: bool = Field(default=True, description="Obey robots.txt")
     log_level: str = Field(default="INFO", description="Scrapy log level")
 
+    @field_validator("domain_policies", mode="after")
+    @classmethod
+    def merge_default_policies(
+        cls, v: dict[str, DomainPolicy]
+    ) -> dict[str, DomainPolicy]:
+        """Add the built-in host budgets, configured hosts take precedence."""
+        defaults = {
+            host: DomainPolicy(**policy)
+            for host, policy in DEFAULT_DOMAIN_POLICIES.items()
+        }
+        return {**defaults, **v}
+
+
+class BrowserSettings(BaseSettings):
+    """Playwright browser configuration for dynamic spiders."""
+
+    model_config = SettingsConfigDict(env_prefix="BROWSER_")
+
+    type: Literal["chromium", "firefox", "webkit"] = Field(
+        default="firefox", description="Playwright browser type"
+    )
+    headless: bool = Field(default=True, description="Run the browser headless")
+    max_pages_per_context: int = Field(
+        default=4, ge=1, description="Maximum concurrent pages per browser context"
+    )
+    context_max_uses: int = Field(
+        default=50,
+        ge=0,
+        description="Pages opened before a context is recycled (0 disables)",
+    )
+    memory_limit_mb: int = Field(
+        default=1024,
+        ge=0,
+        description="Browser memory that triggers context recycling (0 disables)",
+    )
+    blocked_resource_types: list[str] = Field(
+        default=["image", "media", "font"],
+        description="Playwright resource types aborted before they are sent",
+    )
+    blocked_domains: list[str] = Field(
+        default=[
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "facebook.net",
+            "hotjar.com",
+            "clarity.ms",
+            "linkedin.com",
+            "youtube.com",
+        ],
+        description="Domains (and their subdomains) whose requests are aborted",
+    )
+    ready_timeout_ms: int = Field(
+        default=10000,
+        gt=0,
+        description="Longest wait for a rendered listing to become ready",
+    )
+    ready_stable_ms: int = Field(
+        default=500,
+        ge=0,
+        description="Time the listing count must stay unchanged to be complete",
+    )
+
 
 class AppSettings(BaseSettings):
     """Main application configuration."""
@@ -117,6 +321,7 @@ class AppSettings(BaseSettings):
     email: EmailSettings = Field(default_factory=EmailSettings)
     scheduler: SchedulerSettings = Field(default_factory=SchedulerSettings)
     scrapy: ScrapySettings = Field(default_factory=ScrapySettings)
+    browser: BrowserSettings = Field(default_factory=BrowserSettings)
 
     @field_validator("base_dir", "logs_dir", "data_dir", "cache_dir", mode="before")
     @classmethod
@@ -133,5 +338,6 @@ class AppSettings(BaseSettings):
         logger.debug(f"Configuration initialized: {self.model_dump()}")
 
 
-# Global settings instance
-settings = AppSettings()
+# Global settings, a proxy building the AppSettings instance on first
+# attribute access (use ``settings.resolve()`` for the instance itself)
+settings: Lazy[AppSettings] = Lazy(AppSettings)
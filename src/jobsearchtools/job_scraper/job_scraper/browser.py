@@ -0,0 +1,345 @@
+"""
+Shared Playwright browser for dynamic spiders.
+
+scrapy-playwright starts a Playwright driver and a browser per crawler, so
+every dynamic spider of a scheduler worker paid for its own browser launch.
+``SharedBrowserDownloadHandler`` hands all crawlers of a process the same
+browser from a ``BrowserPool`` while keeping their contexts isolated, and
+recycles contexts after a number of pages or when browser memory grows.
+It also aborts page subresources the spiders never read, such as images,
+fonts and analytics scripts.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import suppress
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright._impl._errors import TargetClosedError
+from playwright.async_api import PlaywrightContextManager
+from scrapy_playwright.handler import (
+    DEFAULT_CONTEXT_NAME,
+    ScrapyPlaywrightDownloadHandler,
+)
+
+from jobsearchtools.config.settings import settings
+from jobsearchtools.job_scraper.job_scraper.readiness import (
+    ReadyResult,
+    record_ready_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+HANDLER = "jobsearchtools.job_scraper.job_scraper.browser.SharedBrowserDownloadHandler"
+
+# Scrapy settings for spiders that render pages with Playwright
+BROWSER_SPIDER_SETTINGS = {
+    "PLAYWRIGHT_BROWSER_TYPE": settings.browser.type,
+    "PLAYWRIGHT_LAUNCH_OPTIONS": {"headless": settings.browser.headless},
+    "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT": settings.browser.max_pages_per_context,
+    "PLAYWRIGHT_CONTEXT_MAX_USES": settings.browser.context_max_uses,
+    "PLAYWRIGHT_MEMORY_LIMIT_MB": settings.browser.memory_limit_mb,
+    "PLAYWRIGHT_BLOCKED_RESOURCE_TYPES": settings.browser.blocked_resource_types,
+    "PLAYWRIGHT_BLOCKED_DOMAINS": settings.browser.blocked_domains,
+    "DOWNLOAD_HANDLERS": {"http": HANDLER, "https": HANDLER},
+    "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
+}
+
+
+def child_processes_rss_bytes() -> int | None:
+    """
+    Return the resident memory of all descendants of this process.
+
+    The Playwright driver and the browser run as child processes, so this
+    is the memory the browser uses. Only supported on Linux.
+
+    Returns:
+        Total RSS in bytes, or None if ``/proc`` is not available.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    children: dict[int, list[int]] = {}
+    rss: dict[int, int] = {}
+    for stat_path in proc.glob("[0-9]*/stat"):
+        try:
+            stat = stat_path.read_text()
+        except OSError:  # Process exited while scanning
+            continue
+        # Fields after the command name: state, ppid, ... rss is the 22nd
+        fields = stat.rsplit(")", 1)[1].split()
+        pid = int(stat_path.parent.name)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss[pid] = int(fields[21]) * page_size
+
+    total = 0
+    pending = list(children.get(os.getpid(), []))
+    while pending:
+        pid = pending.pop()
+        total += rss.get(pid, 0)
+        pending.extend(children.get(pid, []))
+    return total
+
+
+def _domain_suffixes(host: str) -> list[str]:
+    """Return a host and its parent domains, e.g. a.b.com -> a.b.com, b.com."""
+    labels = host.split(".")
+    return [".".join(labels[i:]) for i in range(len(labels) - 1)]
+
+
+class BrowserPool:
+    """
+    Playwright driver and browser shared by all download handlers of a process.
+
+    The browser launches on first use and closes when the last handler
+    using it closes.
+    """
+
+    _pools: dict[tuple[str, str], "BrowserPool"] = {}
+
+    def __init__(self, browser_type_name: str, launch_options: dict):
+        """
+        Initialize the pool.
+
+        Args:
+            browser_type_name: Playwright browser type, e.g. ``firefox``.
+            launch_options: Keyword arguments for ``BrowserType.launch``.
+        """
+        self.browser_type_name = browser_type_name
+        self.launch_options = launch_options
+        self.manager: PlaywrightContextManager | None = None
+        self.playwright = None
+        self.browser = None
+        self.users = 0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def get(cls, browser_type_name: str, launch_options: dict) -> "BrowserPool":
+        """
+        Return the process-wide pool for a browser configuration.
+
+        Args:
+            browser_type_name: Playwright browser type, e.g. ``firefox``.
+            launch_options: Keyword arguments for ``BrowserType.launch``.
+
+        Returns:
+            The shared pool.
+        """
+        key = (browser_type_name, json.dumps(launch_options, sort_keys=True))
+        if key not in cls._pools:
+            cls._pools[key] = cls(browser_type_name, launch_options)
+        return cls._pools[key]
+
+    async def acquire(self):
+        """
+        Register a handler and start the Playwright driver if needed.
+
+        Returns:
+            The Playwright instance.
+        """
+        async with self._lock:
+            if self.playwright is None:
+                self.manager = PlaywrightContextManager()
+                self.playwright = await self.manager.start()
+            self.users += 1
+            return self.playwright
+
+    async def browser_for(self) -> tuple[object, bool]:
+        """
+        Return the shared browser, launching it if needed.
+
+        Returns:
+            Tuple of (browser, whether it was launched by this call).
+        """
+        async with self._lock:
+            if self.browser is not None and self.browser.is_connected():
+                return self.browser, False
+            browser_type = getattr(self.playwright, self.browser_type_name)
+            logger.info(f"Launching shared {self.browser_type_name} browser")
+            self.browser = await browser_type.launch(**self.launch_options)
+            return self.browser, True
+
+    async def release(self) -> None:
+        """Unregister a handler, closing the browser after the last one."""
+        async with self._lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            if self.browser is not None:
+                logger.info(f"Closing shared {self.browser_type_name} browser")
+                with suppress(TargetClosedError):
+                    await self.browser.close()
+                self.browser = None
+            if self.manager is not None:
+                await self.manager.__aexit__()
+            self.manager = None
+            self.playwright = None
+
+
+class SharedBrowserDownloadHandler(ScrapyPlaywrightDownloadHandler):
+    """
+    scrapy-playwright download handler backed by a process-wide browser.
+
+    Each crawler still gets its own browser contexts. A context is closed
+    and recreated once it served ``PLAYWRIGHT_CONTEXT_MAX_USES`` pages, or
+    when the browser processes use more than ``PLAYWRIGHT_MEMORY_LIMIT_MB``,
+    as soon as it has no open pages.
+
+    Unless ``PLAYWRIGHT_ABORT_REQUEST`` is set, subresources whose type is in
+    ``PLAYWRIGHT_BLOCKED_RESOURCE_TYPES`` or whose host is in
+    ``PLAYWRIGHT_BLOCKED_DOMAINS`` are aborted before they are sent.
+    """
+
+    def __init__(self, crawler):
+        """
+        Initialize the handler.
+
+        Args:
+            crawler: Scrapy crawler instance.
+        """
+        super().__init__(crawler)
+        self.pool = BrowserPool.get(
+            self.config.browser_type_name, self.config.launch_options
+        )
+        self.context_max_uses = crawler.settings.getint("PLAYWRIGHT_CONTEXT_MAX_USES")
+        self.memory_limit_bytes = (
+            crawler.settings.getint("PLAYWRIGHT_MEMORY_LIMIT_MB") * 2**20
+        )
+        self.context_uses: dict[str, int] = {}
+
+        self.blocked_resource_types = frozenset(
+            crawler.settings.getlist("PLAYWRIGHT_BLOCKED_RESOURCE_TYPES")
+        )
+        self.blocked_domains = frozenset(
+            domain.lower().lstrip(".")
+            for domain in crawler.settings.getlist("PLAYWRIGHT_BLOCKED_DOMAINS")
+        )
+        if self.abort_request is None and (
+            self.blocked_resource_types or self.blocked_domains
+        ):
+            self.abort_request = self.should_abort
+
+    def should_abort(self, playwright_request) -> bool:
+        """
+        Decide whether a page subresource is aborted, counting blocked ones.
+
+        Navigation requests are never aborted.
+
+        Args:
+            playwright_request: Request the page is about to send.
+
+        Returns:
+            True if the request must be aborted.
+        """
+        if playwright_request.is_navigation_request():
+            return False
+
+        resource_type = playwright_request.resource_type
+        if resource_type in self.blocked_resource_types:
+            self.stats.inc_value("browser_blocking/blocked_count")
+            self.stats.inc_value(f"browser_blocking/blocked/type/{resource_type}")
+            return True
+
+        host = (urlsplit(playwright_request.url).hostname or "").lower()
+        for domain in _domain_suffixes(host):
+            if domain in self.blocked_domains:
+                self.stats.inc_value("browser_blocking/blocked_count")
+                self.stats.inc_value(f"browser_blocking/blocked/domain/{domain}")
+                return True
+
+        self.stats.inc_value("browser_blocking/allowed_count")
+        return False
+
+    async def _launch(self) -> None:
+        """Attach to the shared Playwright driver instead of starting one."""
+        self.playwright = await self.pool.acquire()
+        self.browser_type = getattr(self.playwright, self.config.browser_type_name)
+
+    async def _maybe_launch_browser(self) -> None:
+        """Use the shared browser, launching it only if no crawler did yet."""
+        async with self.browser_launch_lock:
+            if hasattr(self, "browser"):
+                return
+            self.browser, launched = await self.pool.browser_for()
+            if launched:
+                self.stats.inc_value("playwright/browser_count")
+                self.stats.inc_value("browser_pool/launches")
+            else:
+                self.stats.inc_value("browser_pool/hits")
+            self.browser.on("disconnected", self._browser_disconnected_callback)
+
+    async def _create_page(self, request, spider):
+        """Open a page, recycling its context first if it is due."""
+        started = time.perf_counter()
+        context_name = request.meta.get("playwright_context", DEFAULT_CONTEXT_NAME)
+        await self._maybe_recycle_context(context_name)
+
+        page = await super()._create_page(request, spider)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.context_uses[context_name] = self.context_uses.get(context_name, 0) + 1
+        self.stats.inc_value("browser_pool/page_open_count")
+        self.stats.inc_value("browser_pool/page_open_ms_total", elapsed_ms)
+        self.stats.max_value("browser_pool/page_open_ms_max", elapsed_ms)
+        return page
+
+    async def _apply_page_methods(self, page, request, spider) -> None:
+        """Run the request's page methods and record readiness wait times."""
+        await super()._apply_page_methods(page, request, spider)
+        page_methods = request.meta.get("playwright_page_methods") or ()
+        if isinstance(page_methods, dict):
+            page_methods = page_methods.values()
+        for page_method in page_methods:
+            if isinstance(getattr(page_method, "result", None), ReadyResult):
+                record_ready_stats(self.stats, page_method.result)
+
+    async def _maybe_recycle_context(self, context_name: str) -> None:
+        """
+        Close an idle context that reached its page or memory limit.
+
+        The next page then opens in a fresh context.
+
+        Args:
+            context_name: Name of the context the next page opens in.
+        """
+        async with self.context_launch_lock:
+            wrapper = self.context_wrappers.get(context_name)
+            if wrapper is None or wrapper.persistent or wrapper.context.pages:
+                return
+
+            reason = None
+            uses = self.context_uses.get(context_name, 0)
+            if self.context_max_uses and uses >= self.context_max_uses:
+                reason = "max_uses"
+            elif self.memory_limit_bytes:
+                rss = child_processes_rss_bytes()
+                if rss is not None and rss > self.memory_limit_bytes:
+                    reason = "memory"
+            if reason is None:
+                return
+
+            logger.info(
+                f"Recycling browser context '{context_name}' after {uses} pages "
+                f"({reason})"
+            )
+            with suppress(TargetClosedError):
+                await wrapper.context.close()
+            self.context_wrappers.pop(context_name, None)
+            self.context_uses[context_name] = 0
+            self.stats.inc_value(f"browser_pool/context_recycled/{reason}")
+
+    async def _close(self) -> None:
+        """Close this crawler's contexts and release the shared browser."""
+        with suppress(TargetClosedError):
+            await asyncio.gather(
+                *[ctx.context.close() for ctx in self.context_wrappers.values()]
+            )
+        self.context_wrappers.clear()
+        if self.playwright is not None:
+            await self.pool.release()
@@ -0,0 +1,62 @@
+"""
+Local JSON file stores kept under the cache directory.
+
+Used to persist small pieces of crawl state between scheduler runs.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class JsonFileStore:
+    """
+    JSON document stored in a single file.
+
+    Writes go to a temporary file that replaces the original, so a crash
+    mid-write never leaves a truncated store behind.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            path: Location of the JSON file. Parent directories are created
+                on first save.
+        """
+        self.path = Path(path)
+
+    def load(self) -> dict[str, Any]:
+        """
+        Read the stored document.
+
+        Returns:
+            The stored dictionary, or an empty one if missing or unreadable.
+        """
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {self.path}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def save(self, data: dict[str, Any]) -> None:
+        """
+        Replace the stored document.
+
+        Args:
+            data: JSON-serializable dictionary.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
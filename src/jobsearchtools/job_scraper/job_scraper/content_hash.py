@@ -0,0 +1,184 @@
+"""
+Skip listing pages whose jobs did not change since the last run.
+
+Many career sites send neither ``ETag`` nor ``Last-Modified``, so the
+conditional requests of ``httpcache`` cannot help. ``ContentHashMiddleware``
+hashes the listing region of each listing page instead, i.e. the part of
+the page holding the jobs, and drops the response before it reaches the
+spider when the hash matches the previous run's.
+
+Spiders opt in by defining ``listing_region_xpath``, or a
+``listing_region(response)`` method for regions XPath cannot express.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from scrapy import signals
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.http import TextResponse
+
+from jobsearchtools.config.settings import settings
+from jobsearchtools.job_scraper.job_scraper.cache import JsonFileStore
+from jobsearchtools.job_scraper.job_scraper.signals import page_unchanged
+
+logger = logging.getLogger(__name__)
+
+
+def listing_region(spider, response) -> bytes:
+    """
+    Extract the part of a listing page that holds the jobs.
+
+    Args:
+        spider: Spider that parses the page.
+        response: Downloaded listing page.
+
+    Returns:
+        The region as bytes, empty if the spider defines none.
+    """
+    region_method = getattr(spider, "listing_region", None)
+    if region_method is not None:
+        region = region_method(response)
+    else:
+        xpath = getattr(spider, "listing_region_xpath", None)
+        if xpath is None:
+            return b""
+        region = "".join(response.xpath(xpath).getall())
+    return region.encode("utf-8") if isinstance(region, str) else region
+
+
+class ContentHashMiddleware:
+    """
+    Downloader middleware dropping listing pages with unchanged jobs.
+
+    Only responses for the spider's ``parse`` callback are hashed, so
+    detail pages always reach the spider. Skipping a page also skips its
+    pagination and detail requests. Hashes are saved only when the spider
+    finishes without logging an error, such as a failed download or a
+    failed database write, so a run that may have lost jobs never hides
+    them from the next one. Hashes older than ``CONTENT_HASH_MAX_AGE_HOURS``
+    are ignored.
+    """
+
+    def __init__(self, crawler, store_dir: Path, max_age_hours: float):
+        """
+        Initialize the middleware.
+
+        Args:
+            crawler: Scrapy crawler instance.
+            store_dir: Directory holding one hash file per spider.
+            max_age_hours: Age after which a stored hash is ignored.
+        """
+        self.crawler = crawler
+        self.stats = crawler.stats
+        self.store_dir = store_dir
+        self.max_age = timedelta(hours=max_age_hours)
+        self.store: JsonFileStore | None = None
+        self.previous: dict[str, dict] = {}
+        self.current: dict[str, dict] = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        """
+        Factory method called by Scrapy to create the middleware.
+
+        Args:
+            crawler: Scrapy crawler instance.
+
+        Returns:
+            Instance of ContentHashMiddleware.
+        """
+        if not crawler.settings.getbool("CONTENT_HASH_ENABLED"):
+            raise NotConfigured("Content hash short-circuit is disabled")
+
+        mw = cls(
+            crawler,
+            settings.cache_dir / "content_hashes",
+            crawler.settings.getfloat("CONTENT_HASH_MAX_AGE_HOURS"),
+        )
+        crawler.signals.connect(mw.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(mw.spider_closed, signal=signals.spider_closed)
+        return mw
+
+    def spider_opened(self, spider):
+        """
+        Load the hashes of the spider's previous run.
+
+        Args:
+            spider: The spider instance that opened.
+        """
+        self.store = JsonFileStore(self.store_dir / f"{spider.name}.json")
+        oldest = (datetime.now() - self.max_age).isoformat()
+        self.previous = {
+            url: entry
+            for url, entry in self.store.load().items()
+            if isinstance(entry, dict) and entry.get("seen_at", "") >= oldest
+        }
+
+    def spider_closed(self, spider, reason):
+        """
+        Save the hashes seen in this run, if it finished without errors.
+
+        Args:
+            spider: The spider instance that closed.
+            reason: The reason the spider closed.
+        """
+        if self.store is None or reason != "finished":
+            return
+        errors = self.stats.get_value("log_count/ERROR", 0)
+        if errors:
+            logger.info(
+                f"Not saving listing hashes of {spider.name}, "
+                f"the run logged {errors} errors"
+            )
+            return
+        self.store.save({**self.previous, **self.current})
+
+    def process_response(self, request, response, spider=None):
+        """
+        Drop listing pages whose jobs hash to the previous run's value.
+
+        Args:
+            request: The request that was downloaded.
+            response: The downloaded response.
+            spider: The spider that sent the request.
+
+        Returns:
+            The response for the spider callback.
+
+        Raises:
+            IgnoreRequest: If the listing region is unchanged.
+        """
+        spider = self.crawler.spider
+        if (
+            response.status != 200
+            or not isinstance(response, TextResponse)
+            or request.callback not in (None, spider.parse)
+        ):
+            return response
+
+        region = listing_region(spider, response)
+        if not region:
+            return response
+
+        digest = hashlib.sha256(region).hexdigest()
+        previous = self.previous.get(request.url)
+        self.current[request.url] = {
+            # Keep the original timestamp so unchanged pages still expire
+            "seen_at": previous["seen_at"]
+            if previous and previous["hash"] == digest
+            else datetime.now().isoformat(),
+            "hash": digest,
+        }
+        if previous is None or previous["hash"] != digest:
+            self.stats.inc_value("content_hash/changed")
+            return response
+
+        self.stats.inc_value("content_hash/unchanged")
+        logger.debug(f"Listing unchanged, skipping parse: {request.url}")
+        self.crawler.signals.send_catch_log(
+            signal=page_unchanged, request=request, spider=spider
+        )
+        raise IgnoreRequest(f"Listing unchanged: {request.url}")
@@ -7,30 +7,110 @@ to add monitoring, health checks, and notification capabilities.
 
 import logging
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 
+import psycopg2
+from psycopg2.extras import execute_values
 from scrapy import signals
 from scrapy.exceptions import NotConfigured
+from twisted.internet.threads import deferToThread
 
+from jobsearchtools.config.settings import settings
+from jobsearchtools.job_scraper.job_scraper.cache import JsonFileStore
+from jobsearchtools.job_scraper.job_scraper.known_jobs import KnownJobsLookup
+from jobsearchtools.job_scraper.job_scraper.signals import page_unchanged
 from jobsearchtools.notifications.email_notifier import email_notifier
+from jobsearchtools.notifications.queue import (
+    notification_dispatcher,
+    notification_queue,
+)
 
 logger = logging.getLogger(__name__)
 
+# Columns written for every recorded spider run, in row order
+SPIDER_RUN_COLUMNS = (
+    "spider_name",
+    "run_start",
+    "run_end",
+    "status",
+    "items_scraped",
+    "items_saved",
+    "error_message",
+    "duration_seconds",
+    "error_count",
+    "close_reason",
+    "peak_memory_bytes",
+    "known_jobs_skipped",
+)
+
+
+def _database_connector():
+    """
+    Return a factory for new database connections.
 
-class EmailNotificationExtension:
+    Returns:
+        A ``psycopg2.connect`` partial, or None if no database is configured.
+    """
+    if not settings.database.password:
+        return None
+    return partial(
+        psycopg2.connect,
+        host=settings.database.host,
+        port=settings.database.port,
+        dbname=settings.database.name,
+        user=settings.database.user,
+        password=settings.database.password,
+    )
+
+
+def _peak_memory_bytes(stats) -> int | None:
     """
-    Scrapy extension that sends email notifications when new jobs are found.
+    Return the peak memory usage of the crawl process in bytes.
 
-    Connects to spider signals to send notifications after spider completion.
+    Prefers the ``memusage/max`` stat of Scrapy's MemoryUsage extension and
+    falls back to the process resource usage.
+
+    Args:
+        stats: Scrapy stats collector instance.
     """
+    peak = stats.get_value("memusage/max")
+    if peak:
+        return peak
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+    # ru_maxrss is reported in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
 
-    def __init__(self, stats):
+
+class EmailNotificationExtension:
+    """
+    Scrapy extension that queues email notifications when new jobs are found.
+
+    Connects to spider signals to queue a notification after spider
+    completion. Delivery happens outside the crawl: the scheduler process
+    drains the queue in the background, and a standalone crawl drains it
+    in a thread once the engine stopped (``NOTIFICATION_QUEUE_DRAIN_ON_STOP``).
+    In digest mode the scheduler sets ``NOTIFICATION_DIGEST_DIR`` on its
+    workers. New jobs are then written there and the scheduler queues one
+    email per cycle, even for workers that failed after their spider closed.
+    """
+
+    def __init__(self, stats, drain_on_stop=False, digest_dir=None):
         """
         Initialize the extension.
 
         Args:
             stats: Scrapy stats collector instance.
+            drain_on_stop: Deliver queued notifications when the engine stops.
+            digest_dir: Directory collected by the scheduler's cycle digest,
+                or None to queue each spider's notification.
         """
         self.stats = stats
+        self.drain_on_stop = drain_on_stop
+        self.digest_dir = Path(digest_dir) if digest_dir else None
         if not email_notifier.enabled:
             raise NotConfigured("Email notifications are disabled")
 
@@ -45,15 +125,21 @@ class EmailNotificationExtension:
         Returns:
             Instance of EmailNotificationExtension.
         """
-        ext = cls(crawler.stats)
+        ext = cls(
+            crawler.stats,
+            crawler.settings.getbool("NOTIFICATION_QUEUE_DRAIN_ON_STOP"),
+            crawler.settings.get("NOTIFICATION_DIGEST_DIR"),
+        )
         crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(ext.engine_stopped, signal=signals.engine_stopped)
         return ext
 
     def spider_closed(self, spider, reason):
         """
         Called when a spider is closed.
 
-        Sends email notification if new jobs were found.
+        Queues an email notification if new jobs were found, or leaves
+        them to the scheduler's cycle digest.
 
         Args:
             spider: The spider instance that closed.
@@ -68,12 +154,35 @@ class EmailNotificationExtension:
             f"Total found: {total_found}, New jobs: {new_jobs_count}"
         )
 
-        if new_jobs:
-            success = email_notifier.send_new_jobs_notification(new_jobs, spider.name)
-            if success:
-                logger.info(f"Email notification sent for {new_jobs_count} new jobs")
-            else:
-                logger.warning("Failed to send email notification")
+        if not new_jobs:
+            return
+        payload = {"jobs": [dict(job) for job in new_jobs], "spider_name": spider.name}
+        if self.digest_dir:
+            JsonFileStore(self.digest_dir / f"{spider.name}.json").save(payload)
+            logger.info(f"{new_jobs_count} new jobs left for the cycle digest")
+        else:
+            notification_queue.put("new_jobs", payload)
+            self.stats.inc_value("notifications/queued")
+            logger.info(f"Email notification queued for {new_jobs_count} new jobs")
+
+    def engine_stopped(self):
+        """
+        Called when the engine stopped.
+
+        Delivers queued notifications in a thread if enabled. Failed ones
+        stay queued for the next dispatcher.
+
+        Returns:
+            Deferred firing once delivery finished, or None.
+        """
+        if self.drain_on_stop:
+            return deferToThread(self._drain_queue)
+        return None
+
+    def _drain_queue(self):
+        """Deliver due notifications, then close the SMTP session."""
+        notification_dispatcher.dispatch_pending()
+        email_notifier.close()
 
 
 class SpiderHealthMonitorExtension:
@@ -81,8 +190,15 @@ class SpiderHealthMonitorExtension:
     Scrapy extension that monitors spider health and performance.
 
     Tracks spider runs, success rates, and item counts for validation.
+    Every run is recorded in the ``spider_runs`` table. Rows are buffered
+    while other spiders of the same process are still running and written
+    in one statement when the last one closes.
     """
 
+    # Shared by every crawler of the process, e.g. a scheduler worker
+    _pending_runs: list[tuple] = []
+    _open_spiders = 0
+
     def __init__(self, stats):
         """
         Initialize the health monitor.
@@ -109,6 +225,7 @@ class SpiderHealthMonitorExtension:
         crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
         crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
         crawler.signals.connect(ext.item_scraped, signal=signals.item_scraped)
+        crawler.signals.connect(ext.page_unchanged, signal=page_unchanged)
         return ext
 
     def spider_opened(self, spider):
@@ -120,6 +237,7 @@ class SpiderHealthMonitorExtension:
         """
         self.start_time = datetime.now()
         self.spider_name = spider.name
+        SpiderHealthMonitorExtension._open_spiders += 1
         logger.info(f"Spider {spider.name} started at {self.start_time}")
 
     def spider_closed(self, spider, reason):
@@ -140,6 +258,8 @@ class SpiderHealthMonitorExtension:
         items_scraped = self.stats.get_value("item_scraped_count", 0)
         items_saved = self.stats.get_value("new_jobs_count", 0)
         errors = self.stats.get_value("log_count/ERROR", 0)
+        pages_unchanged = self.stats.get_value("pages_unchanged_count", 0)
+        known_skipped = self.stats.get_value("known_jobs/requests_saved", 0)
 
         logger.info(
             f"Spider {spider.name} finished:\n"
@@ -147,11 +267,19 @@ class SpiderHealthMonitorExtension:
             f"  Items scraped: {items_scraped}\n"
             f"  Items saved: {items_saved}\n"
             f"  Errors: {errors}\n"
+            f"  Pages unchanged: {pages_unchanged}\n"
+            f"  Known jobs skipped: {known_skipped}\n"
             f"  Reason: {reason}"
         )
 
-        # Health check validation
-        if reason == "finished" and items_scraped == 0:
+        # Health check validation, unchanged pages and known jobs yield no
+        # items by design
+        if (
+            reason == "finished"
+            and items_scraped == 0
+            and pages_unchanged == 0
+            and known_skipped == 0
+        ):
             logger.warning(
                 f"Health check warning: Spider {spider.name} "
                 f"finished but scraped 0 items. "
@@ -164,6 +292,92 @@ class SpiderHealthMonitorExtension:
                 f"encountered {errors} errors"
             )
 
+        self._record_run(
+            spider,
+            reason,
+            end_time,
+            duration,
+            items_scraped,
+            items_saved,
+            errors,
+            known_skipped,
+        )
+
+    def _record_run(
+        self,
+        spider,
+        reason: str,
+        end_time: datetime,
+        duration: float,
+        items_scraped: int,
+        items_saved: int,
+        errors: int,
+        known_skipped: int,
+    ) -> None:
+        """
+        Buffer the run record and write all buffered runs once idle.
+
+        Args:
+            spider: The spider instance that closed.
+            reason: The reason the spider closed.
+            end_time: When the spider closed.
+            duration: Run duration in seconds.
+            items_scraped: Number of items scraped.
+            items_saved: Number of new jobs stored.
+            errors: Number of errors logged.
+            known_skipped: Listings skipped because their job is stored.
+        """
+        cls = SpiderHealthMonitorExtension
+        cls._pending_runs.append(
+            (
+                spider.name,
+                self.start_time or end_time,
+                end_time,
+                "completed" if reason == "finished" else "failed",
+                items_scraped,
+                items_saved,
+                None if reason == "finished" else f"Closed with reason: {reason}",
+                duration,
+                errors,
+                reason,
+                _peak_memory_bytes(self.stats),
+                known_skipped,
+            )
+        )
+        cls._open_spiders = max(0, cls._open_spiders - 1)
+        if cls._open_spiders == 0:
+            cls.flush_runs()
+
+    @classmethod
+    def flush_runs(cls) -> None:
+        """Insert all buffered run records in a single statement."""
+        rows, cls._pending_runs = cls._pending_runs, []
+        if not rows:
+            return
+
+        connect = _database_connector()
+        if connect is None:
+            logger.debug("Database not configured, skipping spider run records")
+            return
+
+        conn = None
+        try:
+            conn = connect()
+            with conn.cursor() as cursor:
+                columns = ", ".join(SPIDER_RUN_COLUMNS)
+                execute_values(
+                    cursor,
+                    f"INSERT INTO spider_runs ({columns}) VALUES %s",  # noqa: S608
+                    rows,
+                )
+            conn.commit()
+            logger.info(f"Recorded {len(rows)} spider run(s) in spider_runs")
+        except Exception as e:
+            logger.error(f"Failed to record spider runs: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+
     def item_scraped(self, item, spider):
         """
         Called when an item is scraped.
@@ -174,3 +388,98 @@ class SpiderHealthMonitorExtension:
         """
         # Could add item validation logic here if needed
         pass
+
+    def page_unchanged(self, request, spider):
+        """
+        Called when a page did not change since the last run and was not parsed.
+
+        Args:
+            request: The request of the unchanged page.
+            spider: The spider instance.
+        """
+        self.stats.inc_value("pages_unchanged_count")
+
+
+class KnownJobsExtension:
+    """
+    Scrapy extension that attaches a known-jobs lookup to each spider.
+
+    Spiders query ``spider.known_jobs`` before following detail pages so
+    jobs already stored are not downloaded again, except on the day each
+    one is due for a content refresh.
+    """
+
+    def __init__(self, stats, ttl_hours: float, refresh_days: int = 0):
+        """
+        Initialize the extension.
+
+        Args:
+            stats: Scrapy stats collector instance.
+            ttl_hours: Maximum age of a spider's known jobs cache file.
+            refresh_days: Days between detail downloads of a known job,
+                0 to never download them again.
+        """
+        self.stats = stats
+        self.ttl_hours = ttl_hours
+        self.refresh_days = refresh_days
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        """
+        Factory method called by Scrapy to create the extension.
+
+        Args:
+            crawler: Scrapy crawler instance.
+
+        Returns:
+            Instance of KnownJobsExtension.
+        """
+        if not crawler.settings.getbool("KNOWN_JOBS_ENABLED"):
+            raise NotConfigured("Known jobs lookup is disabled")
+
+        ext = cls(
+            crawler.stats,
+            crawler.settings.getfloat("KNOWN_JOBS_CACHE_TTL_HOURS"),
+            crawler.settings.getint("KNOWN_JOBS_REFRESH_DAYS"),
+        )
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        """
+        Called when a spider opens. Attaches the known jobs lookup.
+
+        Args:
+            spider: The spider instance that opened.
+        """
+        connect = _database_connector()
+        if connect is None:
+            logger.info("Database not configured, known jobs lookup uses cache only")
+
+        store = JsonFileStore(settings.cache_dir / "known_jobs" / f"{spider.name}.json")
+        spider.known_jobs = KnownJobsLookup(
+            store, self.ttl_hours, connect, refresh_days=self.refresh_days
+        )
+
+    def spider_closed(self, spider, reason):
+        """
+        Called when a spider closes. Saves newly stored jobs to the cache.
+
+        Args:
+            spider: The spider instance that closed.
+            reason: The reason the spider closed.
+        """
+        lookup = getattr(spider, "known_jobs", None)
+        if lookup is None:
+            return
+
+        new_jobs = self.stats.get_value("new_jobs", [])
+        lookup.remember(job.get("job_id") for job in new_jobs)
+        lookup.close()
+
+        requests_saved = self.stats.get_value("known_jobs/requests_saved", 0)
+        logger.info(
+            f"Spider {spider.name} skipped {requests_saved} detail requests "
+            "for known jobs"
+        )
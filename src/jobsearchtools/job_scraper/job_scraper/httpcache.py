@@ -0,0 +1,114 @@
+"""
+Conditional requests for listing pages.
+
+Most career pages change a few times a week while the scheduler fetches
+them several times a day. Scrapy's HTTP cache stores each page with its
+``ETag`` and ``Last-Modified`` validators. ``ConditionalRequestPolicy``
+makes every later fetch a conditional request (``If-None-Match`` /
+``If-Modified-Since``). ``ConditionalCacheMiddleware`` drops pages that
+answer 304 Not Modified instead of parsing the cached copy again, and
+sends the ``page_unchanged`` signal so extensions can tell an unchanged
+page from a failed one.
+"""
+
+import logging
+
+from scrapy.downloadermiddlewares.httpcache import HttpCacheMiddleware
+from scrapy.exceptions import IgnoreRequest
+from scrapy.extensions.httpcache import RFC2616Policy
+
+from jobsearchtools.job_scraper.job_scraper.signals import page_unchanged
+
+logger = logging.getLogger(__name__)
+
+
+def is_listing_request(request) -> bool:
+    """
+    Return whether a request fetches a listing page.
+
+    Args:
+        request: Scrapy request.
+
+    Returns:
+        The ``conditional_cache`` meta flag if set, otherwise whether the
+        request is handled by the spider's default ``parse`` callback.
+    """
+    flag = request.meta.get("conditional_cache")
+    if flag is not None:
+        return bool(flag)
+    return request.callback is None or (
+        getattr(request.callback, "__name__", None) == "parse"
+    )
+
+
+class ConditionalRequestPolicy(RFC2616Policy):
+    """
+    Cache policy that always revalidates stored listing pages.
+
+    Only listing pages are cached: requests handled by the spider's
+    ``parse`` (start requests included), or flagged with
+    ``meta["conditional_cache"]``. A detail page carries its partly built
+    item in ``cb_kwargs``, which a 304 would drop, so those are always
+    downloaded. Only GET pages fetched without a browser and carrying a
+    validator are stored, since others could never be revalidated. Stored
+    pages are never served without asking the server, so a changed page
+    is always parsed in full.
+    """
+
+    def should_cache_request(self, request) -> bool:
+        """Cache plain GET listing requests, Playwright pages are rendered live."""
+        return (
+            request.method == "GET"
+            and not request.meta.get("playwright")
+            and is_listing_request(request)
+            and super().should_cache_request(request)
+        )
+
+    def should_cache_response(self, response, request) -> bool:
+        """Store successful pages that the server can validate."""
+        return response.status == 200 and (
+            b"ETag" in response.headers or b"Last-Modified" in response.headers
+        )
+
+    def is_cached_response_fresh(self, cachedresponse, request) -> bool:
+        """Never reuse a stored page, ask the server with its validators."""
+        self._set_conditional_validators(request, cachedresponse)
+        return False
+
+
+class ConditionalCacheMiddleware(HttpCacheMiddleware):
+    """
+    HTTP cache middleware that skips pages answering 304 Not Modified.
+
+    The stored copy is refreshed as usual, then the request is dropped
+    before it reaches the spider callback and ``page_unchanged`` is sent.
+    Entries older than ``HTTPCACHE_EXPIRATION_SECS`` are discarded, which
+    forces a full download and parse of every page now and then.
+    """
+
+    def process_response(self, request, response, spider=None):
+        """
+        Drop revalidated pages, pass everything else through the cache.
+
+        Args:
+            request: The request that was downloaded.
+            response: The downloaded response.
+            spider: The spider that sent the request.
+
+        Returns:
+            The response for the spider callback.
+
+        Raises:
+            IgnoreRequest: If the server reported the page as unchanged.
+        """
+        not_modified = response.status == 304 and "cached_response" in request.meta
+        response = super().process_response(request, response)
+        if not not_modified:
+            return response
+
+        self.stats.inc_value("httpcache/unchanged")
+        logger.debug(f"Page not modified, skipping parse: {request.url}")
+        self.crawler.signals.send_catch_log(
+            signal=page_unchanged, request=request, spider=self.crawler.spider
+        )
+        raise IgnoreRequest(f"Page not modified: {request.url}")
@@ -17,3 +17,5 @@ class JobScraperItem(scrapy.Item):
     date_posted = scrapy.Field()
     date_extracted = scrapy.Field()
     was_opened = scrapy.Field()
+    # Set when the detail page failed, the item then lacks its detail fields
+    detail_failed = scrapy.Field()
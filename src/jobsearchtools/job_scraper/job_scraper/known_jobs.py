@@ -0,0 +1,298 @@
+"""
+Lookups of job ids that are already stored in PostgreSQL.
+
+Lets the pipeline drop unchanged jobs before doing any database work,
+and lets spiders skip detail-page requests for jobs already stored.
+"""
+
+import logging
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from jobsearchtools.job_scraper.job_scraper.cache import JsonFileStore
+
+logger = logging.getLogger(__name__)
+
+
+class JobIdIndex:
+    """
+    In-memory map of stored job ids to content fingerprints for one spider.
+
+    Tracks hit/miss counters so the pipeline can report how many database
+    round trips the index saved.
+    """
+
+    def __init__(self, fingerprints: Iterable[tuple[str, str | None]] = ()):
+        """
+        Initialize the index.
+
+        Args:
+            fingerprints: ``(job_id, fingerprint)`` pairs stored in the
+                database. Rows stored before fingerprints existed have None.
+        """
+        self._fingerprints = dict(fingerprints)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._fingerprints
+
+    def unchanged(self, job_id: str, fingerprint: str) -> bool:
+        """
+        Check a job against the index, counting the lookup as a hit or miss.
+
+        Args:
+            job_id: Job id of a scraped item.
+            fingerprint: Content fingerprint of the item.
+
+        Returns:
+            True if the job is stored with the same fingerprint.
+        """
+        if self._fingerprints.get(job_id) == fingerprint:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def record(self, job_id: str, fingerprint: str) -> None:
+        """
+        Record the fingerprint of a job once it has been written.
+
+        Args:
+            job_id: Job id of the stored row.
+            fingerprint: Content fingerprint of the stored row.
+        """
+        self._fingerprints[job_id] = fingerprint
+
+    @classmethod
+    def load(cls, cursor, prefix: str, max_ids: int) -> "JobIdIndex | None":
+        """
+        Load the stored jobs whose id starts with a spider's prefix.
+
+        Args:
+            cursor: Open database cursor.
+            prefix: Job id prefix of the spider (e.g. ``avianca_``).
+            max_ids: Maximum number of ids to keep in memory.
+
+        Returns:
+            The loaded index, or None if more than ``max_ids`` ids are stored.
+        """
+        # Escape LIKE wildcards, "_" is part of every prefix
+        pattern = (
+            prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        )
+        cursor.execute(
+            "SELECT job_id, fingerprint FROM jobs WHERE job_id LIKE %s LIMIT %s",
+            (pattern, max_ids + 1),
+        )
+        rows = cursor.fetchall()
+        if len(rows) > max_ids:
+            logger.info(
+                f"More than {max_ids} stored jobs match '{prefix}', "
+                "falling back to per-item duplicate checks"
+            )
+            return None
+        return cls((row[0], row[1]) for row in rows)
+
+
+class KnownJobsLookup:
+    """
+    Lookup spiders use to skip detail requests for jobs already stored.
+
+    Job ids confirmed by the database are kept in a local cache file, so
+    later runs answer most lookups without a query. The cache is rebuilt
+    from the database once it is older than its TTL, so ids removed from
+    the database are eventually forgotten.
+
+    Skipped jobs could never show a content change, so with
+    ``refresh_days`` each known job is reported as unknown one day out of
+    every ``refresh_days``. Jobs are spread over the days by a hash of
+    their id, so every run refreshes a similar share.
+    """
+
+    def __init__(
+        self,
+        store: JsonFileStore,
+        ttl_hours: float,
+        connect: Callable[[], Any] | None = None,
+        refresh_days: int = 0,
+    ):
+        """
+        Initialize the lookup.
+
+        Args:
+            store: Cache file holding the spider's known job ids.
+            ttl_hours: Maximum age of the cache file before it is ignored.
+            connect: Factory returning a database connection, or None to
+                answer from the cache file only.
+            refresh_days: Days between refreshes of a known job, 0 to
+                never refresh them.
+        """
+        self.store = store
+        self.refresh_days = refresh_days
+        self._connect = connect
+        self._conn = None
+        self._created_at = datetime.now(UTC)
+        self._known: set[str] = set()
+        self._dirty = False
+        self._load_cache(ttl_hours)
+
+    def _load_cache(self, ttl_hours: float) -> None:
+        """Load cached job ids unless the cache has expired."""
+        data = self.store.load()
+        try:
+            created_at = datetime.fromisoformat(data["created_at"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if self._created_at - created_at > timedelta(hours=ttl_hours):
+            logger.info(f"Known jobs cache {self.store.path} expired, rebuilding it")
+            return
+        self._created_at = created_at
+        self._known = set(data.get("job_ids", []))
+
+    def filter_known(self, job_ids: Iterable[str]) -> set[str]:
+        """
+        Return the subset of job ids that are stored and can be skipped.
+
+        Ids missing from the cache are checked with a single query. Stored
+        jobs due for a refresh today are left out.
+
+        Args:
+            job_ids: Job ids found on a listing page.
+
+        Returns:
+            Set of job ids already stored and not due for a refresh.
+        """
+        known = self._stored(job_ids)
+        if not self.refresh_days:
+            return known
+        today = date.today().toordinal()
+        return {job_id for job_id in known if not self.refresh_due(job_id, today)}
+
+    def refresh_due(self, job_id: str, day: int) -> bool:
+        """
+        Return whether a known job is downloaded again on a given day.
+
+        Args:
+            job_id: Job id.
+            day: Proleptic Gregorian ordinal of the day.
+
+        Returns:
+            True on one day out of every ``refresh_days`` for each job.
+        """
+        bucket = zlib.crc32(job_id.encode("utf-8")) % self.refresh_days
+        return bucket == day % self.refresh_days
+
+    def _stored(self, job_ids: Iterable[str]) -> set[str]:
+        """Return the job ids found in the cache or the database."""
+        candidates = {job_id for job_id in job_ids if job_id}
+        known = candidates & self._known
+        unknown = candidates - known
+        if not unknown or self._connect is None:
+            return known
+
+        try:
+            if self._conn is None or self._conn.closed:
+                self._conn = self._connect()
+            with self._conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT job_id FROM jobs WHERE job_id = ANY(%s)",
+                    (list(unknown),),
+                )
+                found = {row[0] for row in cursor.fetchall()}
+            self._conn.rollback()
+        except Exception as e:
+            logger.error(f"Known jobs lookup failed: {e}")
+            return known
+
+        self.remember(found)
+        return known | found
+
+    def remember(self, job_ids: Iterable[str]) -> None:
+        """
+        Record job ids as stored.
+
+        Args:
+            job_ids: Job ids known to be in the database.
+        """
+        new_ids = {job_id for job_id in job_ids if job_id} - self._known
+        if new_ids:
+            self._known |= new_ids
+            self._dirty = True
+
+    def close(self) -> None:
+        """Persist the cache file if it changed and close the connection."""
+        if self._dirty:
+            try:
+                self.store.save(
+                    {
+                        "created_at": self._created_at.isoformat(),
+                        "job_ids": sorted(self._known),
+                    }
+                )
+            except OSError as e:
+                logger.error(f"Failed to write known jobs cache: {e}")
+            self._dirty = False
+        if self._conn is not None and not self._conn.closed:
+            self._conn.close()
+
+
+def known_job_ids(spider, job_ids: Iterable[str]) -> set[str]:
+    """
+    Return the job ids a spider can skip, via its attached lookup.
+
+    Args:
+        spider: Spider instance, with a ``known_jobs`` lookup if enabled.
+        job_ids: Job ids found on a listing page.
+
+    Returns:
+        Set of job ids already stored, empty if no lookup is attached.
+    """
+    lookup = getattr(spider, "known_jobs", None)
+    if lookup is None:
+        return set()
+    return lookup.filter_known(job_ids)
+
+
+def follow_listings(spider, response, listings, callback, **kwargs) -> Iterator:
+    """
+    Follow detail pages for new listings and skip the ones already stored.
+
+    A known listing is not yielded without its detail page: missing the
+    detail fields, it would look like a content change to the pipeline.
+    Known jobs due for a refresh are followed like new ones (see
+    ``KnownJobsLookup``), and listings without a detail page are always
+    yielded.
+
+    Args:
+        spider: Spider instance.
+        response: Listing page response.
+        listings: ``(item, detail_url)`` pairs found on the page.
+        callback: Detail page callback, called with an ``item`` keyword.
+        **kwargs: Extra arguments for ``response.follow`` (e.g. errback).
+
+    Yields:
+        Detail page requests for new jobs, items for listings without one.
+    """
+    known = known_job_ids(spider, (item.get("job_id") for item, _ in listings))
+    for item, detail_url in listings:
+        if detail_url and item.get("job_id") not in known:
+            yield response.follow(
+                detail_url,
+                callback=callback,
+                cb_kwargs={"item": item},
+                meta={"item": item},
+                **kwargs,
+            )
+            continue
+
+        if detail_url:
+            # Already stored, skipped without a download
+            spider.crawler.stats.inc_value("known_jobs/requests_saved")
+            continue
+        yield item
@@ -0,0 +1,27 @@
+-- Migration: Add run metrics to spider_runs
+-- Description: Stores per-run performance data written by SpiderHealthMonitorExtension
+
+-- Created by PostgreSQLPipeline on first use, created here as well so the
+-- migration applies to an empty database
+CREATE TABLE IF NOT EXISTS spider_runs (
+    id SERIAL PRIMARY KEY,
+    spider_name VARCHAR(255) NOT NULL,
+    run_start TIMESTAMP NOT NULL,
+    run_end TIMESTAMP,
+    status VARCHAR(50) NOT NULL,
+    items_scraped INTEGER DEFAULT 0,
+    items_saved INTEGER DEFAULT 0,
+    error_message TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE spider_runs
+    ADD COLUMN IF NOT EXISTS duration_seconds REAL,
+    ADD COLUMN IF NOT EXISTS error_count INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS close_reason VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS peak_memory_bytes BIGINT,
+    ADD COLUMN IF NOT EXISTS known_jobs_skipped INTEGER DEFAULT 0;
+
+-- Add comments
+COMMENT ON COLUMN spider_runs.peak_memory_bytes IS 'Peak memory of the crawl process during the run';
+COMMENT ON COLUMN spider_runs.known_jobs_skipped IS 'Listings skipped without a detail request because their job is stored';
@@ -0,0 +1,73 @@
+-- Migration: Add content fingerprints and job history
+-- Description: Lets PostgreSQLPipeline upsert only changed jobs and keep their previous versions
+
+-- Created by PostgreSQLPipeline on first use, created here as well so the
+-- migration applies to an empty database
+CREATE TABLE IF NOT EXISTS jobs (
+    id SERIAL PRIMARY KEY,
+    job_id VARCHAR(255) UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    company VARCHAR(255) NOT NULL,
+    location VARCHAR(255),
+    description TEXT,
+    salary VARCHAR(255),
+    url TEXT NOT NULL,
+    date_posted TIMESTAMP,
+    date_extracted TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    was_opened BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE jobs
+    ADD COLUMN IF NOT EXISTS fingerprint CHAR(64);
+
+CREATE TABLE IF NOT EXISTS job_versions (
+    id BIGSERIAL PRIMARY KEY,
+    job_id VARCHAR(255) NOT NULL,
+    fingerprint CHAR(64) NOT NULL,
+    title TEXT,
+    company VARCHAR(255),
+    location VARCHAR(255),
+    description TEXT,
+    salary VARCHAR(255),
+    url TEXT,
+    date_posted TIMESTAMP,
+    valid_from TIMESTAMP NOT NULL,
+    valid_until TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create index for history lookups of one job
+CREATE INDEX IF NOT EXISTS idx_job_versions_job_id
+ON job_versions(job_id, valid_until DESC);
+
+-- Archive the previous row whenever a job's content changes
+CREATE OR REPLACE FUNCTION record_job_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO job_versions (
+        job_id, fingerprint, title, company, location,
+        description, salary, url, date_posted,
+        valid_from, valid_until
+    )
+    VALUES (
+        OLD.job_id, OLD.fingerprint, OLD.title, OLD.company,
+        OLD.location, OLD.description, OLD.salary, OLD.url,
+        OLD.date_posted, OLD.updated_at, NEW.updated_at
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Rows without a fingerprint predate it, their first upsert is a backfill
+CREATE OR REPLACE TRIGGER jobs_record_version
+AFTER UPDATE OF fingerprint ON jobs
+FOR EACH ROW
+WHEN (
+    OLD.fingerprint IS NOT NULL
+    AND OLD.fingerprint IS DISTINCT FROM NEW.fingerprint
+)
+EXECUTE FUNCTION record_job_version();
+
+-- Add comments
+COMMENT ON COLUMN jobs.fingerprint IS 'SHA-256 of the normalized content fields, set by the scraper pipeline';
+COMMENT ON TABLE job_versions IS 'Previous versions of jobs whose content changed on the site';
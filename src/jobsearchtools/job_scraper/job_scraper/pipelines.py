@@ -4,7 +4,11 @@
 # See: https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 
 
+import csv
+import hashlib
+import io
 import logging
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import datetime
@@ -12,25 +16,117 @@ from typing import Any
 
 import psycopg2
 import psycopg2.pool
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from scrapy import Spider
 from scrapy.exceptions import NotConfigured
 
 from jobsearchtools.config.settings import settings
+from jobsearchtools.job_scraper.job_scraper.known_jobs import JobIdIndex
 
 logger = logging.getLogger(__name__)
 
+JOB_COLUMNS = (
+    "job_id",
+    "title",
+    "company",
+    "location",
+    "description",
+    "salary",
+    "url",
+    "date_posted",
+    "date_extracted",
+    "was_opened",
+    "fingerprint",
+)
+
+# Advisory lock serializing schema changes of concurrent scheduler workers
+SCHEMA_LOCK_ID = 0x6A6F6273  # "jobs"
+
+# Columns added after their table was first released, by table. Rows stored
+# before get their values on the next write.
+ADDED_COLUMNS = {
+    "jobs": {"fingerprint": "CHAR(64)"},
+    "spider_runs": {
+        "duration_seconds": "REAL",
+        "error_count": "INTEGER DEFAULT 0",
+        "close_reason": "VARCHAR(100)",
+        "peak_memory_bytes": "BIGINT",
+        "known_jobs_skipped": "INTEGER DEFAULT 0",
+    },
+    "jobs_staging": {"fingerprint": "CHAR(64)"},
+}
+
+# Indexes of the schema, mapped to their table and column list
+INDEXES = {
+    "idx_jobs_job_id": ("jobs", "(job_id)"),
+    "idx_jobs_company": ("jobs", "(company)"),
+    "idx_jobs_date_extracted": ("jobs", "(date_extracted DESC)"),
+    "idx_job_versions_job_id": ("job_versions", "(job_id, valid_until DESC)"),
+    "idx_spider_runs_spider_name": ("spider_runs", "(spider_name)"),
+    "idx_spider_runs_run_start": ("spider_runs", "(run_start DESC)"),
+    "idx_jobs_staging_spider_name": ("jobs_staging", "(spider_name)"),
+}
+
+# Fields whose changes on the site create a new version of a job
+FINGERPRINT_FIELDS = (
+    "title",
+    "company",
+    "location",
+    "description",
+    "salary",
+    "url",
+    "date_posted",
+)
+
+# Upsert clause shared by every write mode. Unchanged jobs are skipped by the
+# WHERE clause, so they cost no write, and ``xmax = 0`` is only true for rows
+# the statement inserted rather than updated.
+UPSERT_CLAUSE = f"""
+    ON CONFLICT (job_id) DO UPDATE SET
+        {", ".join(f"{field} = EXCLUDED.{field}" for field in FINGERPRINT_FIELDS)},
+        fingerprint = EXCLUDED.fingerprint,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE jobs.fingerprint IS DISTINCT FROM EXCLUDED.fingerprint
+"""
+
+
+def job_fingerprint(values: dict[str, Any]) -> str:
+    """
+    Hash the content fields of a job.
+
+    Whitespace is collapsed and missing fields hash like empty ones, so
+    only changes a reader would notice produce a new fingerprint.
+
+    Args:
+        values: Job fields, with dates already parsed.
+
+    Returns:
+        Hex SHA-256 digest of the normalized fields.
+    """
+    parts = []
+    for field in FINGERPRINT_FIELDS:
+        value = values.get(field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        parts.append("" if value is None else " ".join(str(value).split()))
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
 
 class PostgreSQLPipeline:
     """
-    PostgreSQL pipeline with connection pooling and duplicate detection.
+    PostgreSQL pipeline with connection pooling and content-change detection.
 
     Features:
     - Connection pooling for efficient database access
-    - Automatic duplicate detection by job_id
+    - Upserts by job_id, writing only jobs whose content fingerprint changed
+    - Previous versions of changed jobs kept in ``job_versions``
     - Tracks new job insertions for notifications
     - Robust error handling with rollback
     - Schema auto-creation with indexes
+    - Optional batched write-behind mode (``DB_WRITE_MODE=batch``)
+    - Optional COPY bulk ingest through a staging table (``DB_WRITE_MODE=copy``)
+    - Preloaded fingerprint index that drops unchanged jobs without a query
+    - Stored jobs kept as they are when their detail page failed
     """
 
     def __init__(self):
@@ -54,6 +150,15 @@ class PostgreSQLPipeline:
             logger.info("PostgreSQL connection pool created successfully")
             self.new_jobs_count = 0
             self.new_jobs = []  # Store new jobs for email notification
+            self.updated_jobs_count = 0
+            self.write_mode = settings.database.write_mode
+            self.batch_size = settings.database.batch_size
+            self.batch_flush_seconds = settings.database.batch_flush_seconds
+            self._buffer: dict[str, tuple[dict[str, Any], tuple]] = {}
+            self._last_flush = time.monotonic()
+            self._copy_buffer = io.StringIO()
+            self._copy_rows = 0
+            self.job_index: JobIdIndex | None = None
         except Exception as e:
             logger.error(f"Failed to create PostgreSQL connection pool: {e}")
             raise NotConfigured(f"PostgreSQL connection failed: {e}") from e
@@ -82,11 +187,94 @@ class PostgreSQLPipeline:
         logger.info(f"Opening PostgreSQL pipeline for spider: {spider.name}")
         self.new_jobs_count = 0
         self.new_jobs = []
+        self.updated_jobs_count = 0
+        self._buffer = {}
+        self._last_flush = time.monotonic()
+        self._copy_buffer = io.StringIO()
+        self._copy_rows = 0
         self._create_schema()
+        if self.write_mode == "copy":
+            self._clear_staging(spider)
+        self.job_index = self._load_job_index(spider)
+
+    def _clear_staging(self, spider: Spider) -> None:
+        """
+        Delete staged rows that a crashed run of the spider left behind.
+
+        They were never merged, and the merge keeps the first staged row of
+        each job, so stale rows would win over this run's data.
+
+        Args:
+            spider: The spider instance.
+        """
+        with self.get_connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "DELETE FROM jobs_staging WHERE spider_name = %s",
+                        (spider.name,),
+                    )
+                    deleted = cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        if deleted:
+            logger.warning(
+                f"Discarded {deleted} staged rows left by an earlier "
+                f"run of {spider.name}"
+            )
+
+    def _load_job_index(self, spider: Spider) -> JobIdIndex | None:
+        """
+        Preload the stored fingerprints for the spider's job_id prefix.
+
+        Spiders whose ids carry no common prefix set ``job_id_prefix = None``
+        and keep using the per-item duplicate query.
+
+        Args:
+            spider: The spider instance.
+
+        Returns:
+            The loaded index, or None if disabled, too large or unavailable.
+        """
+        prefix = getattr(spider, "job_id_prefix", f"{spider.name}_")
+        if not settings.database.known_jobs_index or not prefix:
+            return None
+
+        try:
+            with self.get_connection() as conn:
+                try:
+                    with conn.cursor() as cursor:
+                        index = JobIdIndex.load(
+                            cursor, prefix, settings.database.known_jobs_max_ids
+                        )
+                finally:
+                    conn.rollback()
+        except Exception as e:
+            logger.error(f"Failed to preload job_id index for {spider.name}: {e}")
+            return None
+
+        if index is not None:
+            logger.info(f"Preloaded {len(index)} known job ids for {spider.name}")
+            if hasattr(spider, "crawler") and spider.crawler.stats:
+                spider.crawler.stats.set_value("known_jobs/index_size", len(index))
+        return index
 
     def _create_schema(self) -> None:
-        """Create database schema with tables and indexes."""
+        """
+        Create database schema with tables and indexes.
+
+        Runs in one transaction holding an advisory lock, so scheduler
+        workers opening spiders at the same time create it one at a time.
+        Columns, indexes and the history trigger are looked up in the
+        catalog first and only created if missing: ``ALTER TABLE`` and
+        ``CREATE INDEX`` lock their table against writes even when there
+        is nothing to do.
+        """
         with self.get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (SCHEMA_LOCK_ID,))
+
             # Create jobs table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -101,23 +289,28 @@ class PostgreSQLPipeline:
                     date_posted TIMESTAMP,
                     date_extracted TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                     was_opened BOOLEAN DEFAULT FALSE,
+                    fingerprint CHAR(64),
                     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
                 )
             """)
 
-            # Create indexes for performance
+            # Previous versions of jobs whose content changed
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_job_id
-                ON jobs(job_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_company
-                ON jobs(company)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_date_extracted
-                ON jobs(date_extracted DESC)
+                CREATE TABLE IF NOT EXISTS job_versions (
+                    id BIGSERIAL PRIMARY KEY,
+                    job_id VARCHAR(255) NOT NULL,
+                    fingerprint CHAR(64) NOT NULL,
+                    title TEXT,
+                    company VARCHAR(255),
+                    location VARCHAR(255),
+                    description TEXT,
+                    salary VARCHAR(255),
+                    url TEXT,
+                    date_posted TIMESTAMP,
+                    valid_from TIMESTAMP NOT NULL,
+                    valid_until TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
             """)
 
             # Create spider_runs table for health monitoring
@@ -134,99 +327,485 @@ class PostgreSQLPipeline:
                     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+
+            if self.write_mode == "copy":
+                # Unlogged staging table for COPY ingest, merged at spider close
+                cursor.execute("""
+                    CREATE UNLOGGED TABLE IF NOT EXISTS jobs_staging (
+                        seq BIGSERIAL PRIMARY KEY,
+                        spider_name VARCHAR(255) NOT NULL,
+                        job_id VARCHAR(255),
+                        title TEXT,
+                        company VARCHAR(255),
+                        location VARCHAR(255),
+                        description TEXT,
+                        salary VARCHAR(255),
+                        url TEXT,
+                        date_posted TIMESTAMP,
+                        date_extracted TIMESTAMP,
+                        was_opened BOOLEAN,
+                        fingerprint CHAR(64)
+                    )
+                """)
+
+            tables = ["jobs", "job_versions", "spider_runs"]
+            if self.write_mode == "copy":
+                tables.append("jobs_staging")
+            self._add_missing_columns(cursor, tables)
+            self._create_missing_indexes(cursor, tables)
+
+            # The trigger archives the old row of every content update, so
+            # all write modes keep the history without extra queries. It is
+            # normally installed by migration 003, and only created here if
+            # missing, since replacing it locks the jobs table.
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_spider_runs_spider_name
-                ON spider_runs(spider_name)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_spider_runs_run_start
-                ON spider_runs(run_start DESC)
+                SELECT
+                    to_regprocedure('record_job_version()') IS NOT NULL,
+                    EXISTS (
+                        SELECT 1 FROM pg_trigger
+                        WHERE tgname = 'jobs_record_version'
+                          AND tgrelid = 'jobs'::regclass
+                    )
             """)
+            has_function, has_trigger = cursor.fetchone()
+            if not has_function:
+                cursor.execute("""
+                    CREATE FUNCTION record_job_version() RETURNS trigger AS $$
+                    BEGIN
+                        INSERT INTO job_versions (
+                            job_id, fingerprint, title, company, location,
+                            description, salary, url, date_posted,
+                            valid_from, valid_until
+                        )
+                        VALUES (
+                            OLD.job_id, OLD.fingerprint, OLD.title, OLD.company,
+                            OLD.location, OLD.description, OLD.salary, OLD.url,
+                            OLD.date_posted, OLD.updated_at, NEW.updated_at
+                        );
+                        RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql
+                """)
+            if not has_trigger:
+                # Rows without a fingerprint predate it, their first upsert
+                # is a backfill rather than a change
+                cursor.execute("""
+                    CREATE TRIGGER jobs_record_version
+                    AFTER UPDATE OF fingerprint ON jobs
+                    FOR EACH ROW
+                    WHEN (
+                        OLD.fingerprint IS NOT NULL
+                        AND OLD.fingerprint IS DISTINCT FROM NEW.fingerprint
+                    )
+                    EXECUTE FUNCTION record_job_version()
+                """)
 
             conn.commit()
             logger.info("Database schema created/verified successfully")
 
+    def _add_missing_columns(self, cursor, tables: list[str]) -> None:
+        """
+        Add the columns of ``ADDED_COLUMNS`` that the tables still lack.
+
+        Args:
+            cursor: Cursor of the schema transaction.
+            tables: Tables to check.
+        """
+        cursor.execute(
+            """
+            SELECT table_name, column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = ANY(%s)
+            """,
+            (tables,),
+        )
+        existing = {(row[0], row[1]) for row in cursor.fetchall()}
+        for table in tables:
+            missing = [
+                f"ADD COLUMN IF NOT EXISTS {column} {definition}"
+                for column, definition in ADDED_COLUMNS.get(table, {}).items()
+                if (table, column) not in existing
+            ]
+            if missing:
+                cursor.execute(f"ALTER TABLE {table} {', '.join(missing)}")
+                logger.info(f"Added {len(missing)} missing column(s) to {table}")
+
+    def _create_missing_indexes(self, cursor, tables: list[str]) -> None:
+        """
+        Create the indexes of ``INDEXES`` that the tables still lack.
+
+        Args:
+            cursor: Cursor of the schema transaction.
+            tables: Tables to check.
+        """
+        indexes = {
+            name: (table, columns)
+            for name, (table, columns) in INDEXES.items()
+            if table in tables
+        }
+        cursor.execute(
+            """
+            SELECT indexname FROM pg_indexes
+            WHERE schemaname = current_schema() AND indexname = ANY(%s)
+            """,
+            (list(indexes),),
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        for name, (table, columns) in indexes.items():
+            if name not in existing:
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}{columns}")
+
+    def _prepare_row(self, item: dict[str, Any]) -> tuple:
+        """
+        Build an insert row for an item, normalizing its date fields.
+
+        The content fingerprint is computed from the normalized values and
+        appended as the last column.
+
+        Args:
+            item: Scraped item dictionary.
+
+        Returns:
+            Tuple of values ordered like ``JOB_COLUMNS``.
+        """
+        # Parse date_posted if it's a string
+        date_posted = item.get("date_posted")
+        if isinstance(date_posted, str):
+            try:
+                date_posted = datetime.fromisoformat(date_posted)
+            except (ValueError, TypeError):
+                date_posted = None
+
+        # Parse date_extracted
+        date_extracted = item.get("date_extracted")
+        if isinstance(date_extracted, str):
+            try:
+                date_extracted = datetime.fromisoformat(date_extracted)
+            except (ValueError, TypeError):
+                date_extracted = datetime.utcnow()
+        elif not date_extracted:
+            date_extracted = datetime.utcnow()
+
+        values = (
+            item.get("job_id"),
+            item.get("title"),
+            item.get("company"),
+            item.get("location"),
+            item.get("description"),
+            item.get("salary"),
+            item.get("url"),
+            date_posted,
+            date_extracted,
+            item.get("was_opened", False),
+        )
+        # Every column but the trailing fingerprint
+        fields = dict(zip(JOB_COLUMNS[:-1], values, strict=True))
+        return (*values, job_fingerprint(fields))
+
     def process_item(
         self, item: dict[str, Any], spider: Spider
     ) -> dict[str, Any] | None:
         """
-        Process scraped item and store in database if not duplicate.
+        Process scraped item and store it if it is new or its content changed.
+
+        In batch and copy modes the item is buffered and written later,
+        so it is returned without knowing yet whether it is new.
 
         Args:
             item: Scraped item dictionary.
             spider: Spider instance.
 
         Returns:
-            The processed item or None if duplicate.
+            The processed item or None if unchanged.
         """
         job_id = item.get("job_id")
         if not job_id:
             logger.warning("Item missing job_id, skipping")
             return None
 
+        if item.get("detail_failed") and self._job_stored(job_id):
+            # Missing its detail fields, the item would overwrite the stored job
+            spider.logger.info(f"Stored job kept, its detail page failed: {job_id}")
+            return None
+
+        row = self._prepare_row(item)
+        if self.job_index is not None and self.job_index.unchanged(job_id, row[-1]):
+            spider.logger.debug(f"Unchanged job skipped: {job_id}")
+            return None
+
+        if self.write_mode == "batch":
+            return self._buffer_item(item, row, spider)
+        if self.write_mode == "copy":
+            return self._stage_item(item, row, spider)
+
         try:
             with (
                 self.get_connection() as conn,
                 conn.cursor(cursor_factory=RealDictCursor) as cursor,
             ):
-                # Check for duplicate
-                cursor.execute("SELECT id FROM jobs WHERE job_id = %s", (job_id,))
-                if cursor.fetchone():
-                    spider.logger.debug(f"Duplicate job skipped: {job_id}")
-                    return None
-
-                # Parse date_posted if it's a string
-                date_posted = item.get("date_posted")
-                if isinstance(date_posted, str):
-                    try:
-                        date_posted = datetime.fromisoformat(date_posted)
-                    except (ValueError, TypeError):
-                        date_posted = None
-
-                # Parse date_extracted
-                date_extracted = item.get("date_extracted")
-                if isinstance(date_extracted, str):
-                    try:
-                        date_extracted = datetime.fromisoformat(date_extracted)
-                    except (ValueError, TypeError):
-                        date_extracted = datetime.utcnow()
-                elif not date_extracted:
-                    date_extracted = datetime.utcnow()
-
-                # Insert new job
                 cursor.execute(
-                    """
-                    INSERT INTO jobs (
-                        job_id, title, company, location, description,
-                        salary, url, date_posted, date_extracted, was_opened
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (
-                        job_id,
-                        item.get("title"),
-                        item.get("company"),
-                        item.get("location"),
-                        item.get("description"),
-                        item.get("salary"),
-                        item.get("url"),
-                        date_posted,
-                        date_extracted,
-                        item.get("was_opened", False),
-                    ),
+                    f"""
+                    INSERT INTO jobs ({", ".join(JOB_COLUMNS)})
+                    VALUES ({", ".join(["%s"] * len(JOB_COLUMNS))})
+                    {UPSERT_CLAUSE}
+                    RETURNING (xmax = 0) AS inserted
+                    """,  # noqa: S608
+                    row,
                 )
+                result = cursor.fetchone()
                 conn.commit()
-                self.new_jobs_count += 1
-                self.new_jobs.append(item)
-                spider.logger.info(f"New job stored: {job_id}")
-                return item
 
         except Exception as e:
             logger.error(f"Error processing item {job_id}: {e}")
             spider.logger.error(f"Database error for {job_id}: {e}")
             return None
 
+        if self.job_index is not None:
+            self.job_index.record(job_id, row[-1])
+        if result is None:
+            spider.logger.debug(f"Unchanged job skipped: {job_id}")
+            return None
+        if result["inserted"]:
+            self.new_jobs_count += 1
+            self.new_jobs.append(item)
+            spider.logger.info(f"New job stored: {job_id}")
+        else:
+            self.updated_jobs_count += 1
+            spider.logger.info(f"Changed job updated: {job_id}")
+        return item
+
+    def _job_stored(self, job_id: str) -> bool:
+        """
+        Check whether a job is already stored.
+
+        Args:
+            job_id: Job id of a scraped item.
+
+        Returns:
+            True if stored, or if the check failed.
+        """
+        if self.job_index is not None:
+            return job_id in self.job_index
+
+        try:
+            with self.get_connection() as conn:
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT 1 FROM jobs WHERE job_id = %s", (job_id,)
+                        )
+                        return cursor.fetchone() is not None
+                finally:
+                    conn.rollback()
+        except Exception as e:
+            logger.error(f"Error checking whether {job_id} is stored: {e}")
+            return True
+
+    def _buffer_item(
+        self, item: dict[str, Any], row: tuple, spider: Spider
+    ) -> dict[str, Any]:
+        """
+        Add an item to the write-behind buffer, flushing when a threshold is hit.
+
+        Args:
+            item: Scraped item dictionary with a job_id.
+            row: Insert row of the item, from ``_prepare_row``.
+            spider: Spider instance.
+
+        Returns:
+            The buffered item.
+        """
+        # First occurrence wins, an upsert cannot touch the same row twice
+        self._buffer.setdefault(item["job_id"], (item, row))
+
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.batch_flush_seconds
+        ):
+            self._flush_buffer(spider)
+        return item
+
+    def _flush_buffer(self, spider: Spider) -> None:
+        """
+        Upsert all buffered items with a single multi-row INSERT.
+
+        Only inserted or changed rows are returned by the upsert, which keeps
+        new-job tracking exact.
+
+        Args:
+            spider: Spider instance.
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        batch = self._buffer
+        self._buffer = {}
+        rows = [row for _, row in batch.values()]
+
+        try:
+            with self.get_connection() as conn:
+                try:
+                    with conn.cursor() as cursor:
+                        written = execute_values(
+                            cursor,
+                            f"""
+                            INSERT INTO jobs ({", ".join(JOB_COLUMNS)})
+                            VALUES %s
+                            {UPSERT_CLAUSE}
+                            RETURNING job_id, (xmax = 0) AS inserted
+                            """,  # noqa: S608
+                            rows,
+                            page_size=len(rows),
+                            fetch=True,
+                        )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            logger.error(f"Error flushing batch of {len(rows)} jobs: {e}")
+            spider.logger.error(f"Database error during batch flush: {e}")
+            return
+
+        if self.job_index is not None:
+            for job_id, (_, row) in batch.items():
+                self.job_index.record(job_id, row[-1])
+
+        inserted_ids = {job_id for job_id, inserted in written if inserted}
+        self.updated_jobs_count += len(written) - len(inserted_ids)
+        for job_id, (item, _) in batch.items():
+            if job_id in inserted_ids:
+                self.new_jobs_count += 1
+                self.new_jobs.append(item)
+                spider.logger.info(f"New job stored: {job_id}")
+
+        spider.logger.debug(
+            f"Flushed batch of {len(rows)} jobs, {len(inserted_ids)} new, "
+            f"{len(written) - len(inserted_ids)} changed"
+        )
+
+    def _stage_item(
+        self, item: dict[str, Any], row: tuple, spider: Spider
+    ) -> dict[str, Any]:
+        """
+        Append an item to the CSV buffer streamed into ``jobs_staging``.
+
+        Args:
+            item: Scraped item dictionary with a job_id.
+            row: Insert row of the item, from ``_prepare_row``.
+            spider: Spider instance.
+
+        Returns:
+            The staged item.
+        """
+        csv.writer(self._copy_buffer).writerow((spider.name, *row))
+        self._copy_rows += 1
+
+        if self._copy_rows >= self.batch_size:
+            self._copy_to_staging(spider)
+        return item
+
+    def _copy_to_staging(self, spider: Spider) -> None:
+        """
+        Stream the buffered rows into ``jobs_staging`` with ``COPY FROM STDIN``.
+
+        Args:
+            spider: Spider instance.
+        """
+        if not self._copy_rows:
+            return
+
+        buffer = self._copy_buffer
+        row_count = self._copy_rows
+        self._copy_buffer = io.StringIO()
+        self._copy_rows = 0
+        buffer.seek(0)
+
+        try:
+            with self.get_connection() as conn:
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.copy_expert(
+                            f"""
+                            COPY jobs_staging (spider_name, {", ".join(JOB_COLUMNS)})
+                            FROM STDIN WITH (FORMAT csv)
+                            """,
+                            buffer,
+                        )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            logger.error(f"Error copying {row_count} jobs into staging: {e}")
+            spider.logger.error(f"Database error during COPY: {e}")
+            return
+
+        spider.logger.debug(f"Copied {row_count} jobs into staging table")
+
+    def _merge_staging(self, spider: Spider) -> None:
+        """
+        Upsert the spider's staged rows into ``jobs`` with a single statement.
+
+        The new rows returned by the merge feed the notification stats, so
+        staged items never have to be kept in memory.
+
+        Args:
+            spider: Spider instance.
+        """
+        columns = ", ".join(JOB_COLUMNS)
+        try:
+            with self.get_connection() as conn:
+                try:
+                    with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                        cursor.execute(
+                            f"""
+                            INSERT INTO jobs ({columns})
+                            SELECT DISTINCT ON (job_id) {columns}
+                            FROM jobs_staging
+                            WHERE spider_name = %s
+                              AND job_id IS NOT NULL
+                              AND title IS NOT NULL
+                              AND company IS NOT NULL
+                              AND url IS NOT NULL
+                            ORDER BY job_id, seq
+                            {UPSERT_CLAUSE}
+                            RETURNING job_id, title, company, location,
+                                      description, salary, url, date_posted,
+                                      fingerprint, (xmax = 0) AS inserted
+                            """,  # noqa: S608
+                            (spider.name,),
+                        )
+                        written = cursor.fetchall()
+                        cursor.execute(
+                            "DELETE FROM jobs_staging WHERE spider_name = %s",
+                            (spider.name,),
+                        )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            logger.error(f"Error merging staged jobs for {spider.name}: {e}")
+            spider.logger.error(f"Database error during staging merge: {e}")
+            return
+
+        inserted = []
+        for row in written:
+            job = dict(row)
+            fingerprint = job.pop("fingerprint")
+            if self.job_index is not None:
+                self.job_index.record(job["job_id"], fingerprint)
+            if job.pop("inserted"):
+                inserted.append(job)
+        self.new_jobs.extend(inserted)
+        self.new_jobs_count += len(inserted)
+        self.updated_jobs_count += len(written) - len(inserted)
+        spider.logger.info(
+            f"Merged staged jobs, {len(inserted)} new, "
+            f"{len(written) - len(inserted)} changed"
+        )
+
     def close_spider(self, spider: Spider) -> None:
         """
         Called when spider closes. Logs statistics and closes connections.
@@ -234,15 +813,30 @@ class PostgreSQLPipeline:
         Args:
             spider: The spider instance.
         """
+        if self.write_mode == "batch":
+            self._flush_buffer(spider)
+        elif self.write_mode == "copy":
+            self._copy_to_staging(spider)
+            self._merge_staging(spider)
+
         logger.info(
             f"Closing PostgreSQL pipeline for {spider.name}. "
-            f"New jobs: {self.new_jobs_count}"
+            f"New jobs: {self.new_jobs_count}, "
+            f"changed jobs: {self.updated_jobs_count}"
         )
 
         # Store the new jobs list in spider stats for email notification
         if hasattr(spider, "crawler") and spider.crawler.stats:
             spider.crawler.stats.set_value("new_jobs", self.new_jobs)
             spider.crawler.stats.set_value("new_jobs_count", self.new_jobs_count)
+            spider.crawler.stats.set_value(
+                "updated_jobs_count", self.updated_jobs_count
+            )
+            if self.job_index is not None:
+                spider.crawler.stats.set_value("known_jobs/hits", self.job_index.hits)
+                spider.crawler.stats.set_value(
+                    "known_jobs/misses", self.job_index.misses
+                )
 
         # Close all connections in the pool
         if hasattr(self, "connection_pool"):
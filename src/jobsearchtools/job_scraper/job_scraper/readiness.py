@@ -0,0 +1,154 @@
+"""
+Readiness waits for Playwright-rendered job listings.
+
+Dynamic spiders used to sleep a fixed time after the first listing showed
+up, to give the rest of the board time to render. ``ListingReady`` is a
+page method that instead returns as soon as the listing is complete: the
+listing selector is attached, the page optionally reached network idle,
+and the number of listings stopped changing. A ceiling bounds the wait on
+pages that keep changing.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from scrapy_playwright.page import PageMethod
+
+from jobsearchtools.config.settings import settings
+
+# Upper bounds of the wait time histogram buckets, in milliseconds
+WAIT_BUCKETS_MS = (250, 500, 1000, 2000, 5000, 10000)
+
+
+@dataclass(frozen=True)
+class ReadyResult:
+    """Outcome of a readiness wait."""
+
+    wait_ms: float
+    # "ready", or "timeout" when the ceiling was reached first
+    outcome: str
+    listings: int
+
+
+class ListingReady:
+    """
+    Wait until a rendered listing stops changing.
+
+    Instances are called by scrapy-playwright with the page, see
+    ``listing_ready``. The ``ReadyResult`` ends up in ``PageMethod.result``
+    and in the ``browser_ready/`` stats.
+    """
+
+    def __init__(
+        self,
+        selector: str,
+        network_idle: bool = False,
+        stable_ms: int | None = None,
+        timeout_ms: int | None = None,
+        poll_ms: int = 100,
+    ):
+        """
+        Initialize the wait.
+
+        Args:
+            selector: CSS selector matching one listing, e.g. a job card.
+            network_idle: Also wait for the page to stop loading data.
+            stable_ms: Time the listing count must stay unchanged.
+                Defaults to ``BROWSER_READY_STABLE_MS``.
+            timeout_ms: Ceiling for the whole wait.
+                Defaults to ``BROWSER_READY_TIMEOUT_MS``.
+            poll_ms: Interval between listing counts.
+        """
+        self.selector = selector
+        self.network_idle = network_idle
+        self.stable_ms = (
+            settings.browser.ready_stable_ms if stable_ms is None else stable_ms
+        )
+        self.timeout_ms = (
+            settings.browser.ready_timeout_ms if timeout_ms is None else timeout_ms
+        )
+        self.poll_ms = poll_ms
+
+    async def __call__(self, page) -> ReadyResult:
+        """
+        Wait for the listing on a page.
+
+        Args:
+            page: Playwright page, after navigation.
+
+        Returns:
+            How long the wait took and how it ended.
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout_ms / 1000
+
+        def remaining_ms() -> float:
+            return max((deadline - time.monotonic()) * 1000, 1)
+
+        def result(outcome: str, listings: int) -> ReadyResult:
+            wait_ms = (time.monotonic() - started) * 1000
+            return ReadyResult(wait_ms, outcome, listings)
+
+        try:
+            await page.wait_for_selector(
+                self.selector, state="attached", timeout=remaining_ms()
+            )
+        except PlaywrightTimeoutError:
+            return result("timeout", 0)
+
+        if self.network_idle:
+            try:
+                await page.wait_for_load_state("networkidle", timeout=remaining_ms())
+            except PlaywrightTimeoutError:
+                return result("timeout", await page.locator(self.selector).count())
+
+        locator = page.locator(self.selector)
+        listings = await locator.count()
+        stable_since = time.monotonic()
+        while (time.monotonic() - stable_since) * 1000 < self.stable_ms:
+            if time.monotonic() >= deadline:
+                return result("timeout", listings)
+            await asyncio.sleep(self.poll_ms / 1000)
+            count = await locator.count()
+            if count != listings:
+                listings = count
+                stable_since = time.monotonic()
+        return result("ready", listings)
+
+
+def listing_ready(selector: str, **kwargs) -> PageMethod:
+    """
+    Build the page method waiting for a listing to be complete.
+
+    Args:
+        selector: CSS selector matching one listing.
+        **kwargs: Options passed to ``ListingReady``.
+
+    Returns:
+        PageMethod for ``playwright_page_methods``.
+    """
+    return PageMethod(ListingReady(selector, **kwargs))
+
+
+def record_ready_stats(stats, result: ReadyResult) -> None:
+    """
+    Add a readiness wait to the ``browser_ready/`` stats.
+
+    Wait times are counted in a histogram, one key per bucket, e.g.
+    ``browser_ready/wait_ms/le_1000`` counts waits of 500 to 1000 ms.
+
+    Args:
+        stats: Scrapy stats collector.
+        result: Outcome of the wait.
+    """
+    bucket = next(
+        (f"le_{bound}" for bound in WAIT_BUCKETS_MS if result.wait_ms <= bound),
+        "le_inf",
+    )
+    stats.inc_value(f"browser_ready/wait_ms/{bucket}")
+    stats.inc_value(f"browser_ready/outcome/{result.outcome}")
+    stats.inc_value("browser_ready/wait_count")
+    stats.inc_value("browser_ready/wait_ms_total", result.wait_ms)
+    stats.max_value("browser_ready/wait_ms_max", result.wait_ms)
@@ -7,6 +7,7 @@
 #     https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
 #     https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 from jobsearchtools.config.config import config
+from jobsearchtools.config.settings import settings as app_settings
 
 BOT_NAME = config.get("scrapy", {}).get("bot_name", "job_scraper")
 
@@ -16,6 +17,10 @@ SPIDER_MODULES = [
     "jobsearchtools.job_scraper.job_scraper.spiders.dynamic",
 ]
 NEWSPIDER_MODULE = "jobsearchtools.job_scraper.job_scraper.spiders"
+# Look spiders up in the static registry instead of importing every module
+SPIDER_LOADER_CLASS = (
+    "jobsearchtools.job_scraper.job_scraper.spider_registry.RegistrySpiderLoader"
+)
 
 ADDONS = {}
 
@@ -28,8 +33,13 @@ ROBOTSTXT_OBEY = True
 
 # Concurrency and throttling settings
 # CONCURRENT_REQUESTS = 16
-CONCURRENT_REQUESTS_PER_DOMAIN = 1
-DOWNLOAD_DELAY = 1
+CONCURRENT_REQUESTS_PER_DOMAIN = app_settings.scrapy.concurrent_requests_per_domain
+DOWNLOAD_DELAY = app_settings.scrapy.download_delay
+# Per-host budgets, e.g. for boards whose result pages are fetched at once
+DOWNLOAD_SLOTS = {
+    host: {"concurrency": policy.concurrency, "delay": policy.min_delay}
+    for host, policy in app_settings.scrapy.domain_policies.items()
+}
 
 # Disable cookies (enabled by default)
 # COOKIES_ENABLED = False
@@ -56,6 +66,13 @@ DOWNLOADER_MIDDLEWARES = {
     "JobScraperDownloaderMiddleware": 543,
     "jobsearchtools.job_scraper.job_scraper.middlewares."
     "SetRandomUserAgentMiddleware": 400,
+    # Revalidates listing pages and skips unchanged ones (see httpcache.py)
+    "scrapy.downloadermiddlewares.httpcache.HttpCacheMiddleware": None,
+    "jobsearchtools.job_scraper.job_scraper.httpcache."
+    "ConditionalCacheMiddleware": 900,
+    # Skips listing pages whose jobs did not change (see content_hash.py)
+    "jobsearchtools.job_scraper.job_scraper.content_hash."
+    "ContentHashMiddleware": 850,
 }
 
 # Enable or disable extensions
@@ -65,8 +82,17 @@ EXTENSIONS = {
     "EmailNotificationExtension": 500,
     "jobsearchtools.job_scraper.job_scraper.extensions."
     "SpiderHealthMonitorExtension": 600,
+    "jobsearchtools.job_scraper.job_scraper.extensions.KnownJobsExtension": 700,
+    "jobsearchtools.job_scraper.job_scraper.throttle.DomainThrottleExtension": 800,
 }
 
+# Deliver queued email notifications when a standalone crawl ends. The
+# scheduler turns this off, its own process delivers them in the background.
+NOTIFICATION_QUEUE_DRAIN_ON_STOP = True
+# Directory the scheduler collects the cycle digest from. Set by the scheduler
+# on its workers in digest mode, a standalone crawl queues its email instead.
+NOTIFICATION_DIGEST_DIR = None
+
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 ITEM_PIPELINES = {
@@ -88,17 +114,39 @@ ITEM_PIPELINES = {
 
 # Enable and configure HTTP caching (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/downloader-middleware.html#httpcache-middleware-settings
-# HTTPCACHE_ENABLED = True
-# HTTPCACHE_EXPIRATION_SECS = 0
-# HTTPCACHE_DIR = "httpcache"
+# Pages are stored with their validators and fetched conditionally next run
+HTTPCACHE_ENABLED = True
+# Drop entries after a week so every page is parsed in full now and then
+HTTPCACHE_EXPIRATION_SECS = 7 * 24 * 3600
+HTTPCACHE_DIR = str((app_settings.cache_dir / "httpcache").resolve())
 # HTTPCACHE_IGNORE_HTTP_CODES = []
-# HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+HTTPCACHE_POLICY = (
+    "jobsearchtools.job_scraper.job_scraper.httpcache.ConditionalRequestPolicy"
+)
 
 # Set settings whose default value is deprecated to a future-proof value
 FEED_EXPORT_ENCODING = "utf-8"
 
 
 ######################## Custom settings for job scraper #######################
+# Skip detail-page requests for jobs already stored (see KnownJobsExtension)
+KNOWN_JOBS_ENABLED = True
+KNOWN_JOBS_CACHE_TTL_HOURS = 24
+# Download each known job's detail page again every N days to detect changes
+KNOWN_JOBS_REFRESH_DAYS = 7
+# Adapt each host's delay to its latency and 429/503 answers (see throttle.py)
+DOMAIN_THROTTLE_ENABLED = app_settings.scrapy.throttle_enabled
+DOMAIN_THROTTLE_MAX_DELAY = app_settings.scrapy.throttle_max_delay
+DOMAIN_THROTTLE_TARGET_LATENCY = app_settings.scrapy.throttle_target_latency
+DOMAIN_THROTTLE_POLICIES = {
+    host: policy.model_dump()
+    for host, policy in app_settings.scrapy.domain_policies.items()
+}
+# Skip listing pages whose jobs hash like last run's (see ContentHashMiddleware)
+CONTENT_HASH_ENABLED = True
+CONTENT_HASH_MAX_AGE_HOURS = 7 * 24
+
 USER_AGENTS = [
     (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
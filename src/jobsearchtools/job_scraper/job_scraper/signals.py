@@ -0,0 +1,10 @@
+"""
+Custom Scrapy signals sent by the job scraper.
+
+Connect handlers with ``crawler.signals.connect(handler, signal=...)``.
+"""
+
+# Sent with ``request`` and ``spider`` arguments when a page did not change
+# since the last run (304 Not Modified or the same listing content) and its
+# callback was skipped
+page_unchanged = object()
@@ -0,0 +1,180 @@
+"""
+Static registry of the project's spiders.
+
+Scrapy's default spider loader imports every module under
+``SPIDER_MODULES`` to find spider names, which pulls in Playwright for the
+browser spiders even when only a static one runs. ``SPIDERS`` lists each
+spider's name, module, class, domain, whether it renders pages in a
+browser and its download budget, so spiders can be listed and filtered
+without importing them.
+``RegistrySpiderLoader`` imports a spider module only when its spider is
+loaded. ``tests/test_spider_registry.py`` checks the entries against the
+spider classes.
+"""
+
+import importlib
+import importlib.util
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from scrapy import Spider
+
+SPIDERS_PACKAGE = "jobsearchtools.job_scraper.job_scraper.spiders"
+
+
+@dataclass(frozen=True)
+class SpiderSpec:
+    """Metadata of one spider, available without importing it."""
+
+    name: str
+    module: str
+    class_name: str
+    domain: str
+    # Renders pages with Playwright (see browser.py)
+    browser: bool = False
+    # Key of config.settings.DOWNLOAD_BUDGETS, for spiders that request
+    # their result pages at once. Others use the SCRAPY_* defaults.
+    budget: str | None = None
+
+    def load(self) -> "type[Spider]":
+        """
+        Import the spider's module and return its class.
+
+        Returns:
+            The spider class.
+        """
+        module = importlib.import_module(self.module)
+        return getattr(module, self.class_name)
+
+
+def _static(
+    name: str, class_name: str, domain: str, budget: str | None = None
+) -> SpiderSpec:
+    """Build the entry of a spider in the ``static`` package."""
+    return SpiderSpec(
+        name, f"{SPIDERS_PACKAGE}.static.{name}", class_name, domain, budget=budget
+    )
+
+
+def _dynamic(
+    name: str, class_name: str, domain: str, budget: str | None = None
+) -> SpiderSpec:
+    """Build the entry of a browser spider in the ``dynamic`` package."""
+    return SpiderSpec(
+        name,
+        f"{SPIDERS_PACKAGE}.dynamic.{name}",
+        class_name,
+        domain,
+        browser=True,
+        budget=budget,
+    )
+
+
+SPIDERS = (
+    _static("avianca", "AviancaSpider", "jobs.avianca.com", "successfactors"),
+    _static(
+        "bancolombia",
+        "BancolombiaSpider",
+        "empleo.grupobancolombia.com",
+        "successfactors",
+    ),
+    _static("citi", "CitiSpider", "jobs.citi.com", "paged_api"),
+    _static("ecopetrol", "EcopetrolSpider", "jobs.ecopetrol.com.co"),
+    _static("mastercard", "MastercardSpider", "careers.mastercard.com"),
+    _static("nequi", "NequiSpider", "lapipolnequi.buk.co"),
+    _static("scotiabank", "ScotiabankSpider", "jobs.scotiabank.com", "successfactors"),
+    _static("sura", "SuraSpider", "trabajaconnosotros.sura.com", "successfactors"),
+    _dynamic("bbva", "BbvaSpider", "bbva.wd3.myworkdayjobs.com", "paged_api"),
+    _dynamic("visa", "VisaSpider", "corporate.visa.com"),
+)
+
+
+def browser_available() -> bool:
+    """Return whether scrapy-playwright is installed, without importing it."""
+    return importlib.util.find_spec("scrapy_playwright") is not None
+
+
+def available_spiders() -> list[SpiderSpec]:
+    """
+    Return the spiders that can run in this environment.
+
+    Browser spiders are left out when scrapy-playwright is not installed.
+
+    Returns:
+        Registry entries, in registry order.
+    """
+    with_browser = browser_available()
+    return [spec for spec in SPIDERS if with_browser or not spec.browser]
+
+
+class RegistrySpiderLoader:
+    """
+    Scrapy spider loader backed by the registry.
+
+    Set as ``SPIDER_LOADER_CLASS``. Only the module of a spider that is
+    loaded gets imported.
+    """
+
+    def __init__(self, specs=SPIDERS):
+        """
+        Initialize the loader.
+
+        Args:
+            specs: Registry entries the loader knows.
+        """
+        self.specs = {spec.name: spec for spec in specs}
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Create the loader, called by Scrapy.
+
+        Args:
+            settings: Scrapy settings (unused, the registry is static).
+
+        Returns:
+            Instance of RegistrySpiderLoader.
+        """
+        return cls()
+
+    def load(self, spider_name: str) -> "type[Spider]":
+        """
+        Return the spider class for a name, importing only its module.
+
+        Args:
+            spider_name: Spider name.
+
+        Returns:
+            The spider class.
+
+        Raises:
+            KeyError: If no spider has this name.
+        """
+        try:
+            spec = self.specs[spider_name]
+        except KeyError:
+            raise KeyError(f"Spider not found: {spider_name}") from None
+        return spec.load()
+
+    def find_by_request(self, request) -> list[str]:
+        """
+        Return the names of spiders whose domain serves a request.
+
+        Args:
+            request: Scrapy request.
+
+        Returns:
+            Matching spider names.
+        """
+        host = (urlsplit(request.url).hostname or "").lower()
+        return [
+            spec.name
+            for spec in self.specs.values()
+            if host == spec.domain or host.endswith(f".{spec.domain}")
+        ]
+
+    def list(self) -> list[str]:
+        """Return the names of all registered spiders."""
+        return list(self.specs)
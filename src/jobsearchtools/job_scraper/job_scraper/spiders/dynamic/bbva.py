@@ -1,35 +1,184 @@
-"""BBVA job listings spider (dynamic with Playwright)."""
+"""
+BBVA job listings spider.
+
+BBVA's Workday board exposes a paginated JSON endpoint, which is fetched
+directly by default. Rendering the board with Playwright is kept as a
+fallback for when the endpoint fails.
+"""
 
 from datetime import datetime
 
 import scrapy
+from scrapy.http import JsonRequest
 from scrapy_playwright.page import PageMethod
 
+from ...browser import BROWSER_SPIDER_SETTINGS
 from ...items import JobScraperItem
+from ...readiness import listing_ready
+
+WORKDAY_HOST = "https://bbva.wd3.myworkdayjobs.com"
+COLOMBIA_LOCATION_ID = "e8106cd6a3534f2dba6fdee2d41db89d"
 
 
 class BbvaSpider(scrapy.Spider):
-    """Spider for scraping job listings from BBVA careers page using Playwright."""
+    """
+    Spider for scraping job listings from BBVA careers page.
+
+    Run with ``-a mode=browser`` to skip the JSON API and render the board
+    with Playwright.
+    """
 
     name = "bbva"
     allowed_domains = ["bbva.wd3.myworkdayjobs.com"]
-    start_urls = [
-        "https://bbva.wd3.myworkdayjobs.com/es/BBVA?locationCountry=e8106cd6a3534f2dba6fdee2d41db89d"
-    ]
-
-    custom_settings = {
-        "PLAYWRIGHT_BROWSER_TYPE": "firefox",
-        "PLAYWRIGHT_LAUNCH_OPTIONS": {"headless": True},
-        "DOWNLOAD_HANDLERS": {
-            "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-            "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-        },
-        "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
-    }
+    start_urls = [f"{WORKDAY_HOST}/es/BBVA?locationCountry={COLOMBIA_LOCATION_ID}"]
+
+    api_url = f"{WORKDAY_HOST}/wday/cxs/bbva/BBVA/jobs"
+    # Workday rejects page sizes above 20
+    page_size = 20
+    mode = "api"
+    _fell_back = False
+
+    # Shares one browser with the other dynamic spiders of the process
+    custom_settings = BROWSER_SPIDER_SETTINGS
 
     def start_requests(self):
         """
-        Start requests with Playwright enabled.
+        Start with the JSON API, or the browser if requested.
+
+        Yields:
+            Request: API request, or Scrapy request with Playwright meta
+        """
+        if self.mode == "browser":
+            yield from self.browser_requests()
+            return
+
+        yield self.api_request(offset=0)
+
+    def api_request(self, offset):
+        """
+        Build a request for one page of the Workday jobs endpoint.
+
+        Args:
+            offset: Index of the first job of the page.
+
+        Returns:
+            JsonRequest: POST request for the page
+        """
+        return JsonRequest(
+            self.api_url,
+            data={
+                "appliedFacets": {"locationCountry": [COLOMBIA_LOCATION_ID]},
+                "limit": self.page_size,
+                "offset": offset,
+                "searchText": "",
+            },
+            callback=self.parse_api,
+            errback=self.errback_api,
+            cb_kwargs={"offset": offset},
+            dont_filter=True,
+        )
+
+    def parse_api(self, response, offset):
+        """
+        Parse one page of the Workday jobs endpoint.
+
+        The first page reports the total job count, so requests for all
+        remaining pages are scheduled at once.
+
+        Args:
+            response: Scrapy response with the JSON page
+            offset: Index of the first job of the page
+
+        Yields:
+            JobScraperItem, or Request for the remaining pages
+        """
+        try:
+            data = response.json()
+        except ValueError:
+            self.logger.warning(f"Invalid JSON from {response.url}")
+            if offset == 0:
+                yield from self.fall_back()
+            return
+
+        postings = data.get("jobPostings") or []
+        for posting in postings:
+            item = self.item_from_posting(posting)
+            if item is not None:
+                yield item
+
+        if offset == 0:
+            total = data.get("total") or 0
+            self.logger.info(f"BBVA API reports {total} jobs")
+            for next_offset in range(self.page_size, total, self.page_size):
+                yield self.api_request(next_offset)
+
+        self.logger.info(f"Parsed {len(postings)} BBVA jobs at offset {offset}")
+
+    def item_from_posting(self, posting):
+        """
+        Build an item from a Workday job posting.
+
+        Args:
+            posting: Job posting object of the API response
+
+        Returns:
+            JobScraperItem, or None if the posting has no requisition id
+        """
+        # The requisition id (e.g. "JR0001234") is the first bullet field
+        bullet_fields = posting.get("bulletFields") or []
+        if not bullet_fields:
+            self.logger.warning(f"Skipping job without id: {posting.get('title')}")
+            return None
+
+        external_path = posting.get("externalPath")
+        item = JobScraperItem()
+        item["company"] = "BBVA"
+        item["title"] = posting.get("title")
+        item["location"] = posting.get("locationsText")
+        item["date_posted"] = posting.get("postedOn")
+        item["job_id"] = f"bbva_{bullet_fields[0]}"
+        item["url"] = (
+            f"{WORKDAY_HOST}/es/BBVA{external_path}" if external_path else None
+        )
+        item["date_extracted"] = datetime.now().isoformat()
+        item["salary"] = None
+        item["description"] = None
+        item["was_opened"] = False
+        return item
+
+    def errback_api(self, failure):
+        """
+        Handle API request failures.
+
+        A failed first page switches the spider to the Playwright fallback.
+
+        Args:
+            failure: Twisted failure object
+
+        Yields:
+            Request: Playwright requests if falling back
+        """
+        self.logger.error(f"BBVA API request failed: {failure.value}")
+        if failure.request.cb_kwargs.get("offset") == 0:
+            yield from self.fall_back()
+
+    def fall_back(self):
+        """
+        Switch to rendering the board with Playwright, once per run.
+
+        Yields:
+            Request: Scrapy request with Playwright meta
+        """
+        if self._fell_back:
+            return
+        self._fell_back = True
+        self.crawler.stats.inc_value("bbva/playwright_fallback")
+        self.logger.warning("Falling back to Playwright for BBVA")
+        yield from self.browser_requests()
+
+    def browser_requests(self):
+        """
+        Build the requests that render the board with Playwright.
 
         Yields:
             Request: Scrapy request with Playwright meta
@@ -46,16 +195,18 @@ class BbvaSpider(scrapy.Spider):
                             "evaluate",
                             "window.scrollTo(0, document.body.scrollHeight)",
                         ),
-                        PageMethod("wait_for_timeout", 2000),
+                        # The board renders from the jobs XHR, wait for it
+                        listing_ready("li.css-1q2dra3", network_idle=True),
                     ],
                     "errback": self.errback,
                 },
                 callback=self.parse,
+                dont_filter=True,
             )
 
     async def parse(self, response):
         """
-        Parse job listings from BBVA careers page.
+        Parse job listings from BBVA careers page rendered by Playwright.
 
         Args:
             response: Scrapy response object with Playwright page
@@ -89,7 +240,7 @@ class BbvaSpider(scrapy.Spider):
 
             job_url = job.css("a::attr(href)").get()
             if job_url:
-                item["url"] = f"https://bbva.wd3.myworkdayjobs.com{job_url}"
+                item["url"] = f"{WORKDAY_HOST}{job_url}"
             else:
                 item["url"] = None
 
@@ -8,9 +8,10 @@ to render the page before scraping.
 from datetime import datetime
 
 import scrapy
-from scrapy_playwright.page import PageMethod
 
+from ...browser import BROWSER_SPIDER_SETTINGS
 from ...items import JobScraperItem
+from ...readiness import listing_ready
 
 
 class VisaSpider(scrapy.Spider):
@@ -27,15 +28,8 @@ class VisaSpider(scrapy.Spider):
         "?cities=Bogot%C3%A1&sortProperty=createdOn&sortOrder=DESC"
     ]
 
-    custom_settings = {
-        "PLAYWRIGHT_BROWSER_TYPE": "firefox",
-        "PLAYWRIGHT_LAUNCH_OPTIONS": {"headless": True},
-        "DOWNLOAD_HANDLERS": {
-            "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-            "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-        },
-        "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
-    }
+    # Shares one browser with the other dynamic spiders of the process
+    custom_settings = BROWSER_SPIDER_SETTINGS
 
     def start_requests(self):
         """
@@ -51,8 +45,7 @@ class VisaSpider(scrapy.Spider):
                     "playwright": True,
                     "playwright_include_page": True,
                     "playwright_page_methods": [
-                        PageMethod("wait_for_selector", "li.vs-underline"),
-                        PageMethod("wait_for_timeout", 2000),
+                        listing_ready("li.vs-underline"),
                     ],
                     "errback": self.errback,
                 },
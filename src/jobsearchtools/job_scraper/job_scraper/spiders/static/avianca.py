@@ -4,12 +4,10 @@ import hashlib
 import re
 from datetime import datetime
 
-import scrapy
+from ...successfactors import SuccessFactorsSpider
 
-from ...items import JobScraperItem
 
-
-class AviancaSpider(scrapy.Spider):
+class AviancaSpider(SuccessFactorsSpider):
     """Spider for scraping job listings from Avianca careers page."""
 
     name = "avianca"
@@ -17,6 +15,8 @@ class AviancaSpider(scrapy.Spider):
     start_urls = [
         "https://jobs.avianca.com/search/?createNewAlert=false&q=&locationsearch=Co"
     ]
+    company = "Avianca"
+    follow_details = True
 
     # Spanish to English month mapping (class-level to avoid recreation)
     SPANISH_MONTHS = {
@@ -34,100 +34,58 @@ class AviancaSpider(scrapy.Spider):
         "dic": "Dec",
     }
 
-    def parse(self, response):
+    def parse_date(self, date_str):
         """
-        Parse job listings from Avianca careers page.
+        Parse Spanish listing dates such as "31 oct 2025".
 
         Args:
-            response: Scrapy response object
+            date_str: Stripped date text of the row.
 
-        Yields:
-            Request: For detail pages or JobScraperItem
+        Returns:
+            ISO date, or the original string if it cannot be parsed.
+        """
+        try:
+            for es_month, en_month in self.SPANISH_MONTHS.items():
+                date_str = date_str.replace(es_month, en_month)
+            return datetime.strptime(date_str, "%d %b %Y").date().isoformat()
+        except ValueError as e:
+            # Fallback: keep original string if parsing fails
+            self.logger.warning(f"Could not parse date '{date_str}': {e}")
+            return date_str
+
+    def job_id_from_url(self, job_url):
         """
-        self.logger.info(f"Parsing Avianca jobs from {response.url}")
+        Extract the numeric job ID from URL pattern: /job/.../1263795901/.
 
-        jobs = response.css("tr.data-row")
-        self.logger.info(f"Found {len(jobs)} job listings")
+        Args:
+            job_url: Relative job URL.
 
-        for job in jobs:
-            item = JobScraperItem()
-            item["company"] = "Avianca"
+        Returns:
+            Job id, based on a hash of the URL if it has no numeric ID.
+        """
+        job_id_match = re.search(r"/(\d+)/?$", job_url)
+        if job_id_match:
+            return f"avianca_{job_id_match.group(1)}"
 
-            # Extract title
-            title = job.css("a.jobTitle-link::text").get()
-            if title:
-                item["title"] = title.strip()
-            else:
-                self.logger.warning("Missing title, skipping job")
-                continue
-
-            # Extract and parse location
-            locations = job.css(".jobLocation::text").getall()
-            # Filter out empty strings and take the last non-empty one
-            clean_locations = [loc.strip() for loc in locations if loc.strip()]
-            item["location"] = clean_locations[-1] if clean_locations else None
-
-            # Parse date with Spanish month names
-            date_str = job.css("span.jobDate::text").get()
-            if date_str:
-                date_str = date_str.strip()
-                try:
-                    # Parse Spanish dates: "31 oct 2025"
-                    for es_month, en_month in self.SPANISH_MONTHS.items():
-                        date_str = date_str.replace(es_month, en_month)
-
-                    parsed_date = datetime.strptime(date_str, "%d %b %Y")
-                    item["date_posted"] = parsed_date.date().isoformat()
-                except ValueError as e:
-                    # Fallback: keep original string if parsing fails
-                    self.logger.warning(f"Could not parse date '{date_str}': {e}")
-                    item["date_posted"] = date_str
-            else:
-                item["date_posted"] = None
+        job_hash = hashlib.sha256(job_url.encode()).hexdigest()[:10]
+        self.logger.warning(f"Could not extract ID from URL {job_url}, using hash")
+        return f"avianca_{job_hash}"
 
-            # Extract job URL and ID
-            job_url = job.css("a.jobTitle-link::attr(href)").get()
-            if not job_url:
-                self.logger.warning("Missing job URL, skipping")
-                continue
+    def next_page(self, response):
+        """
+        Return the next results page link, if any.
 
-            item["url"] = response.urljoin(job_url)
+        Args:
+            response: Scrapy response object
 
-            # Extract numeric job ID from URL pattern: /job/.../1263795901/
-            job_id_match = re.search(r"/(\d+)/?$", job_url)
-            if job_id_match:
-                item["job_id"] = f"avianca_{job_id_match.group(1)}"
-            else:
-                # Fallback: use hash if pattern doesn't match
-                job_hash = hashlib.sha256(job_url.encode()).hexdigest()[:10]
-                item["job_id"] = f"avianca_{job_hash}"
-                self.logger.warning(
-                    f"Could not extract ID from URL {job_url}, using hash"
-                )
-
-            item["date_extracted"] = datetime.now().isoformat()
-            item["salary"] = None
-
-            # Follow to detail page to get description
-            yield response.follow(
-                job_url,
-                callback=self.parse_detail,
-                cb_kwargs={"item": item},
-                errback=self.errback_detail,
-                meta={"item": item},
-            )
-
-        # Check for pagination (next page)
-        next_page = response.css(
-            'a.paginationItemStyle:contains("›"), a.next, link[rel="next"]::attr(href)'
+        Returns:
+            Next page URL or None
+        """
+        return response.css(
+            'a.paginationItemStyle:contains("›")::attr(href), '
+            'a.next::attr(href), link[rel="next"]::attr(href)'
         ).get()
 
-        if next_page:
-            self.logger.info(f"Following pagination: {next_page}")
-            yield response.follow(next_page, callback=self.parse)
-        else:
-            self.logger.info("No pagination found, finished parsing")
-
     def parse_detail(self, response, item):
         """
         Parse job detail page for description.
@@ -164,6 +122,7 @@ class AviancaSpider(scrapy.Spider):
             # Yield item anyway without description
             item["description"] = None
             item["was_opened"] = False
+            item["detail_failed"] = True
             yield item
 
     def errback_detail(self, failure):
@@ -174,9 +133,10 @@ class AviancaSpider(scrapy.Spider):
             failure: Twisted failure object
         """
         self.logger.error(f"Detail page request failed: {failure.value}")
-        # Yield the item without description
+        # Yield the item without description, a stored job keeps its own
         item = failure.request.meta.get("item")
         if item:
             item["description"] = None
             item["was_opened"] = False
+            item["detail_failed"] = True
             yield item
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 import scrapy
+from w3lib.url import add_or_replace_parameter
 
 from ...items import JobScraperItem
 
@@ -15,6 +16,8 @@ class CitiSpider(scrapy.Spider):
     start_urls = [
         "https://jobs.citi.com/location/bogota-jobs/287/3686110-3688685-3688689/4"
     ]
+    # Hashed to skip unchanged listing pages (see ContentHashMiddleware)
+    listing_region_xpath = "//section[@id='search-results-list']//ul/li"
 
     def parse(self, response):
         """
@@ -49,9 +52,35 @@ class CitiSpider(scrapy.Spider):
 
             yield item
 
-        # Follow pagination
+        if not response.meta.get("result_page"):
+            yield from self.paginate(response)
+
+        self.logger.info("Finished parsing Citi jobs")
+
+    def paginate(self, response):
+        """
+        Request the remaining result pages from the first one.
+
+        The board reports its page count, so every page is requested at
+        once. Without it, the ``next`` link is followed page by page.
+
+        Args:
+            response: Scrapy response object of the first results page
+
+        Yields:
+            Request: Result page requests
+        """
+        total_pages = response.css("#search-results::attr(data-total-pages)").get()
+        if total_pages and total_pages.isdigit():
+            self.logger.info(f"Requesting {int(total_pages) - 1} more result pages")
+            for page in range(2, int(total_pages) + 1):
+                yield response.follow(
+                    add_or_replace_parameter(response.url, "p", str(page)),
+                    self.parse,
+                    meta={"result_page": True},
+                )
+            return
+
         next_page = response.css("a.next::attr(href)").get()
         if next_page:
             yield response.follow(next_page, self.parse)
-
-        self.logger.info("Finished parsing Citi jobs")
@@ -3,12 +3,22 @@
 from datetime import datetime
 
 import scrapy
+from lxml import etree
 
 from ...items import JobScraperItem
+from ...successfactors import clean_texts, has_class
+
+LOCATION_SUFFIX = "-desktop-section-location-value"
+DATE_SUFFIX = "-desktop-section-date-value"
 
 
 class EcopetrolSpider(scrapy.Spider):
-    """Spider for scraping job listings from Ecopetrol careers page."""
+    """
+    Spider for scraping job listings from Ecopetrol careers page.
+
+    Ecopetrol uses the SuccessFactors tile layout, where each job's location
+    and date live in elements whose ids start with the job's tile id.
+    """
 
     name = "ecopetrol"
     allowed_domains = ["jobs.ecopetrol.com.co"]
@@ -16,6 +26,15 @@ class EcopetrolSpider(scrapy.Spider):
         "https://jobs.ecopetrol.com.co/search/?createNewAlert=false&q=&locationsearch=Colombia"
     ]
 
+    # Hashed to skip unchanged listing pages (see ContentHashMiddleware)
+    listing_region_xpath = "//div[@data-focus-tile]"
+
+    _title_xpath = etree.XPath(f"//*[{has_class('jobTitle-link')}]")
+    _tile_id_xpath = etree.XPath("//div[@data-focus-tile]/@id")
+    _section_xpath = etree.XPath(
+        f"//*[contains(@id, '{LOCATION_SUFFIX}') or contains(@id, '{DATE_SUFFIX}')]"
+    )
+
     def parse(self, response):
         """
         Parse job listings from Ecopetrol careers page.
@@ -27,37 +46,36 @@ class EcopetrolSpider(scrapy.Spider):
             JobScraperItem: Job listing data
         """
         self.logger.info(f"Parsing Ecopetrol jobs from {response.url}")
+        root = response.selector.root
+
+        title_links = self._title_xpath(root)
+
+        # Extract job ID prefix (first two parts), removing duplicates in order
+        job_ids = list(
+            dict.fromkeys(
+                "-".join(tile_id.split("-")[:2])
+                for tile_id in self._tile_id_xpath(root)
+            )
+        )
+
+        # Index locations and dates by element id in a single pass
+        sections = {}
+        for element in self._section_xpath(root):
+            texts = element.xpath("text()")
+            sections[element.get("id")] = str(texts[0]) if texts else None
+
+        for link, job_id in zip(title_links, job_ids, strict=False):
+            titles = clean_texts(link.xpath("text()"))
+            location = sections.get(f"{job_id}{LOCATION_SUFFIX}")
+            date = sections.get(f"{job_id}{DATE_SUFFIX}")
 
-        job_titles = response.css(".jobTitle-link::text").getall()
-        job_links = response.css(".jobTitle-link::attr(href)").getall()
-        job_ids = response.css("div[data-focus-tile]::attr(id)").getall()
-
-        # Extract job ID prefix (first two parts)
-        job_ids = [
-            f"{job_id.split('-')[0]}-{job_id.split('-')[1]}" for job_id in job_ids
-        ]
-        job_ids = list(dict.fromkeys(job_ids))  # Remove duplicates preserving order
-
-        # Get locations and dates using job IDs
-        job_locations = [
-            response.css(f"#{job_id}-desktop-section-location-value::text").get()
-            for job_id in job_ids
-        ]
-        job_dates = [
-            response.css(f"#{job_id}-desktop-section-date-value::text").get()
-            for job_id in job_ids
-        ]
-
-        for title, link, job_id, location, date in zip(
-            job_titles, job_links, job_ids, job_locations, job_dates, strict=False
-        ):
             item = JobScraperItem()
             item["company"] = "Ecopetrol"
-            item["title"] = title.strip() if title else None
+            item["title"] = titles[0] if titles else None
             item["location"] = location.strip() if location else None
             item["date_posted"] = date.strip() if date else None
             item["job_id"] = f"ecopetrol_{job_id}"
-            item["url"] = f"https://jobs.ecopetrol.com.co{link}"
+            item["url"] = f"https://jobs.ecopetrol.com.co{link.get('href')}"
 
             item["date_extracted"] = datetime.now().isoformat()
             item["salary"] = None
@@ -66,4 +84,4 @@ class EcopetrolSpider(scrapy.Spider):
 
             yield item
 
-        self.logger.info(f"Finished parsing {len(job_titles)} Ecopetrol jobs")
+        self.logger.info(f"Finished parsing {len(title_links)} Ecopetrol jobs")
@@ -1,16 +1,22 @@
 import scrapy
 
+# Job data embedded in the page as ``phApp.ddo = {...};``
+DDO_PATTERN = r"phApp\.ddo\s*=\s*({.*?});"
+
 
 class MastercardSpider(scrapy.Spider):
     name = "mastercard"
     allowed_domains = ["careers.mastercard.com"]
     start_urls = ["https://careers.mastercard.com/us/en/bogota-colombia"]
+    # Job ids are stored without a company prefix
+    job_id_prefix = None
 
     def parse(self, response):
         import json
         from datetime import datetime
 
         from ...items import JobScraperItem
+        from ...known_jobs import follow_listings
 
         self.logger.info(
             f"User-Agent: {response.request.headers.get('User-Agent', 'N/A')}"
@@ -19,9 +25,7 @@ class MastercardSpider(scrapy.Spider):
         self.logger.info(f"Parsing {response.url}")
 
         # Extract embedded JSON from phApp.ddo variable in <script> tag
-        script_text = response.css("script").re_first(
-            r"phApp\.ddo\s*=\s*({.*?});", default=None
-        )
+        script_text = response.css("script").re_first(DDO_PATTERN, default=None)
         if script_text:
             try:
                 data = json.loads(script_text)
@@ -37,6 +41,7 @@ class MastercardSpider(scrapy.Spider):
                     if d:
                         jobs = d
                         break
+                listings = []
                 for job in jobs:
                     self.logger.info(f"Found job: {job}")
                     item = JobScraperItem()
@@ -63,12 +68,8 @@ class MastercardSpider(scrapy.Spider):
                         else None
                     )
                     self.logger.info(f"Detail URL: {detail_url}")
-                    if detail_url:
-                        yield response.follow(
-                            detail_url, self.parse_detail, cb_kwargs={"item": item}
-                        )
-                    else:
-                        yield item
+                    listings.append((item, detail_url))
+                yield from follow_listings(self, response, listings, self.parse_detail)
             except Exception as e:
                 self.logger.warning(f"Failed to parse job JSON: {e}")
         else:
@@ -80,6 +81,18 @@ class MastercardSpider(scrapy.Spider):
         if next_page:
             yield response.follow(next_page, self.parse)
 
+    def listing_region(self, response):
+        """
+        Return the embedded job JSON, hashed to skip unchanged pages.
+
+        Args:
+            response: Scrapy response object
+
+        Returns:
+            The ``phApp.ddo`` JSON text, empty if missing.
+        """
+        return response.css("script").re_first(DDO_PATTERN, default="")
+
     def parse_detail(self, response, item):
         # Try to extract the job description from the detail page
         desc = response.css(
@@ -14,6 +14,8 @@ class NequiSpider(scrapy.Spider):
     name = "nequi"
     allowed_domains = ["lapipolnequi.buk.co"]
     start_urls = ["https://lapipolnequi.buk.co/trabaja-con-nosotros"]
+    # Hashed to skip unchanged listing pages (see ContentHashMiddleware)
+    listing_region_xpath = "//a[contains(@class, 'btn-auto-responsive')]/@href"
 
     def parse(self, response):
         """
@@ -0,0 +1,246 @@
+"""
+Shared parsing for SAP SuccessFactors career sites.
+
+Several company career pages render the same SuccessFactors results table
+(``tr.data-row`` rows with ``.jobTitle-link``, ``.jobLocation`` and
+``.jobDate`` cells). ``SuccessFactorsSpider`` walks that table once with
+XPath expressions compiled per spider class, so company spiders only
+declare their URLs and field mappings. Page one's result count is used to
+request every other page at once instead of following ``next`` links.
+"""
+
+import re
+from datetime import datetime
+
+import scrapy
+from lxml import etree
+from w3lib.url import add_or_replace_parameter
+
+from jobsearchtools.job_scraper.job_scraper.items import JobScraperItem
+from jobsearchtools.job_scraper.job_scraper.known_jobs import follow_listings
+
+
+def has_class(name: str) -> str:
+    """
+    Return an XPath predicate matching elements with a CSS class.
+
+    Args:
+        name: CSS class name.
+
+    Returns:
+        XPath predicate, e.g. for use in ``//tr[...]``.
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def clean_texts(texts: list[str]) -> list[str]:
+    """
+    Strip text nodes and drop the empty ones.
+
+    Args:
+        texts: Raw text nodes returned by an XPath query.
+
+    Returns:
+        Non-empty stripped strings, in document order.
+    """
+    return [text for text in (str(t).strip() for t in texts) if text]
+
+
+class SuccessFactorsSpider(scrapy.Spider):
+    """
+    Base spider for SuccessFactors job search result pages.
+
+    Subclasses set ``name``, ``allowed_domains``, ``start_urls`` and
+    ``company``, and may override ``row_xpath`` or the ``parse_date``,
+    ``job_id_from_url`` and ``next_page`` hooks. ``next_page`` is only
+    used when a page shows no result count. Spiders that set
+    ``follow_details`` must implement ``parse_detail`` and
+    ``errback_detail``.
+    """
+
+    company: str = ""
+    row_xpath = f"//tr[{has_class('data-row')}]"
+    # Follow detail pages for descriptions instead of yielding list items
+    follow_details = False
+
+    _title_xpath = etree.XPath(f".//a[{has_class('jobTitle-link')}]/text()")
+    _link_xpath = etree.XPath(f".//a[{has_class('jobTitle-link')}]/@href")
+    _location_xpath = etree.XPath(f".//*[{has_class('jobLocation')}]/text()")
+    _date_xpath = etree.XPath(f".//span[{has_class('jobDate')}]/text()")
+    # "Results <b>1 – 25</b> of <b>134</b>"
+    _result_count_xpath = etree.XPath(
+        f"//span[{has_class('paginationLabel')}]//b/text()"
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the row expression once per spider class."""
+        super().__init_subclass__(**kwargs)
+        cls._row_xpath = etree.XPath(cls.row_xpath)
+
+    def parse(self, response):
+        """
+        Parse a page of SuccessFactors job listings.
+
+        Args:
+            response: Scrapy response object
+
+        Yields:
+            JobScraperItem, or Request for detail and pagination pages
+        """
+        self.logger.info(f"Parsing {self.company} jobs from {response.url}")
+
+        listings = list(self.parse_rows(response))
+        self.logger.info(f"Found {len(listings)} job listings")
+
+        if self.follow_details:
+            # Follow to detail pages to get descriptions, skipping stored jobs
+            yield from follow_listings(
+                self,
+                response,
+                listings,
+                self.parse_detail,
+                errback=self.errback_detail,
+            )
+        else:
+            for item, _ in listings:
+                yield item
+
+        if response.meta.get("result_page"):
+            # Scheduled together with the other pages by page one
+            return
+
+        page_urls = self.page_urls(response)
+        if page_urls:
+            self.logger.info(f"Requesting {len(page_urls)} more result pages")
+            for url in page_urls:
+                yield response.follow(
+                    url, callback=self.parse, meta={"result_page": True}
+                )
+            return
+
+        next_page = self.next_page(response)
+        if next_page:
+            self.logger.info(f"Following pagination: {next_page}")
+            yield response.follow(next_page, callback=self.parse)
+        else:
+            self.logger.info(f"Finished parsing {self.company} jobs")
+
+    def parse_rows(self, response):
+        """
+        Walk the results table once and build an item per row.
+
+        Args:
+            response: Scrapy response object
+
+        Yields:
+            Tuple of (JobScraperItem, relative job URL)
+        """
+        extracted_at = datetime.now().isoformat()
+        for row in self._row_xpath(response.selector.root):
+            titles = clean_texts(self._title_xpath(row))
+            if not titles:
+                self.logger.warning("Missing title, skipping job")
+                continue
+
+            links = self._link_xpath(row)
+            if not links:
+                self.logger.warning("Missing job URL, skipping")
+                continue
+            job_url = str(links[0])
+
+            locations = clean_texts(self._location_xpath(row))
+            dates = clean_texts(self._date_xpath(row))
+
+            item = JobScraperItem()
+            item["company"] = self.company
+            item["title"] = titles[0]
+            # Rows repeat the location for mobile layouts, the last is complete
+            item["location"] = locations[-1] if locations else None
+            item["date_posted"] = self.parse_date(dates[0]) if dates else None
+            item["url"] = response.urljoin(job_url)
+            item["job_id"] = self.job_id_from_url(job_url)
+            item["date_extracted"] = extracted_at
+            item["salary"] = None
+            item["description"] = None
+            item["was_opened"] = False
+            yield item, job_url
+
+    def listing_region(self, response) -> bytes:
+        """
+        Return the result rows, hashed to skip unchanged pages.
+
+        Args:
+            response: Scrapy response object
+
+        Returns:
+            Serialized result rows of the page.
+        """
+        return b"".join(
+            etree.tostring(row) for row in self._row_xpath(response.selector.root)
+        )
+
+    def parse_date(self, date_str: str) -> str | None:
+        """
+        Convert a listing date to the stored format.
+
+        Args:
+            date_str: Stripped date text of the row.
+
+        Returns:
+            Date string for the ``date_posted`` field.
+        """
+        return date_str
+
+    def job_id_from_url(self, job_url: str) -> str:
+        """
+        Build the job id from a listing URL.
+
+        Args:
+            job_url: Relative job URL, e.g. ``/job/Bogota-Analyst/1234/``.
+
+        Returns:
+            Job id prefixed with the spider name.
+        """
+        return f"{self.name}_{job_url.rstrip('/').split('/')[-1]}"
+
+    def page_urls(self, response) -> list[str]:
+        """
+        Build the URLs of all result pages after the first.
+
+        SuccessFactors pages by ``startrow`` offsets, and the pagination
+        label shows the rows on the page and the total.
+
+        Args:
+            response: Scrapy response object of the first results page.
+
+        Returns:
+            URLs of the remaining pages, empty if the page shows no count.
+        """
+        # Drop thousands separators, e.g. "1.250"
+        counts = [
+            re.sub(r"[.,]", "", text)
+            for text in clean_texts(self._result_count_xpath(response.selector.root))
+        ]
+        rows = len(counts) >= 2 and re.fullmatch(r"(\d+)\D+(\d+)", counts[0])
+        if not rows or not counts[-1].isdigit():
+            return []
+        first, last, total = int(rows[1]), int(rows[2]), int(counts[-1])
+        page_size = last - first + 1
+        if first != 1 or page_size < 1:
+            return []
+        return [
+            add_or_replace_parameter(response.url, "startrow", str(offset))
+            for offset in range(page_size, total, page_size)
+        ]
+
+    def next_page(self, response) -> str | None:
+        """
+        Return the URL of the next results page, if any.
+
+        Args:
+            response: Scrapy response object
+
+        Returns:
+            Next page URL, or None to stop paginating.
+        """
+        return None
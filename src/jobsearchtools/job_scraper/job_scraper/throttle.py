@@ -0,0 +1,161 @@
+"""
+Per-host politeness budgets with latency feedback.
+
+Every host gets a policy: how many requests may run at once, the delay
+range between requests and the response time it should stay under.
+Policies come from ``DOMAIN_THROTTLE_POLICIES``, other hosts use the
+project-wide concurrency and delay. ``DomainThrottleExtension`` then moves
+each host's delay within its range, in the spirit of Scrapy's AutoThrottle:
+fast hosts are crawled at their concurrency, slow ones are slowed down,
+and 429/503 answers double the delay.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+logger = logging.getLogger(__name__)
+
+# Statuses servers use to ask clients to slow down
+THROTTLE_STATUSES = (429, 503)
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """Politeness budget of one host."""
+
+    concurrency: int
+    min_delay: float
+    max_delay: float
+    target_latency: float
+
+
+def next_delay(
+    policy: HostPolicy, delay: float, latency: float, status: int, retry_after=None
+) -> float:
+    """
+    Compute a host's delay after a response.
+
+    Args:
+        policy: Budget of the host.
+        delay: Current delay between requests, in seconds.
+        latency: Time the response took, in seconds.
+        status: HTTP status of the response.
+        retry_after: ``Retry-After`` seconds sent with a 429/503, if any.
+
+    Returns:
+        New delay, within the policy's range.
+    """
+    if status in THROTTLE_STATUSES:
+        # Back off hard, honouring the server's own estimate
+        new_delay = max(delay * 2, policy.min_delay, 1.0, retry_after or 0)
+    else:
+        # N requests of `latency` seconds in parallel need one every latency/N
+        target_delay = latency / policy.concurrency
+        if latency > policy.target_latency:
+            target_delay *= latency / policy.target_latency
+        new_delay = max(target_delay, (delay + target_delay) / 2)
+        # Error pages are small and fast, never speed up because of them
+        if status != 200 and new_delay < delay:
+            new_delay = delay
+    return min(max(policy.min_delay, new_delay), policy.max_delay)
+
+
+class DomainThrottleExtension:
+    """
+    Scrapy extension adapting each host's download delay.
+
+    The effective delay of every host is kept in the
+    ``throttle/<host>/delay`` stat, 429/503 answers are counted in
+    ``throttle/<host>/throttled_count``.
+    """
+
+    def __init__(self, crawler, policies: dict[str, HostPolicy], default: HostPolicy):
+        """
+        Initialize the extension.
+
+        Args:
+            crawler: Scrapy crawler instance.
+            policies: Budgets by host.
+            default: Budget of hosts without a policy.
+        """
+        self.crawler = crawler
+        self.stats = crawler.stats
+        self.policies = policies
+        self.default = default
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        """
+        Factory method called by Scrapy to create the extension.
+
+        Args:
+            crawler: Scrapy crawler instance.
+
+        Returns:
+            Instance of DomainThrottleExtension.
+        """
+        settings = crawler.settings
+        if not settings.getbool("DOMAIN_THROTTLE_ENABLED"):
+            raise NotConfigured("Domain throttle is disabled")
+        if settings.getbool("AUTOTHROTTLE_ENABLED"):
+            raise NotConfigured("AutoThrottle already adapts download delays")
+
+        default = HostPolicy(
+            concurrency=settings.getint("CONCURRENT_REQUESTS_PER_DOMAIN"),
+            min_delay=settings.getfloat("DOWNLOAD_DELAY"),
+            max_delay=settings.getfloat("DOMAIN_THROTTLE_MAX_DELAY"),
+            target_latency=settings.getfloat("DOMAIN_THROTTLE_TARGET_LATENCY"),
+        )
+        policies = {
+            host: HostPolicy(**policy)
+            for host, policy in settings.getdict("DOMAIN_THROTTLE_POLICIES").items()
+        }
+        ext = cls(crawler, policies, default)
+        crawler.signals.connect(
+            ext.response_downloaded, signal=signals.response_downloaded
+        )
+        return ext
+
+    def response_downloaded(self, response, request, spider):
+        """
+        Called when a response arrives. Adjusts the delay of its host.
+
+        Args:
+            response: The downloaded response.
+            request: The request that was downloaded.
+            spider: The spider that sent the request.
+        """
+        key = request.meta.get("download_slot")
+        latency = request.meta.get("download_latency")
+        if key is None or latency is None:
+            return
+        slot = self.crawler.engine.downloader.slots.get(key)
+        if slot is None:
+            return
+
+        policy = self.policies.get(key, self.default)
+        retry_after = response.headers.get(b"Retry-After", b"").decode()
+        old_delay = slot.delay
+        slot.delay = next_delay(
+            policy,
+            slot.delay,
+            latency,
+            response.status,
+            float(retry_after) if retry_after.isdigit() else None,
+        )
+
+        if response.status in THROTTLE_STATUSES:
+            self.stats.inc_value(f"throttle/{key}/throttled_count")
+            logger.warning(
+                f"{key} answered {response.status}, delay raised to {slot.delay:.2f}s"
+            )
+        elif slot.delay != old_delay:
+            logger.debug(
+                f"{key} delay {old_delay:.2f}s -> {slot.delay:.2f}s "
+                f"(latency {latency:.2f}s)"
+            )
+        self.stats.set_value(f"throttle/{key}/delay", round(slot.delay, 3))
+        self.stats.max_value(f"throttle/{key}/latency_max", round(latency, 3))
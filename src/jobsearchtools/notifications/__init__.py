@@ -1,5 +1,18 @@
 """Notification modules for JobSearchTools."""
 
 from jobsearchtools.notifications.email_notifier import EmailNotifier, email_notifier
+from jobsearchtools.notifications.queue import (
+    NotificationDispatcher,
+    NotificationQueue,
+    notification_dispatcher,
+    notification_queue,
+)
 
-__all__ = ["EmailNotifier", "email_notifier"]
+__all__ = [
+    "EmailNotifier",
+    "NotificationDispatcher",
+    "NotificationQueue",
+    "email_notifier",
+    "notification_dispatcher",
+    "notification_queue",
+]
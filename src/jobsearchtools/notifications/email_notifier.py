@@ -2,30 +2,172 @@
 Email notification system for new job listings.
 
 Sends email alerts when new jobs are discovered during spider runs.
-Supports HTML-formatted emails with job details and links.
+Supports HTML-formatted emails with job details and links. The SMTP
+session is kept open between sends, so STARTTLS and login are paid once
+per session instead of once per message.
 """
 
+import io
 import logging
 import smtplib
+import threading
+import time
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any
+from itertools import groupby
+from typing import Any, TextIO
 
+from jobsearchtools.config.lazy import Lazy
 from jobsearchtools.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+EMAIL_STYLE = """    <style>
+        body {
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        .header {
+            background-color: #4CAF50;
+            color: white;
+            padding: 20px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+        }
+        .job-card {
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            padding: 15px;
+            margin-bottom: 15px;
+            background-color: #f9f9f9;
+        }
+        .job-title {
+            color: #2196F3;
+            font-size: 18px;
+            font-weight: bold;
+            margin-bottom: 10px;
+        }
+        .job-details {
+            margin: 10px 0;
+        }
+        .job-label {
+            font-weight: bold;
+            color: #555;
+        }
+        .apply-button {
+            display: inline-block;
+            background-color: #4CAF50;
+            color: white;
+            padding: 10px 20px;
+            text-decoration: none;
+            border-radius: 5px;
+            margin-top: 10px;
+        }
+        .footer {
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            color: #777;
+            font-size: 12px;
+        }
+    </style>
+"""
+
+# Static parts of the email page, built once and streamed around the cards
+PAGE_START = f"""
+<!DOCTYPE html>
+<html>
+<head>
+{EMAIL_STYLE}</head>
+<body>
+    <div class="header">"""
+
+HEADER_END = """    </div>
+"""
+
+PAGE_END = """
+    <div class="footer">
+        <p>This is an automated notification from JobSearchTools.</p>
+        <p>To unsubscribe or modify settings, update your environment variables.</p>
+    </div>
+</body>
+</html>
+"""
+
+EMAIL_HEADER = """
+        <h1>🎯 New Job Listings Found!</h1>
+        <p><strong>{count}</strong> new position(s) at
+        <strong>{company}</strong></p>
+        <p>Spider: {spider} | Time: {time}</p>
+"""
+
+DIGEST_HEADER = """
+        <h1>🎯 New Job Listings Digest</h1>
+        <p><strong>{total}</strong> new position(s) at
+        <strong>{companies}</strong> companies</p>
+        <p>Time: {time}</p>
+"""
+
+COMPANY_HEADING = """
+    <h2>{company} ({count})</h2>
+"""
+
+JOB_CARD = """
+    <div class="job-card">
+        <div class="job-title">{title}</div>
+        <div class="job-details">
+            <span class="job-label">📍 Location:</span> {location}<br>
+            <span class="job-label">💰 Salary:</span> {salary}<br>
+            <span class="job-label">📅 Posted:</span> {date_posted}<br>
+        </div>
+"""
+
+JOB_DESCRIPTION = """
+        <div class="job-details">
+            <span class="job-label">📝 Description:</span><br>
+            {description}
+        </div>
+"""
+
+JOB_CARD_END = """
+        <a href="{url}" class="apply-button">Apply Now →</a>
+    </div>
+"""
+
+MORE_JOBS = """
+    <p><strong>+{omitted} more</strong> new position(s) not shown.</p>
+"""
+
 
 class EmailNotifier:
     """
     Email notification service for job listings.
 
-    Sends formatted email alerts with new job information.
+    Sends formatted email alerts with new job information. One
+    authenticated SMTP session is reused across sends. It is checked with
+    NOOP after ``EMAIL_SMTP_KEEPALIVE_INTERVAL`` idle seconds, closed after
+    ``EMAIL_SMTP_IDLE_TIMEOUT`` and reopened when the server dropped it.
     """
 
     def __init__(self):
         """Initialize the email notifier with settings."""
+        self._session: smtplib.SMTP | None = None
+        self._session_used_at = 0.0
+        self._session_messages = 0
+        self._session_lock = threading.Lock()
+        # Reuse counters, see ``sends_per_session``
+        self.session_stats = {
+            "sessions": 0,
+            "messages": 0,
+            "reconnects": 0,
+            "handshake_seconds": 0.0,
+        }
+
         self.enabled = settings.email.enabled
         if not self.enabled:
             logger.info("Email notifications are disabled")
@@ -58,45 +200,232 @@ class EmailNotifier:
             logger.debug("No new jobs to notify about")
             return False
 
-        try:
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = f"New Job Listings Found - {spider_name.upper()}"
-            msg["From"] = str(settings.email.from_address)
-            msg["To"] = str(settings.email.to_address)
-
-            # Create HTML content
-            html_content = self._generate_html_email(jobs, spider_name)
-            html_part = MIMEText(html_content, "html")
-            msg.attach(html_part)
-
-            # Send email
-            with smtplib.SMTP(
-                settings.email.smtp_host, settings.email.smtp_port
-            ) as server:
-                if settings.email.use_tls:
-                    server.starttls()
-
-                server.login(settings.email.smtp_user, settings.email.smtp_password)
-                server.sendmail(
-                    str(settings.email.from_address),
-                    str(settings.email.to_address),
-                    msg.as_string(),
-                )
-
-            logger.info(
-                f"Email notification sent successfully for {len(jobs)} new jobs"
+        msg = self._build_message(
+            f"New Job Listings Found - {spider_name.upper()}",
+            self._generate_html_email(jobs, spider_name),
+        )
+        if not self._send_messages([msg]):
+            return False
+
+        logger.info(f"Email notification sent successfully for {len(jobs)} new jobs")
+        return True
+
+    def send_digest(self, jobs_by_spider: dict[str, list[dict[str, Any]]]) -> bool:
+        """
+        Send the new jobs of a whole scheduler cycle as a digest.
+
+        Jobs are grouped by company. Each message holds at most
+        ``EMAIL_DIGEST_MAX_JOBS`` jobs. With ``EMAIL_DIGEST_SPLIT`` the rest
+        spill into further messages sent over the same SMTP session,
+        otherwise the digest ends with a count of the jobs left out.
+
+        Args:
+            jobs_by_spider: New jobs keyed by the spider that found them.
+
+        Returns:
+            True if every message was sent, False otherwise.
+        """
+        if not self.enabled:
+            logger.debug("Email notifications disabled, skipping")
+            return False
+
+        jobs = [job for spider_jobs in jobs_by_spider.values() for job in spider_jobs]
+        if not jobs:
+            logger.debug("No new jobs to notify about")
+            return False
+
+        # Stable sort keeps each company's jobs in the order they were found
+        jobs.sort(key=lambda job: job.get("company") or "Unknown")
+        cap = settings.email.digest_max_jobs
+        if settings.email.digest_split:
+            parts = [jobs[i : i + cap] for i in range(0, len(jobs), cap)]
+        else:
+            parts = [jobs[:cap]]
+        omitted = len(jobs) - sum(len(part) for part in parts)
+        companies = len({job.get("company") or "Unknown" for job in jobs})
+
+        messages = []
+        for number, part in enumerate(parts, start=1):
+            subject = (
+                f"New Job Listings Digest - {len(jobs)} jobs at {companies} companies"
             )
-            return True
+            if len(parts) > 1:
+                subject += f" ({number}/{len(parts)})"
+            html = self._generate_digest_html(part, len(jobs), companies, omitted)
+            messages.append(self._build_message(subject, html))
 
-        except Exception as e:
-            logger.error(f"Failed to send email notification: {e}")
+        if not self._send_messages(messages):
             return False
 
+        logger.info(
+            f"Digest sent for {len(jobs)} new jobs in {len(messages)} message(s)"
+        )
+        return True
+
+    def _build_message(self, subject: str, html_content: str) -> MIMEMultipart:
+        """
+        Build an HTML email to the configured recipient.
+
+        Args:
+            subject: Email subject.
+            html_content: HTML body.
+
+        Returns:
+            The email message.
+        """
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = str(settings.email.from_address)
+        msg["To"] = str(settings.email.to_address)
+        msg.attach(MIMEText(html_content, "html"))
+        return msg
+
+    @property
+    def sends_per_session(self) -> float:
+        """Average messages sent per SMTP session opened."""
+        sessions = self.session_stats["sessions"]
+        return self.session_stats["messages"] / sessions if sessions else 0.0
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Close the SMTP session, if one is open.
+
+        Args:
+            timeout: Seconds to wait for a send in progress, defaults to
+                ``EMAIL_SMTP_TIMEOUT``.
+
+        Returns:
+            False if a send still held the session after the timeout, in
+            which case the session is left to that send.
+        """
+        if timeout is None:
+            timeout = settings.email.smtp_timeout
+        if not self._session_lock.acquire(timeout=timeout):
+            logger.warning("SMTP session still in use, not closing it")
+            return False
+        try:
+            self._close_session()
+        finally:
+            self._session_lock.release()
+        return True
+
+    def _send_messages(self, messages: list[MIMEMultipart]) -> bool:
+        """
+        Send messages over the shared SMTP session.
+
+        Args:
+            messages: Messages to send.
+
+        Returns:
+            True if all messages were sent, False otherwise.
+        """
+        with self._session_lock:
+            try:
+                for msg in messages:
+                    self._sendmail(msg)
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to send email notification: {e}")
+                self._close_session()
+                return False
+
+    def _sendmail(self, msg: MIMEMultipart) -> None:
+        """
+        Send one message, reconnecting once if the server dropped the session.
+
+        Args:
+            msg: Message to send.
+        """
+        args = (
+            str(settings.email.from_address),
+            str(settings.email.to_address),
+            msg.as_string(),
+        )
+        try:
+            self._get_session().sendmail(*args)
+        except smtplib.SMTPServerDisconnected:
+            logger.info("SMTP session was closed by the server, reconnecting")
+            self.session_stats["reconnects"] += 1
+            self._close_session()
+            self._get_session().sendmail(*args)
+
+        self._session_messages += 1
+        self.session_stats["messages"] += 1
+        self._session_used_at = time.monotonic()
+
+    def _get_session(self) -> smtplib.SMTP:
+        """
+        Return a live SMTP session, opening a new one if needed.
+
+        Returns:
+            Connected and authenticated SMTP client.
+        """
+        if self._session is not None:
+            idle = time.monotonic() - self._session_used_at
+            if idle > settings.email.smtp_idle_timeout:
+                self._close_session()
+            elif idle > settings.email.smtp_keepalive_interval and not self._noop():
+                logger.info("SMTP session failed its keepalive check, reconnecting")
+                self.session_stats["reconnects"] += 1
+                self._close_session()
+
+        if self._session is None:
+            self._session = self._connect()
+        return self._session
+
+    def _noop(self) -> bool:
+        """Return whether the open session still answers NOOP."""
+        try:
+            return self._session.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new SMTP session."""
+        started = time.perf_counter()
+        server = smtplib.SMTP(
+            settings.email.smtp_host,
+            settings.email.smtp_port,
+            timeout=settings.email.smtp_timeout,
+        )
+        try:
+            if settings.email.use_tls:
+                server.starttls()
+            server.login(settings.email.smtp_user, settings.email.smtp_password)
+        except Exception:
+            server.close()
+            raise
+
+        handshake = time.perf_counter() - started
+        self.session_stats["sessions"] += 1
+        self.session_stats["handshake_seconds"] += handshake
+        self._session_messages = 0
+        self._session_used_at = time.monotonic()
+        logger.debug(f"Opened SMTP session in {handshake:.2f}s")
+        return server
+
+    def _close_session(self) -> None:
+        """Quit the open SMTP session, if any."""
+        if self._session is None:
+            return
+        try:
+            self._session.quit()
+        except (smtplib.SMTPException, OSError):
+            self._session.close()
+        logger.debug(
+            f"Closed SMTP session after {self._session_messages} messages "
+            f"({self.sends_per_session:.1f} messages per session overall)"
+        )
+        self._session = None
+
     def _generate_html_email(self, jobs: list[dict[str, Any]], spider_name: str) -> str:
         """
         Generate HTML-formatted email content.
 
+        At most ``EMAIL_MAX_JOBS`` job cards are rendered, followed by a
+        count of the jobs left out.
+
         Args:
             jobs: List of job dictionaries.
             spider_name: Name of the spider.
@@ -106,117 +435,96 @@ class EmailNotifier:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         company = jobs[0].get("company", "Unknown") if jobs else "Unknown"
+        shown = jobs[: settings.email.max_jobs]
 
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .header {{
-            background-color: #4CAF50;
-            color: white;
-            padding: 20px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }}
-        .job-card {{
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            padding: 15px;
-            margin-bottom: 15px;
-            background-color: #f9f9f9;
-        }}
-        .job-title {{
-            color: #2196F3;
-            font-size: 18px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        .job-details {{
-            margin: 10px 0;
-        }}
-        .job-label {{
-            font-weight: bold;
-            color: #555;
-        }}
-        .apply-button {{
-            display: inline-block;
-            background-color: #4CAF50;
-            color: white;
-            padding: 10px 20px;
-            text-decoration: none;
-            border-radius: 5px;
-            margin-top: 10px;
-        }}
-        .footer {{
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            color: #777;
-            font-size: 12px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🎯 New Job Listings Found!</h1>
-        <p><strong>{len(jobs)}</strong> new position(s) at
-        <strong>{company}</strong></p>
-        <p>Spider: {spider_name} | Time: {timestamp}</p>
-    </div>
-"""
+        out = io.StringIO()
+        out.write(PAGE_START)
+        out.write(
+            EMAIL_HEADER.format(
+                count=len(jobs), company=company, spider=spider_name, time=timestamp
+            )
+        )
+        out.write(HEADER_END)
+        for job in shown:
+            self._write_job_card(out, job)
+        self._write_page_end(out, len(jobs) - len(shown))
+        return out.getvalue()
+
+    def _generate_digest_html(
+        self,
+        jobs: list[dict[str, Any]],
+        total: int,
+        companies: int,
+        omitted: int = 0,
+    ) -> str:
+        """
+        Generate the HTML of one digest message.
 
-        for job in jobs:
-            title = job.get("title", "No Title")
-            location = job.get("location", "N/A")
-            salary = job.get("salary", "Not specified")
-            url = job.get("url", "#")
-            date_posted = job.get("date_posted", "N/A")
+        Args:
+            jobs: Jobs of this message, sorted by company.
+            total: New jobs in the whole cycle.
+            companies: Companies with new jobs in the whole cycle.
+            omitted: Jobs left out of the digest by the size cap.
 
+        Returns:
+            HTML string for email body.
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        out = io.StringIO()
+        out.write(PAGE_START)
+        out.write(
+            DIGEST_HEADER.format(total=total, companies=companies, time=timestamp)
+        )
+        out.write(HEADER_END)
+        for company, company_jobs in groupby(
+            jobs, key=lambda job: job.get("company") or "Unknown"
+        ):
+            company_jobs = list(company_jobs)
+            out.write(COMPANY_HEADING.format(company=company, count=len(company_jobs)))
+            for job in company_jobs:
+                self._write_job_card(out, job)
+        self._write_page_end(out, omitted)
+        return out.getvalue()
+
+    def _write_job_card(self, out: TextIO, job: dict[str, Any]) -> None:
+        """
+        Write the HTML card of one job.
+
+        Args:
+            out: Stream the email body is written to.
+            job: Job dictionary.
+        """
+        out.write(
+            JOB_CARD.format(
+                title=job.get("title", "No Title"),
+                location=job.get("location", "N/A"),
+                salary=job.get("salary", "Not specified"),
+                date_posted=job.get("date_posted", "N/A"),
+            )
+        )
+
+        description = job.get("description", "No description available")
+        if description and description != "No description available":
             # Truncate description if too long
-            description = job.get("description", "No description available")
-            if description and len(description) > 300:
+            if len(description) > 300:
                 description = description[:300] + "..."
+            out.write(JOB_DESCRIPTION.format(description=description))
 
-            html += f"""
-    <div class="job-card">
-        <div class="job-title">{title}</div>
-        <div class="job-details">
-            <span class="job-label">📍 Location:</span> {location}<br>
-            <span class="job-label">💰 Salary:</span> {salary}<br>
-            <span class="job-label">📅 Posted:</span> {date_posted}<br>
-        </div>
-"""
-            if description and description != "No description available":
-                html += f"""
-        <div class="job-details">
-            <span class="job-label">📝 Description:</span><br>
-            {description}
-        </div>
-"""
-            html += f"""
-        <a href="{url}" class="apply-button">Apply Now →</a>
-    </div>
-"""
+        out.write(JOB_CARD_END.format(url=job.get("url", "#")))
 
-        html += """
-    <div class="footer">
-        <p>This is an automated notification from JobSearchTools.</p>
-        <p>To unsubscribe or modify settings, update your environment variables.</p>
-    </div>
-</body>
-</html>
-"""
-        return html
+    def _write_page_end(self, out: TextIO, omitted: int = 0) -> None:
+        """
+        Write the count of jobs left out, if any, and the page footer.
+
+        Args:
+            out: Stream the email body is written to.
+            omitted: Jobs not rendered because of a size cap.
+        """
+        if omitted:
+            out.write(MORE_JOBS.format(omitted=omitted))
+        out.write(PAGE_END)
 
 
-# Global notifier instance
-email_notifier = EmailNotifier()
+# Global notifier, a proxy building the EmailNotifier on first attribute access
+email_notifier: Lazy[EmailNotifier] = Lazy(EmailNotifier)
@@ -0,0 +1,401 @@
+"""
+Persistent queue of email notifications.
+
+Spiders used to send their notification from ``spider_closed``, so a slow
+or unreachable SMTP server held up the end of every crawl. Notifications
+are now written to a bounded queue under ``settings.data_dir`` and a
+``NotificationDispatcher`` thread delivers them in the background, retrying
+failed deliveries with exponential backoff. Queued notifications survive
+restarts, and each one is claimed by renaming its file, so several
+processes may drain the same queue without sending a message twice. A
+claim is refreshed while its message is being sent and only taken over
+once its owner stopped refreshing it, i.e. died.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+
+from jobsearchtools.config.lazy import Lazy
+from jobsearchtools.config.settings import settings
+from jobsearchtools.notifications.email_notifier import EmailNotifier, email_notifier
+
+logger = logging.getLogger(__name__)
+
+# How often a claim being delivered is refreshed
+CLAIM_HEARTBEAT = 15.0
+# Claims not refreshed for this long belong to a process that died
+CLAIM_TIMEOUT = 120.0
+
+
+class NotificationQueue:
+    """
+    Notifications stored as one JSON file each in a directory.
+
+    Pending entries are ``<created_ns>-<id>.json`` files, so sorting their
+    names gives the order they were queued in. A sender claims an entry by
+    renaming it to ``.sending`` and keeps its mtime fresh with ``hold``
+    while sending, and entries that ran out of attempts, or were dropped
+    because the queue was full, are moved to ``failed/``.
+    """
+
+    def __init__(self, directory: Path, max_size: int):
+        """
+        Initialize the queue.
+
+        Args:
+            directory: Directory holding the queue. Created on first use.
+            max_size: Pending entries kept before the oldest are dropped.
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        """Return the number of pending entries."""
+        return len(self._pending())
+
+    def put(self, kind: str, payload: dict[str, Any]) -> Path:
+        """
+        Queue a notification.
+
+        If the queue is full the oldest pending entries are moved to
+        ``failed/`` to make room.
+
+        Args:
+            kind: Notification type, e.g. ``new_jobs`` or ``digest``.
+            payload: JSON-serializable arguments of the notification.
+
+        Returns:
+            Path of the queued entry.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        pending = self._pending()
+        for path in pending[: max(0, len(pending) - self.max_size + 1)]:
+            logger.warning(f"Notification queue full, dropping {path.name}")
+            self._move_to_failed(path)
+
+        path = self.directory / f"{time.time_ns()}-{uuid.uuid4().hex[:8]}.json"
+        entry = {
+            "kind": kind,
+            "payload": payload,
+            "attempts": 0,
+            "next_attempt_at": time.time(),
+            "last_error": None,
+        }
+        self._write(path, entry)
+        return path
+
+    def claim(self, now: float | None = None) -> tuple[Path, dict[str, Any]] | None:
+        """
+        Take the oldest entry that is due for delivery.
+
+        Args:
+            now: Current UNIX time, defaults to ``time.time()``.
+
+        Returns:
+            Tuple of (claimed path, entry), or None if nothing is due.
+        """
+        now = time.time() if now is None else now
+        self._release_stale_claims(now)
+        for path in self._pending():
+            try:
+                with path.open(encoding="utf-8") as f:
+                    entry = json.load(f)
+            except FileNotFoundError:  # Claimed by another process
+                continue
+            except (OSError, ValueError) as e:
+                logger.warning(f"Dropping unreadable notification {path.name}: {e}")
+                self._move_to_failed(path)
+                continue
+            if entry.get("next_attempt_at", 0) > now:
+                continue
+
+            claimed = path.with_suffix(".sending")
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+            # Refresh the mtime, which marks when the claim was taken
+            os.utime(claimed)
+            return claimed, entry
+        return None
+
+    @contextmanager
+    def hold(self, claimed: Path) -> Iterator[None]:
+        """
+        Keep a claim fresh while its entry is delivered.
+
+        A background thread touches the claimed file every
+        ``CLAIM_HEARTBEAT`` seconds, so a slow send is never mistaken for
+        one whose process died.
+
+        Args:
+            claimed: Path returned by ``claim``.
+        """
+        done = threading.Event()
+
+        def heartbeat() -> None:
+            while not done.wait(CLAIM_HEARTBEAT):
+                with suppress(FileNotFoundError):
+                    os.utime(claimed)
+
+        thread = threading.Thread(
+            target=heartbeat, name="notification-claim-heartbeat", daemon=True
+        )
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def complete(self, claimed: Path) -> None:
+        """
+        Remove a delivered entry.
+
+        Args:
+            claimed: Path returned by ``claim``.
+        """
+        claimed.unlink(missing_ok=True)
+
+    def retry(self, claimed: Path, entry: dict[str, Any], delay: float) -> None:
+        """
+        Put a claimed entry back to be delivered again later.
+
+        Args:
+            claimed: Path returned by ``claim``.
+            entry: Entry with its updated attempt count.
+            delay: Seconds until the next attempt.
+        """
+        entry["next_attempt_at"] = time.time() + delay
+        self._write(claimed.with_suffix(".json"), entry)
+        claimed.unlink(missing_ok=True)
+
+    def fail(self, claimed: Path, entry: dict[str, Any]) -> None:
+        """
+        Give up on a claimed entry, keeping it in ``failed/``.
+
+        Args:
+            claimed: Path returned by ``claim``.
+            entry: Entry with its last error.
+        """
+        self._write(claimed, entry)
+        self._move_to_failed(claimed)
+
+    def _pending(self) -> list[Path]:
+        """Return pending entries, oldest first."""
+        return sorted(self.directory.glob("*.json"))
+
+    def _release_stale_claims(self, now: float) -> None:
+        """Return entries claimed by a process that died to the queue."""
+        for claimed in self.directory.glob("*.sending"):
+            try:
+                if now - claimed.stat().st_mtime < CLAIM_TIMEOUT:
+                    continue
+                os.rename(claimed, claimed.with_suffix(".json"))
+            except FileNotFoundError:
+                continue
+            logger.warning(f"Releasing stale notification claim {claimed.name}")
+
+    def _move_to_failed(self, path: Path) -> None:
+        """Move an entry to the ``failed/`` directory."""
+        failed_dir = self.directory / "failed"
+        failed_dir.mkdir(exist_ok=True)
+        with suppress(FileNotFoundError):
+            os.replace(path, failed_dir / path.with_suffix(".json").name)
+
+    def _write(self, path: Path, entry: dict[str, Any]) -> None:
+        """Write an entry atomically, so readers never see a partial file."""
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            # Scraped items may hold values JSON has no type for
+            json.dump(entry, f, separators=(",", ":"), default=str)
+        os.replace(tmp_path, path)
+
+
+class NotificationDispatcher:
+    """
+    Background thread delivering queued notifications.
+
+    A failed delivery is retried after ``retry_backoff`` seconds, doubling
+    up to ``max_backoff``, until ``max_attempts`` deliveries failed.
+    """
+
+    def __init__(
+        self,
+        queue: NotificationQueue,
+        notifier: EmailNotifier,
+        max_attempts: int = 8,
+        retry_backoff: float = 30.0,
+        max_backoff: float = 3600.0,
+        poll_interval: float = 5.0,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            queue: Queue to drain.
+            notifier: Notifier that sends the emails.
+            max_attempts: Delivery attempts before an entry fails.
+            retry_backoff: Delay before the first retry (seconds).
+            max_backoff: Longest delay between retries (seconds).
+            poll_interval: Seconds between checks of an empty queue.
+        """
+        self.queue = queue
+        self.notifier = notifier
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread, unless it is already running."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="notification-dispatcher", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Notification dispatcher started on {self.queue.directory}")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop the worker thread after its current delivery.
+
+        Undelivered entries stay queued for the next start, and the
+        notifier's SMTP session is closed. If the thread is still sending
+        when the timeout expires, the session is left to it, the SMTP
+        timeout bounds how long it can hang.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("Notification dispatcher still sending, not waiting")
+                return
+        self._thread = None
+        self.notifier.close()
+
+    def notify(self) -> None:
+        """Wake the worker thread to deliver newly queued entries."""
+        self._wake.set()
+
+    def dispatch_pending(self) -> int:
+        """
+        Try to deliver every entry that is due.
+
+        Returns:
+            Number of notifications delivered.
+        """
+        delivered = 0
+        while not self._stop.is_set():
+            claim = self.queue.claim()
+            if claim is None:
+                break
+            delivered += self._deliver(*claim)
+        return delivered
+
+    def backoff(self, attempts: int) -> float:
+        """
+        Return the delay before the next attempt.
+
+        Args:
+            attempts: Failed attempts so far.
+
+        Returns:
+            Delay in seconds.
+        """
+        return min(self.retry_backoff * 2 ** (attempts - 1), self.max_backoff)
+
+    def _deliver(self, claimed: Path, entry: dict[str, Any]) -> bool:
+        """Send one claimed entry and update the queue with the outcome."""
+        kind = entry.get("kind")
+        payload = entry.get("payload", {})
+        try:
+            with self.queue.hold(claimed):
+                if kind == "new_jobs":
+                    sent = self.notifier.send_new_jobs_notification(
+                        payload["jobs"], payload["spider_name"]
+                    )
+                elif kind == "digest":
+                    sent = self.notifier.send_digest(payload["jobs_by_spider"])
+                else:
+                    raise ValueError(f"Unknown notification type {kind!r}")
+            error = None if sent else "delivery failed"
+        except Exception as e:
+            sent, error = False, f"{type(e).__name__}: {e}"
+
+        if sent:
+            self.queue.complete(claimed)
+            return True
+
+        entry["attempts"] = entry.get("attempts", 0) + 1
+        entry["last_error"] = error
+        if entry["attempts"] >= self.max_attempts:
+            logger.error(
+                f"Giving up on notification {claimed.stem} after "
+                f"{entry['attempts']} attempts: {error}"
+            )
+            self.queue.fail(claimed, entry)
+        else:
+            delay = self.backoff(entry["attempts"])
+            logger.warning(
+                f"Notification {claimed.stem} failed ({error}), "
+                f"retrying in {delay:.0f}s"
+            )
+            self.queue.retry(claimed, entry, delay)
+        return False
+
+    def _run(self) -> None:
+        """Deliver due entries until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.dispatch_pending()
+            except Exception as e:
+                logger.error(f"Notification dispatcher error: {e}", exc_info=True)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+
+def _create_queue() -> NotificationQueue:
+    """Build the queue under the configured data directory."""
+    return NotificationQueue(
+        settings.data_dir / "notification_queue", settings.email.queue_max_size
+    )
+
+
+def _create_dispatcher() -> NotificationDispatcher:
+    """Build the dispatcher of the global queue and notifier."""
+    return NotificationDispatcher(
+        notification_queue.resolve(),
+        email_notifier.resolve(),
+        max_attempts=settings.email.queue_max_attempts,
+        retry_backoff=settings.email.queue_retry_backoff,
+        max_backoff=settings.email.queue_max_backoff,
+        poll_interval=settings.email.queue_poll_interval,
+    )
+
+
+# Global instances, proxies building the objects on first attribute access
+notification_queue: Lazy[NotificationQueue] = Lazy(_create_queue)
+notification_dispatcher: Lazy[NotificationDispatcher] = Lazy(_create_dispatcher)
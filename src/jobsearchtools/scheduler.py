@@ -4,21 +4,216 @@ Scheduler service for running spiders at regular intervals.
 Uses APScheduler to run all configured spiders every N hours.
 Supports graceful shutdown and error handling.
 Implements persistent scheduling to handle container restarts and PC shutdowns.
+Each cycle runs in fresh worker processes, because Twisted's reactor cannot
+be restarted and crawl memory should be released after every cycle.
+Spiders are split across several workers so they can use more than one core.
+Optionally, each spider gets its own interval that adapts to how often its
+board publishes new jobs, and the spiders due at each check run together
+in one cycle. Email notifications queued by the workers are
+delivered by a background thread of the scheduler process.
 """
 
-import contextlib
 import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import shutil
 import sys
+import threading
+import time
+import uuid
 from datetime import UTC, datetime, timedelta
-
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from scrapy.crawler import CrawlerProcess
+from pathlib import Path
+from typing import Any
 
 from jobsearchtools.config.settings import settings
+from jobsearchtools.job_scraper.job_scraper.cache import JsonFileStore
+from jobsearchtools.job_scraper.job_scraper.spider_registry import available_spiders
+from jobsearchtools.notifications.email_notifier import email_notifier
+from jobsearchtools.notifications.queue import (
+    notification_dispatcher,
+    notification_queue,
+)
 
 logger = logging.getLogger(__name__)
 
+# Number of recent runs kept per spider for adaptive scheduling
+HISTORY_SIZE = 10
+# Consecutive runs without new jobs before a spider is polled less often
+QUIET_RUNS = 3
+# How often adaptive mode checks which spiders are due
+ADAPTIVE_CHECK_MINUTES = 5
+# Seconds a worker gets to exit, after its result or SIGTERM, before SIGKILL
+WORKER_EXIT_TIMEOUT = 30.0
+
+
+def configure_logging() -> None:
+    """Configure logging to stdout and the scheduler log file."""
+    handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler(settings.logs_dir / "scheduler.log", mode="a"),
+    ]
+    # Scrapy resets the root logger level, so filter on the handlers too
+    for handler in handlers:
+        handler.setLevel(logging.INFO)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=handlers,
+    )
+
+
+def _peak_rss_kb() -> int | None:
+    """Return the peak resident set size of this process in KiB, if known."""
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _crawl(spider_names: list[str], digest_dir: Path | None = None) -> dict[str, Any]:
+    """
+    Run spiders in a CrawlerProcess and summarize their stats.
+
+    Starts the Twisted reactor, so it must run in a process that has not
+    started one before (see ``_cycle_worker``).
+
+    Args:
+        spider_names: Names of the spiders to run.
+        digest_dir: Directory the spiders write their new jobs to for the
+            cycle digest, or None to queue one email per spider.
+
+    Returns:
+        Cycle summary with per-spider items, new jobs and errors.
+    """
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.settings import Settings
+
+    scrapy_settings = Settings()
+    scrapy_settings.setmodule(
+        "jobsearchtools.job_scraper.job_scraper.settings", priority="project"
+    )
+    # The scheduler process delivers queued notifications
+    scrapy_settings.set("NOTIFICATION_QUEUE_DRAIN_ON_STOP", False, priority="cmdline")
+    if digest_dir is not None:
+        scrapy_settings.set("NOTIFICATION_DIGEST_DIR", str(digest_dir), "cmdline")
+
+    process = CrawlerProcess(scrapy_settings, install_root_handler=False)
+
+    crawlers = []
+    for spider_name in spider_names:
+        logger.info(f"Scheduling spider: {spider_name}")
+        crawler = process.create_crawler(spider_name)
+        crawlers.append((spider_name, crawler))
+        process.crawl(crawler)
+
+    started = time.monotonic()
+    # Start the crawling process (blocking)
+    process.start()
+
+    spiders = {}
+    for spider_name, crawler in crawlers:
+        stats = crawler.stats.get_stats() if crawler.stats else {}
+        spiders[spider_name] = {
+            "items": stats.get("item_scraped_count", 0),
+            "new_jobs": [dict(job) for job in stats.get("new_jobs", [])],
+            "new_jobs_count": stats.get("new_jobs_count", 0),
+            "errors": stats.get("log_count/ERROR", 0),
+            "finish_reason": stats.get("finish_reason"),
+        }
+
+    return {
+        "spiders": spiders,
+        "duration": time.monotonic() - started,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def _cycle_worker(
+    spider_names: list[str], conn, digest_dir: Path | None = None
+) -> None:
+    """
+    Entry point of the worker process that runs one crawl cycle.
+
+    Sends ``{"ok": True, "summary": ...}`` or ``{"ok": False, "error": ...}``
+    back to the scheduler over the pipe.
+
+    Args:
+        spider_names: Names of the spiders to run.
+        conn: Write end of the pipe to the scheduler process.
+        digest_dir: Directory collected for the cycle digest, if enabled.
+    """
+    configure_logging()
+    try:
+        result = {"ok": True, "summary": _crawl(spider_names, digest_dir)}
+    except Exception as e:
+        logger.error(f"Error in spider worker: {e}", exc_info=True)
+        result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    conn.send(result)
+    conn.close()
+
+
+def adapt_interval(
+    current_hours: float, history: list[int], min_hours: float, max_hours: float
+) -> float:
+    """
+    Compute a spider's next interval from its recent new-job counts.
+
+    A run that found new jobs halves the interval. ``QUIET_RUNS`` runs in a
+    row without new jobs stretch it by half. The result is kept within
+    the configured bounds.
+
+    Args:
+        current_hours: Current interval of the spider in hours.
+        history: New jobs found per run, oldest first.
+        min_hours: Lower bound for the interval.
+        max_hours: Upper bound for the interval.
+
+    Returns:
+        Next interval in hours.
+    """
+    interval = current_hours
+    if history and history[-1] > 0:
+        interval = current_hours / 2
+    elif len(history) >= QUIET_RUNS and not any(history[-QUIET_RUNS:]):
+        interval = current_hours * 1.5
+    return min(max_hours, max(min_hours, interval))
+
+
+def _combine_summaries(
+    results: list[tuple[list[str], dict[str, Any]]], duration: float
+) -> dict[str, Any]:
+    """
+    Combine the results of a cycle's workers into one summary.
+
+    Args:
+        results: ``(spider_group, result)`` pairs, one per worker.
+        duration: Wall-clock duration of the cycle in seconds.
+
+    Returns:
+        Cycle summary with per-spider stats and the failed workers.
+    """
+    summary = {
+        "spiders": {},
+        "duration": duration,
+        "peak_rss_kb": None,
+        "workers": len(results),
+        "failed_workers": [],
+    }
+    for group, result in results:
+        if not result["ok"]:
+            logger.error(f"Worker for {group} failed: {result['error']}")
+            summary["failed_workers"].append(
+                {"spiders": group, "error": result["error"]}
+            )
+            continue
+        summary["spiders"].update(result["summary"]["spiders"])
+        peak_rss = result["summary"].get("peak_rss_kb")
+        if peak_rss and peak_rss > (summary["peak_rss_kb"] or 0):
+            summary["peak_rss_kb"] = peak_rss
+    return summary
+
 
 class SpiderScheduler:
     """
@@ -31,14 +226,34 @@ class SpiderScheduler:
 
     def __init__(self):
         """Initialize the scheduler with configuration."""
+        from apscheduler.schedulers.blocking import BlockingScheduler
+
         self.scheduler = BlockingScheduler(timezone=settings.scheduler.timezone)
+        self.browser_spiders: set[str] = set()
         self.spider_names = self._discover_spiders()
-        self.db_connection = None
+        # psycopg2 connections must not be shared by concurrent transactions,
+        # so every thread running jobs gets its own
+        self._local = threading.local()
+        self._connections: list = []
+        self._connections_lock = threading.Lock()
+        self.schedule_store = JsonFileStore(settings.data_dir / "spider_schedule.json")
+        self._schedule_lock = threading.Lock()
         logger.info(f"Discovered {len(self.spider_names)} spiders: {self.spider_names}")
 
+    @property
+    def db_connection(self):
+        """Database connection of the current thread, or None."""
+        return getattr(self._local, "connection", None)
+
+    @db_connection.setter
+    def db_connection(self, connection) -> None:
+        self._local.connection = connection
+        with self._connections_lock:
+            self._connections.append(connection)
+
     def _get_db_connection(self):
         """
-        Get or create a database connection for state persistence.
+        Get or create the current thread's connection for state persistence.
 
         Returns:
             psycopg2 connection object.
@@ -158,95 +373,364 @@ class SpiderScheduler:
 
     def _discover_spiders(self) -> list[str]:
         """
-        Discover all available spiders in the project.
+        List the spiders of the project from the spider registry.
+
+        No spider module is imported, each worker imports only the
+        spiders it runs. Browser spiders are skipped if scrapy-playwright
+        is not installed.
 
         Returns:
             List of spider names.
         """
-        # Import spider modules to register them
-        try:
-            # Import static spiders
-            from jobsearchtools.job_scraper.job_scraper.spiders.static import (  # noqa: F401
-                avianca,
-                bancolombia,
-                citi,
-                ecopetrol,
-                mastercard,
-                nequi,
-                scotiabank,
-                sura,
+        spiders = available_spiders()
+        self.browser_spiders.update(spec.name for spec in spiders if spec.browser)
+        return [spec.name for spec in spiders]
+
+    def _partition_spiders(self, spider_names: list[str]) -> list[list[str]]:
+        """
+        Split spiders into groups, one group per worker process.
+
+        Browser spiders need their own reactor and download handler
+        settings, so they always share a single dedicated worker. Static
+        spiders are spread round-robin over the remaining workers.
+
+        Args:
+            spider_names: Names of the spiders to run.
+
+        Returns:
+            Non-empty spider groups.
+        """
+        workers = settings.scheduler.workers or os.cpu_count() or 1
+        browser = [name for name in spider_names if name in self.browser_spiders]
+        static = [name for name in spider_names if name not in self.browser_spiders]
+
+        static_workers = max(1, min(len(static), workers - (1 if browser else 0)))
+        groups = [static[i::static_workers] for i in range(static_workers)]
+        groups.append(browser)
+        return [group for group in groups if group]
+
+    def _run_in_workers(
+        self, groups: list[list[str]], digest_dir: Path | None = None
+    ) -> dict[str, Any]:
+        """
+        Run one crawl cycle across worker processes and combine their summaries.
+
+        Args:
+            groups: Spider names to run, one group per worker process.
+            digest_dir: Directory the workers write the cycle digest to.
+
+        Returns:
+            Combined cycle summary. Workers that failed are listed under
+            ``failed_workers``.
+
+        Raises:
+            RuntimeError: If every worker fails, dies or exceeds the timeout.
+        """
+        ctx = multiprocessing.get_context("spawn")
+        started = time.monotonic()
+        pending = {}
+        workers = []
+        for index, group in enumerate(groups):
+            parent_conn, child_conn = ctx.Pipe(duplex=False)
+            worker = ctx.Process(
+                target=_cycle_worker,
+                args=(group, child_conn, digest_dir),
+                name=f"spider-cycle-worker-{index}",
             )
+            worker.start()
+            child_conn.close()
+            pending[parent_conn] = group
+            workers.append(worker)
+            logger.info(f"Worker {index} started for spiders: {group}")
+
+        results = self._wait_for_workers(pending, workers, started)
+        summary = _combine_summaries(results, time.monotonic() - started)
+
+        if len(summary["failed_workers"]) == len(groups):
+            errors = "; ".join(f["error"] for f in summary["failed_workers"])
+            raise RuntimeError(f"All spider workers failed: {errors}")
+        return summary
+
+    def _wait_for_workers(
+        self, pending: dict, workers: list, started: float
+    ) -> list[tuple[list[str], dict[str, Any]]]:
+        """
+        Collect worker results until all report back or the cycle times out.
 
-            spiders = [
-                "avianca",
-                "bancolombia",
-                "citi",
-                "ecopetrol",
-                "mastercard",
-                "nequi",
-                "scotiabank",
-                "sura",
-            ]
-
-            # Import dynamic spiders (Playwright)
-            with contextlib.suppress(ImportError):
-                from jobsearchtools.job_scraper.job_scraper.spiders.dynamic import (  # noqa: F401
-                    bbva,
-                    visa,
-                )
+        Workers still running at the timeout are terminated, and killed if
+        they do not exit, so a stuck worker cannot hold up the scheduler.
 
-                spiders.extend(["bbva", "visa"])
+        Args:
+            pending: Read end of each worker's pipe, mapped to its spider group.
+            workers: Worker processes of the cycle.
+            started: Monotonic time the cycle started.
 
-            return spiders
-        except ImportError as e:
-            logger.error(f"Failed to discover spiders: {e}")
-            return []
+        Returns:
+            ``(spider_group, result)`` pairs, one per worker.
+        """
+        timeout = settings.scheduler.cycle_timeout_minutes * 60
+        deadline = started + timeout
+        results = []
+        while pending and (remaining := deadline - time.monotonic()) > 0:
+            for conn in multiprocessing.connection.wait(list(pending), remaining):
+                group = pending.pop(conn)
+                try:
+                    result = conn.recv()
+                except EOFError:
+                    result = {"ok": False, "error": "Worker exited without a result"}
+                conn.close()
+                results.append((group, result))
+
+        for conn, group in pending.items():
+            conn.close()
+            error = f"Exceeded the {timeout / 60:.0f} minute timeout"
+            results.append((group, {"ok": False, "error": error}))
+
+        for worker in workers:
+            if pending and worker.is_alive():
+                logger.warning(f"Terminating {worker.name} after the cycle timeout")
+                worker.terminate()
+            self._join_worker(worker)
+        return results
+
+    def _join_worker(self, worker) -> None:
+        """
+        Wait for a worker process to exit, killing it if it does not.
 
-    def run_spiders(self):
+        Args:
+            worker: Worker process of the cycle.
         """
-        Run all discovered spiders.
+        worker.join(WORKER_EXIT_TIMEOUT)
+        if not worker.is_alive():
+            return
+        logger.warning(
+            f"{worker.name} did not exit within {WORKER_EXIT_TIMEOUT:.0f}s, killing it"
+        )
+        worker.kill()
+        worker.join(WORKER_EXIT_TIMEOUT)
+        if worker.is_alive():
+            logger.error(f"{worker.name} is still running after SIGKILL")
+
+    def _log_cycle_summary(self, summary: dict[str, Any]) -> None:
+        """
+        Log the totals of a finished crawl cycle.
+
+        Args:
+            summary: Cycle summary reported by the worker.
+        """
+        spiders = summary["spiders"].values()
+        peak_rss = summary.get("peak_rss_kb")
+        logger.info(
+            f"Cycle finished in {summary['duration']:.1f}s "
+            f"across {summary['workers']} worker(s): "
+            f"{sum(s['items'] for s in spiders)} items, "
+            f"{sum(s['new_jobs_count'] for s in spiders)} new jobs, "
+            f"{sum(s['errors'] for s in spiders)} errors, "
+            f"{len(summary['failed_workers'])} failed worker(s)"
+            + (f", worker peak RSS {peak_rss / 1024:.0f} MiB" if peak_rss else "")
+        )
+
+    def _send_digest(self, digest_dir: Path) -> None:
+        """
+        Queue the new jobs of every spider in the cycle as one digest email.
+
+        Spiders write their new jobs to the cycle's digest directory when
+        they close, so jobs of a worker that failed or timed out afterwards
+        are still sent. The directory is removed once the digest is queued.
+
+        Args:
+            digest_dir: Directory the cycle's workers wrote their jobs to.
+        """
+        jobs_by_spider = {}
+        for path in sorted(digest_dir.glob("*.json")):
+            entry = JsonFileStore(path).load()
+            if entry.get("jobs"):
+                jobs_by_spider[entry["spider_name"]] = entry["jobs"]
+        if jobs_by_spider:
+            notification_queue.put("digest", {"jobs_by_spider": jobs_by_spider})
+            logger.info("Cycle digest queued")
+        shutil.rmtree(digest_dir, ignore_errors=True)
+
+    def run_spiders(
+        self, spider_names: list[str] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Run the given spiders, or all discovered spiders.
 
         This method is called by the scheduler at regular intervals.
+        Spiders run in child processes so the reactor starts fresh and the
+        crawl's memory is released when the cycle ends.
         Updates the database with run status for persistent tracking.
+
+        Args:
+            spider_names: Spiders to run. Defaults to all discovered spiders.
+
+        Returns:
+            Cycle summary, or None if no spiders ran or the cycle failed.
         """
-        if not self.spider_names:
+        if spider_names is None:
+            spider_names = self.spider_names
+        if not spider_names:
             logger.warning("No spiders configured to run")
-            return
-
-        logger.info(f"Starting spider run for {len(self.spider_names)} spider(s)")
+            return None
 
         # Update status to running
-        self._update_last_run_time(len(self.spider_names), status="running")
+        self._update_last_run_time(len(spider_names), status="running")
 
-        try:
-            # Get Scrapy settings with the correct module
-            from scrapy.settings import Settings
+        summary = self._run_cycle(spider_names)
 
-            scrapy_settings = Settings()
-            scrapy_settings.setmodule(
-                "jobsearchtools.job_scraper.job_scraper.settings", priority="project"
-            )
+        # Update status to completed or failed
+        status = "completed" if summary is not None else "failed"
+        self._update_last_run_time(len(spider_names), status=status)
+        return summary
 
-            # Create CrawlerProcess
-            process = CrawlerProcess(scrapy_settings)
+    def _run_cycle(self, spider_names: list[str]) -> dict[str, Any] | None:
+        """
+        Run one crawl cycle of the given spiders in worker processes.
 
-            # Add all spiders to the process
-            for spider_name in self.spider_names:
-                logger.info(f"Scheduling spider: {spider_name}")
-                process.crawl(spider_name)
+        Queues the cycle's digest, also if the cycle failed, and wakes the
+        notification dispatcher. Does not touch ``scheduler_state``.
 
-            # Start the crawling process (blocking)
-            process.start()
+        Args:
+            spider_names: Spiders to run.
 
-            logger.info("Spider run completed successfully")
+        Returns:
+            Cycle summary, or None if the cycle failed.
+        """
+        logger.info(f"Starting spider run for {len(spider_names)} spider(s)")
+        digest_dir = None
+        if settings.email.digest:
+            digest_dir = settings.data_dir / "digests" / uuid.uuid4().hex
+        try:
+            groups = self._partition_spiders(spider_names)
+            summary = self._run_in_workers(groups, digest_dir)
+            self._log_cycle_summary(summary)
 
-            # Update status to completed
-            self._update_last_run_time(len(self.spider_names), status="completed")
+            logger.info("Spider run completed successfully")
+            return summary
 
         except Exception as e:
             logger.error(f"Error during spider run: {e}", exc_info=True)
-            # Update status to failed
-            self._update_last_run_time(len(self.spider_names), status="failed")
+            return None
+
+        finally:
+            if digest_dir is not None:
+                self._send_digest(digest_dir)
+            notification_dispatcher.notify()
+
+    def _spider_state(self, state: dict[str, Any], spider_name: str) -> dict:
+        """Return a spider's adaptive schedule state, creating it if missing."""
+        return state.setdefault(
+            spider_name,
+            {
+                "interval_hours": float(settings.scheduler.interval_hours),
+                "history": [],
+                "last_run_at": None,
+            },
+        )
+
+    def _record_spider_run(self, spider_name: str, new_jobs_count: int | None) -> float:
+        """
+        Add a run to a spider's history and adapt its interval.
+
+        Args:
+            spider_name: Name of the spider that ran.
+            new_jobs_count: New jobs the run found, or None if the spider
+                did not report. Then only the run time is recorded, so the
+                spider waits for its current interval before retrying.
+
+        Returns:
+            The spider's next interval in hours.
+        """
+        with self._schedule_lock:
+            state = self.schedule_store.load()
+            spider_state = self._spider_state(state, spider_name)
+            spider_state["last_run_at"] = datetime.now(UTC).isoformat()
+            if new_jobs_count is not None:
+                history = (spider_state["history"] + [new_jobs_count])[-HISTORY_SIZE:]
+                spider_state["history"] = history
+                spider_state["interval_hours"] = adapt_interval(
+                    spider_state["interval_hours"],
+                    history,
+                    settings.scheduler.min_interval_hours,
+                    settings.scheduler.max_interval_hours,
+                )
+            self.schedule_store.save(state)
+        return spider_state["interval_hours"]
+
+    def _due_spiders(self, now: datetime) -> list[str]:
+        """
+        Return the spiders whose adaptive interval has elapsed.
+
+        Args:
+            now: Current time.
+
+        Returns:
+            Names of the spiders that never ran or are due, in discovery order.
+        """
+        state = self.schedule_store.load()
+        due = []
+        for spider_name in self.spider_names:
+            spider_state = self._spider_state(state, spider_name)
+            if spider_state["last_run_at"]:
+                last_run = datetime.fromisoformat(spider_state["last_run_at"])
+                interval = timedelta(hours=spider_state["interval_hours"])
+                if now < last_run + interval:
+                    continue
+            due.append(spider_name)
+        return due
+
+    def run_due_spiders(self) -> None:
+        """
+        Run every spider whose interval elapsed in one cycle.
+
+        Called by the adaptive scheduling job. Running the due spiders
+        together keeps the worker partitioning, and with it the single
+        shared browser worker. Each spider's interval is then adapted to
+        the new jobs it found. The per-spider state lives in
+        ``schedule_store`` only, so no ``scheduler_state`` row is written.
+        """
+        due = self._due_spiders(datetime.now(UTC))
+        if not due:
+            logger.debug("No spider due for an adaptive run")
+            return
+
+        summary = self._run_cycle(due)
+        reported = summary["spiders"] if summary else {}
+        for spider_name in due:
+            if spider_name not in reported:
+                logger.warning(f"Spider {spider_name} did not report, keeping interval")
+                self._record_spider_run(spider_name, None)
+                continue
+
+            new_jobs_count = reported[spider_name]["new_jobs_count"]
+            interval_hours = self._record_spider_run(spider_name, new_jobs_count)
+            logger.info(
+                f"Spider {spider_name} found {new_jobs_count} new jobs, "
+                f"next run in {interval_hours:.2f} hours"
+            )
+
+    def _schedule_adaptive(self) -> None:
+        """
+        Add the job that runs due spiders every few minutes.
+
+        A single job with one instance at a time means adaptive runs never
+        overlap. It first runs immediately, picking up spiders that never
+        ran or whose interval elapsed while the scheduler was stopped.
+        """
+        from apscheduler.triggers.interval import IntervalTrigger
+
+        self.scheduler.add_job(
+            self.run_due_spiders,
+            trigger=IntervalTrigger(minutes=ADAPTIVE_CHECK_MINUTES),
+            id="adaptive_run_job",
+            name="Run due spiders",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now(UTC),
+        )
+        logger.info(f"Checking for due spiders every {ADAPTIVE_CHECK_MINUTES} minutes")
 
     def start(self):
         """
@@ -254,12 +738,24 @@ class SpiderScheduler:
 
         Schedules spider runs at configured intervals and starts the scheduler.
         Uses persistent state to determine if spiders should run immediately
-        based on time elapsed since last successful run.
+        based on time elapsed since last successful run. In adaptive mode
+        every spider is scheduled on its own interval instead.
         """
+        from apscheduler.triggers.interval import IntervalTrigger
+
         if not settings.scheduler.enabled:
             logger.info("Scheduler is disabled in configuration")
             return
 
+        if email_notifier.enabled:
+            notification_dispatcher.start()
+
+        if settings.scheduler.adaptive:
+            logger.info("Starting scheduler with adaptive per-spider intervals")
+            self._schedule_adaptive()
+            self._start_scheduler()
+            return
+
         interval_hours = settings.scheduler.interval_hours
         logger.info(f"Starting scheduler with {interval_hours} hour interval")
 
@@ -283,7 +779,10 @@ class SpiderScheduler:
                 "Next run will occur according to schedule."
             )
 
-        # Start the scheduler
+        self._start_scheduler()
+
+    def _start_scheduler(self):
+        """Run the blocking scheduler until interrupted."""
         try:
             logger.info("Scheduler started. Press Ctrl+C to exit.")
             self.scheduler.start()
@@ -296,11 +795,15 @@ class SpiderScheduler:
         logger.info("Shutting down scheduler...")
         if self.scheduler.running:
             self.scheduler.shutdown(wait=True)
+        notification_dispatcher.stop(timeout=30)
 
-        # Close database connection
-        if self.db_connection and not self.db_connection.closed:
-            self.db_connection.close()
-            logger.debug("Database connection closed")
+        # Close the database connections of every thread
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            if connection and not connection.closed:
+                connection.close()
+                logger.debug("Database connection closed")
 
         logger.info("Scheduler shut down successfully")
 
@@ -308,14 +811,7 @@ class SpiderScheduler:
 def main():
     """Main entry point for the scheduler service."""
     # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(settings.logs_dir / "scheduler.log", mode="a"),
-        ],
-    )
+    configure_logging()
 
     # Create and start scheduler
     scheduler = SpiderScheduler()
@@ -1,6 +1,10 @@
 """Tests for dynamic Playwright-based spiders (BBVA, Visa)."""
 
+import json
+
 import pytest
+from scrapy.http import JsonRequest, TextResponse
+from scrapy.utils.test import get_crawler
 
 from jobsearchtools.job_scraper.job_scraper.spiders.dynamic.bbva import BbvaSpider
 from jobsearchtools.job_scraper.job_scraper.spiders.dynamic.visa import VisaSpider
@@ -61,6 +65,68 @@ class TestBbvaSpider:
         assert hasattr(spider, "errback")
         assert callable(spider.errback)
 
+    def test_starts_with_json_api(self, spider):
+        """Test the default mode posts to the Workday jobs endpoint."""
+        (request,) = spider.start_requests()
+
+        assert isinstance(request, JsonRequest)
+        assert request.method == "POST"
+        assert request.url.endswith("/wday/cxs/bbva/BBVA/jobs")
+        assert json.loads(request.body)["offset"] == 0
+        assert not request.meta.get("playwright")
+
+    def test_browser_mode_uses_playwright(self):
+        """Test the browser mode keeps the Playwright requests."""
+        spider = BbvaSpider(mode="browser")
+
+        (request,) = spider.start_requests()
+
+        assert request.meta["playwright"] is True
+
+    def test_first_api_page_schedules_remaining_pages(self, spider):
+        """Test the first page yields items and requests every other page."""
+        body = {
+            "total": 45,
+            "jobPostings": [
+                {
+                    "title": "Analista",
+                    "externalPath": "/job/Bogota/Analista_JR001",
+                    "locationsText": "Bogotá",
+                    "postedOn": "Publicado hoy",
+                    "bulletFields": ["JR001"],
+                }
+            ],
+        }
+        response = TextResponse(
+            url=spider.api_url, body=json.dumps(body), encoding="utf-8"
+        )
+
+        results = list(spider.parse_api(response, offset=0))
+
+        (item,) = [r for r in results if not isinstance(r, JsonRequest)]
+        assert item["job_id"] == "bbva_JR001"
+        assert item["url"] == (
+            "https://bbva.wd3.myworkdayjobs.com/es/BBVA/job/Bogota/Analista_JR001"
+        )
+        offsets = [
+            json.loads(r.body)["offset"] for r in results if isinstance(r, JsonRequest)
+        ]
+        assert offsets == [20, 40]
+
+    def test_failed_api_falls_back_to_playwright_once(self):
+        """Test an invalid first page switches to Playwright a single time."""
+        spider = BbvaSpider.from_crawler(get_crawler(BbvaSpider))
+        response = TextResponse(
+            url=spider.api_url, body=b"<html>blocked</html>", encoding="utf-8"
+        )
+
+        first = list(spider.parse_api(response, offset=0))
+        second = list(spider.parse_api(response, offset=0))
+
+        assert [r.meta["playwright"] for r in first] == [True]
+        assert second == []
+        assert spider.crawler.stats.get_value("bbva/playwright_fallback") == 1
+
 
 class TestVisaSpider:
     """Test Visa-specific functionality."""
@@ -85,3 +151,11 @@ class TestVisaSpider:
         """Test Visa spider has error callback for Playwright cleanup."""
         assert hasattr(spider, "errback")
         assert callable(spider.errback)
+
+    def test_waits_for_listing_instead_of_sleeping(self, spider):
+        """Test the page is ready on a stable listing, not a fixed sleep."""
+        request = next(iter(spider.start_requests()))
+        page_methods = request.meta["playwright_page_methods"]
+
+        assert [pm.method.selector for pm in page_methods] == ["li.vs-underline"]
+        assert all(pm.method != "wait_for_timeout" for pm in page_methods)
@@ -0,0 +1,45 @@
+"""Offline tests of spider callbacks against recorded pages."""
+
+import pytest
+from scrapy import Request
+
+from jobsearchtools.job_scraper.job_scraper.items import JobScraperItem
+from parse_fixtures import PARSE_FIXTURES, build_response, run_callback, scale_page
+
+
+@pytest.mark.parametrize("parse_fixture", PARSE_FIXTURES, ids=lambda f: f.name)
+def test_callback_parses_fixture(parse_fixture):
+    """Test every callback yields complete items or requests offline."""
+    rows = 3 if parse_fixture.scalable else 1
+
+    results = run_callback(parse_fixture, build_response(parse_fixture, rows))
+
+    assert len(results) == rows
+    for result in results:
+        if isinstance(result, Request):
+            continue
+        assert isinstance(result, JobScraperItem)
+        assert result["job_id"]
+        assert result["title"]
+
+
+@pytest.mark.parametrize(
+    "parse_fixture",
+    [f for f in PARSE_FIXTURES if f.scalable],
+    ids=lambda f: f.name,
+)
+def test_scaled_rows_have_unique_ids(parse_fixture):
+    """Test scaled fixtures produce one distinct job per row."""
+    results = run_callback(parse_fixture, build_response(parse_fixture, 50))
+
+    items = [r for r in results if isinstance(r, JobScraperItem)]
+    requests = [r for r in results if isinstance(r, Request)]
+    keys = [item["job_id"] for item in items] + [r.url for r in requests]
+    assert len(set(keys)) == 50
+
+
+def test_scale_page_repeats_marked_block():
+    """Test the row block is repeated with numbered copies."""
+    html = "[<!-- row -->{id: __N__}<!-- /row -->]"
+
+    assert scale_page(html, 3, separator=",") == "[{id: 1},{id: 2},{id: 3}]"
@@ -1,6 +1,9 @@
 """Tests for static HTML spiders (Avianca, Bancolombia, Citi, etc)."""
 
+from unittest.mock import MagicMock
+
 import pytest
+from scrapy.http import HtmlResponse, Request
 
 from jobsearchtools.job_scraper.job_scraper.spiders.static.avianca import (
     AviancaSpider,
@@ -85,6 +88,17 @@ class TestAviancaSpider:
         assert hasattr(spider, "parse_detail")
         assert callable(spider.parse_detail)
 
+    def test_failed_detail_marks_item(self, spider):
+        """Test an item whose detail page failed is flagged for the pipeline."""
+        item = {"job_id": "avianca_1", "description": "Stored"}
+        failure = MagicMock()
+        failure.request.meta = {"item": item}
+
+        (result,) = spider.errback_detail(failure)
+
+        assert result["description"] is None
+        assert result["detail_failed"] is True
+
 
 class TestMastercardSpider:
     """Test Mastercard-specific functionality."""
@@ -128,3 +142,177 @@ class TestNequiSpider:
     def test_targets_colombia(self, spider):
         """Test Nequi spider is configured for Colombian jobs."""
         assert "lapipolnequi.buk.co" in spider.allowed_domains
+
+
+SUCCESSFACTORS_ROW = """
+<tr class="data-row">
+  <td>
+    <span class="jobTitle hidden-phone">
+      <a class="jobTitle-link" href="/job/Bogota-Analista/{job_id}/">{title}</a>
+    </span>
+    <div class="visible-phone">
+      <a class="jobTitle-link" href="/job/Bogota-Analista/{job_id}/">{title}</a>
+      <span class="jobLocation"> </span>
+      <span class="jobDate">{date}</span>
+    </div>
+  </td>
+  <td class="colLocation"><span class="jobLocation">{location}</span></td>
+  <td class="colDate"><span class="jobDate">{date}</span></td>
+</tr>
+"""
+
+
+def successfactors_page(url, rows, wrapper="{rows}"):
+    """Build a SuccessFactors results page response."""
+    table = "".join(SUCCESSFACTORS_ROW.format(**row) for row in rows)
+    html = f"<html><body>{wrapper.format(rows=f'<table>{table}</table>')}</body></html>"
+    return HtmlResponse(url=url, body=html, encoding="utf-8", request=Request(url))
+
+
+class TestSuccessFactorsSpiders:
+    """Test the shared SuccessFactors results table parser."""
+
+    ROWS = [
+        {"job_id": "111", "title": "Analista", "location": "Bogotá, CO", "date": "1"},
+        {"job_id": "222", "title": "Gerente", "location": "Cali, CO", "date": "2"},
+    ]
+
+    def test_rows_parsed_once_each(self):
+        """Test mobile duplicates inside a row do not produce extra items."""
+        response = successfactors_page(
+            "https://trabajaconnosotros.sura.com/search/", self.ROWS
+        )
+
+        items = list(SuraSpider().parse(response))
+
+        assert [item["job_id"] for item in items] == ["sura_111", "sura_222"]
+        assert [item["title"] for item in items] == ["Analista", "Gerente"]
+        assert [item["location"] for item in items] == ["Bogotá, CO", "Cali, CO"]
+        assert [item["date_posted"] for item in items] == ["1", "2"]
+        assert items[0]["url"] == (
+            "https://trabajaconnosotros.sura.com/job/Bogota-Analista/111/"
+        )
+        assert all(item["company"] == "Sura" for item in items)
+
+    def test_scotiabank_limits_rows_to_results(self):
+        """Test rows outside the search results container are ignored."""
+        response = successfactors_page(
+            "https://jobs.scotiabank.com/search/",
+            self.ROWS,
+            wrapper='<div class="searchResults">{rows}</div>',
+        )
+        outside = successfactors_page("https://jobs.scotiabank.com/search/", self.ROWS)
+
+        assert len(list(ScotiabankSpider().parse(response))) == 2
+        assert list(ScotiabankSpider().parse(outside)) == []
+
+    def test_avianca_parses_spanish_dates(self):
+        """Test Avianca keeps its date parsing and numeric job ids."""
+        rows = [{**self.ROWS[0], "date": "31 oct 2025"}]
+        response = successfactors_page("https://jobs.avianca.com/search/", rows)
+
+        item, _ = next(AviancaSpider().parse_rows(response))
+
+        assert item["date_posted"] == "2025-10-31"
+        assert item["job_id"] == "avianca_111"
+
+    def test_all_result_pages_requested_from_page_one(self):
+        """Test the result count schedules every page at once."""
+        response = successfactors_page(
+            "https://trabajaconnosotros.sura.com/search/?q=",
+            self.ROWS,
+            wrapper='{rows}<span class="paginationLabel">Resultados '
+            "<b>1 – 25</b> de <b>1.060</b></span>",
+        )
+
+        results = list(SuraSpider().parse(response))
+        requests = [r for r in results if isinstance(r, Request)]
+
+        assert len(requests) == 42
+        assert requests[0].url.endswith("/search/?q=&startrow=25")
+        assert requests[-1].url.endswith("startrow=1050")
+        assert all(r.meta["result_page"] for r in requests)
+
+    def test_scheduled_pages_do_not_paginate_again(self):
+        """Test later result pages only yield their jobs."""
+        response = successfactors_page(
+            "https://trabajaconnosotros.sura.com/search/?startrow=25",
+            self.ROWS,
+            wrapper='{rows}<span class="paginationLabel">'
+            "<b>26 – 50</b> of <b>134</b></span>",
+        )
+        response.request.meta["result_page"] = True
+
+        results = list(SuraSpider().parse(response))
+
+        assert not any(isinstance(r, Request) for r in results)
+
+    def test_pagination_without_count_follows_next_link(self):
+        """Test pages without a result count fall back to the next link."""
+        response = successfactors_page(
+            "https://jobs.avianca.com/search/",
+            [],
+            wrapper='{rows}<a class="next" href="/search/?startrow=25">›</a>',
+        )
+
+        results = list(AviancaSpider().parse(response))
+
+        assert [r.url for r in results] == [
+            "https://jobs.avianca.com/search/?startrow=25"
+        ]
+
+    def test_ecopetrol_matches_sections_by_tile_id(self):
+        """Test Ecopetrol locations and dates are looked up by tile id."""
+        html = """
+        <div data-focus-tile id="1-abc-tile"></div>
+        <a class="jobTitle-link" href="/job/A/1/">Ingeniero</a>
+        <span id="1-abc-desktop-section-location-value">Barrancabermeja</span>
+        <span id="1-abc-desktop-section-date-value">5 nov 2025</span>
+        <div data-focus-tile id="2-def-tile"></div>
+        <a class="jobTitle-link" href="/job/B/2/">Geólogo</a>
+        <span id="2-def-desktop-section-location-value">Bogotá</span>
+        """
+        response = HtmlResponse(
+            url="https://jobs.ecopetrol.com.co/search/", body=html, encoding="utf-8"
+        )
+
+        items = list(EcopetrolSpider().parse(response))
+
+        assert [item["job_id"] for item in items] == [
+            "ecopetrol_1-abc",
+            "ecopetrol_2-def",
+        ]
+        assert [item["location"] for item in items] == ["Barrancabermeja", "Bogotá"]
+        assert [item["date_posted"] for item in items] == ["5 nov 2025", None]
+        assert items[1]["url"] == "https://jobs.ecopetrol.com.co/job/B/2/"
+
+
+class TestCitiSpider:
+    """Test Citi-specific functionality."""
+
+    URL = "https://jobs.citi.com/location/bogota-jobs/287/3686110-3688685-3688689/4"
+
+    def page(self, body, url=None):
+        """Build a Citi results page response."""
+        url = url or self.URL
+        return HtmlResponse(url=url, body=body, encoding="utf-8", request=Request(url))
+
+    def test_all_result_pages_requested_from_page_one(self):
+        """Test the page count schedules every page at once."""
+        response = self.page(
+            '<section id="search-results" data-total-pages="4"></section>'
+        )
+
+        requests = list(CitiSpider().parse(response))
+
+        assert [r.url for r in requests] == [f"{self.URL}?p={n}" for n in (2, 3, 4)]
+
+    def test_pagination_without_count_follows_next_link(self):
+        """Test pages without a page count fall back to the next link."""
+        response = self.page('<a class="next" href="/location/bogota?p=2">Next</a>')
+
+        requests = list(CitiSpider().parse(response))
+
+        assert [r.url for r in requests] == [
+            "https://jobs.citi.com/location/bogota?p=2"
+        ]
@@ -0,0 +1,214 @@
+"""Tests for the shared Playwright browser download handler."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from scrapy.statscollectors import MemoryStatsCollector
+from scrapy.utils.test import get_crawler
+from scrapy_playwright.handler import ScrapyPlaywrightDownloadHandler
+
+from jobsearchtools.job_scraper.job_scraper.browser import (
+    BrowserPool,
+    SharedBrowserDownloadHandler,
+    child_processes_rss_bytes,
+)
+from jobsearchtools.job_scraper.job_scraper.readiness import ReadyResult
+
+
+@pytest.fixture
+def fake_playwright():
+    """Patch the Playwright driver with one that launches mock browsers."""
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.close = AsyncMock()
+    playwright = MagicMock()
+    playwright.firefox.launch = AsyncMock(return_value=browser)
+    manager = MagicMock()
+    manager.start = AsyncMock(return_value=playwright)
+    manager.__aexit__ = AsyncMock()
+    with patch(
+        "jobsearchtools.job_scraper.job_scraper.browser.PlaywrightContextManager",
+        return_value=manager,
+    ):
+        yield SimpleNamespace(manager=manager, playwright=playwright, browser=browser)
+    BrowserPool._pools.clear()
+
+
+def make_handler(max_uses=2, memory_limit_mb=0):
+    """Build a handler without starting scrapy-playwright's machinery."""
+    handler = SharedBrowserDownloadHandler.__new__(SharedBrowserDownloadHandler)
+    handler.stats = MemoryStatsCollector(get_crawler())
+    handler.context_launch_lock = asyncio.Lock()
+    handler.context_wrappers = {}
+    handler.context_uses = {}
+    handler.context_max_uses = max_uses
+    handler.memory_limit_bytes = memory_limit_mb * 2**20
+    return handler
+
+
+def make_context_wrapper(open_pages=0):
+    """Build a browser context wrapper with a number of open pages."""
+    context = MagicMock()
+    context.pages = [MagicMock()] * open_pages
+    context.close = AsyncMock()
+    return SimpleNamespace(context=context, persistent=False)
+
+
+class TestBrowserPool:
+    """Test the process-wide browser pool."""
+
+    def test_pools_shared_per_configuration(self):
+        """Test handlers with the same browser settings share a pool."""
+        first = BrowserPool.get("firefox", {"headless": True})
+
+        assert BrowserPool.get("firefox", {"headless": True}) is first
+        assert BrowserPool.get("firefox", {"headless": False}) is not first
+        BrowserPool._pools.clear()
+
+    def test_browser_launched_once(self, fake_playwright):
+        """Test the second user reuses the running browser."""
+        pool = BrowserPool("firefox", {"headless": True})
+
+        async def use_twice():
+            await pool.acquire()
+            await pool.acquire()
+            return [await pool.browser_for(), await pool.browser_for()]
+
+        results = asyncio.run(use_twice())
+
+        assert [launched for _, launched in results] == [True, False]
+        fake_playwright.playwright.firefox.launch.assert_awaited_once_with(
+            headless=True
+        )
+        fake_playwright.manager.start.assert_awaited_once()
+
+    def test_browser_closed_after_last_release(self, fake_playwright):
+        """Test the browser stays open until every user released it."""
+        pool = BrowserPool("firefox", {})
+
+        async def acquire_and_release():
+            await pool.acquire()
+            await pool.acquire()
+            await pool.browser_for()
+            await pool.release()
+            closed_early = fake_playwright.browser.close.await_count
+            await pool.release()
+            return closed_early
+
+        assert asyncio.run(acquire_and_release()) == 0
+        fake_playwright.browser.close.assert_awaited_once()
+        fake_playwright.manager.__aexit__.assert_awaited_once()
+
+
+class TestContextRecycling:
+    """Test browser contexts are recycled by use count and memory."""
+
+    def test_context_recycled_after_max_uses(self):
+        """Test an idle context that served enough pages is closed."""
+        handler = make_handler(max_uses=2)
+        wrapper = make_context_wrapper()
+        handler.context_wrappers["default"] = wrapper
+        handler.context_uses["default"] = 2
+
+        asyncio.run(handler._maybe_recycle_context("default"))
+
+        wrapper.context.close.assert_awaited_once()
+        assert "default" not in handler.context_wrappers
+        assert handler.stats.get_value("browser_pool/context_recycled/max_uses") == 1
+
+    def test_context_with_open_pages_kept(self):
+        """Test a context is never closed under an open page."""
+        handler = make_handler(max_uses=2)
+        wrapper = make_context_wrapper(open_pages=1)
+        handler.context_wrappers["default"] = wrapper
+        handler.context_uses["default"] = 5
+
+        asyncio.run(handler._maybe_recycle_context("default"))
+
+        wrapper.context.close.assert_not_awaited()
+
+    @patch(
+        "jobsearchtools.job_scraper.job_scraper.browser.child_processes_rss_bytes",
+        return_value=3 * 2**20,
+    )
+    def test_context_recycled_over_memory_limit(self, mock_rss):
+        """Test browser memory above the limit recycles the context."""
+        handler = make_handler(max_uses=0, memory_limit_mb=2)
+        wrapper = make_context_wrapper()
+        handler.context_wrappers["default"] = wrapper
+
+        asyncio.run(handler._maybe_recycle_context("default"))
+
+        wrapper.context.close.assert_awaited_once()
+        assert handler.stats.get_value("browser_pool/context_recycled/memory") == 1
+
+
+def test_child_processes_rss_is_measured():
+    """Test the child process memory probe works on this platform."""
+    rss = child_processes_rss_bytes()
+
+    assert rss is None or rss >= 0
+
+
+def make_request(url, resource_type="script", navigation=False):
+    """Build a Playwright request stand-in."""
+    return SimpleNamespace(
+        url=url,
+        resource_type=resource_type,
+        is_navigation_request=lambda: navigation,
+    )
+
+
+class TestResourceBlocking:
+    """Test subresources are aborted by type and domain."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler blocking images and an analytics domain."""
+        handler = make_handler()
+        handler.blocked_resource_types = frozenset({"image", "font"})
+        handler.blocked_domains = frozenset({"google-analytics.com"})
+        return handler
+
+    def test_blocked_resource_type_aborted(self, handler):
+        """Test requests of a blocked type are aborted and counted."""
+        request = make_request("https://corporate.visa.com/logo.png", "image")
+
+        assert handler.should_abort(request) is True
+        assert handler.stats.get_value("browser_blocking/blocked/type/image") == 1
+
+    def test_blocked_domain_and_subdomains_aborted(self, handler):
+        """Test requests to a denied domain or its subdomains are aborted."""
+        assert handler.should_abort(make_request("https://google-analytics.com/g"))
+        assert handler.should_abort(
+            make_request("https://www.google-analytics.com/collect")
+        )
+        assert not handler.should_abort(
+            make_request("https://notgoogle-analytics.com/app.js")
+        )
+        assert handler.stats.get_value("browser_blocking/blocked_count") == 2
+        assert handler.stats.get_value("browser_blocking/allowed_count") == 1
+
+    def test_navigation_never_aborted(self, handler):
+        """Test the page document itself is always loaded."""
+        request = make_request(
+            "https://www.google-analytics.com/", "document", navigation=True
+        )
+
+        assert handler.should_abort(request) is False
+
+
+def test_readiness_waits_recorded():
+    """Test the handler records readiness results of page methods."""
+    handler = make_handler()
+    page_method = MagicMock(result=ReadyResult(300.0, "ready", 12))
+    request = SimpleNamespace(meta={"playwright_page_methods": [page_method]})
+
+    with patch.object(
+        ScrapyPlaywrightDownloadHandler, "_apply_page_methods", AsyncMock()
+    ):
+        asyncio.run(handler._apply_page_methods(MagicMock(), request, None))
+
+    assert handler.stats.get_value("browser_ready/wait_ms/le_500") == 1
@@ -1,15 +1,26 @@
 """Tests for configuration system."""
 
+import os
+import subprocess
+import sys
+import threading
+from unittest.mock import MagicMock
+
 import pytest
 from pydantic import ValidationError
 
+from jobsearchtools.config.lazy import Lazy
 from jobsearchtools.config.settings import (
+    DEFAULT_DOMAIN_POLICIES,
     AppSettings,
+    BrowserSettings,
     DatabaseSettings,
     EmailSettings,
     SchedulerSettings,
     ScrapySettings,
+    settings,
 )
+from jobsearchtools.job_scraper.job_scraper.spider_registry import SPIDERS
 
 
 class TestDatabaseSettings:
@@ -92,6 +103,53 @@ class TestScrapySettings:
         scrapy = ScrapySettings()
         assert scrapy.concurrent_requests_per_domain == 1
 
+    def test_domain_policies_from_env(self, monkeypatch):
+        """Test per-host budgets are read from JSON."""
+        monkeypatch.setenv(
+            "SCRAPY_DOMAIN_POLICIES",
+            '{"jobs.avianca.com": {"concurrency": 4, "min_delay": 0.25}}',
+        )
+        policy = ScrapySettings().domain_policies["jobs.avianca.com"]
+        assert policy.concurrency == 4
+        assert policy.min_delay == 0.25
+        assert policy.target_latency == 2.0
+
+    def test_default_domain_policies(self, monkeypatch):
+        """Test known job boards have budgets that configured hosts override."""
+        monkeypatch.setenv(
+            "SCRAPY_DOMAIN_POLICIES", '{"jobs.citi.com": {"concurrency": 1}}'
+        )
+        policies = ScrapySettings().domain_policies
+
+        assert set(DEFAULT_DOMAIN_POLICIES) <= set(policies)
+        assert policies["jobs.citi.com"].concurrency == 1
+        assert policies["trabajaconnosotros.sura.com"].concurrency == 4
+
+    def test_default_policies_follow_registry(self):
+        """Test only spiders that request pages at once get a default budget."""
+        budgeted = {spec.domain for spec in SPIDERS if spec.budget}
+
+        assert set(DEFAULT_DOMAIN_POLICIES) == budgeted
+        assert "jobs.avianca.com" in budgeted
+        assert "jobs.ecopetrol.com.co" not in budgeted
+
+
+class TestBrowserSettings:
+    """Test Playwright browser settings."""
+
+    def test_defaults(self):
+        """Test the browser pool defaults."""
+        browser = BrowserSettings()
+        assert browser.type == "firefox"
+        assert browser.headless is True
+        assert browser.context_max_uses == 50
+
+    def test_invalid_browser_type(self, monkeypatch):
+        """Test unknown browser types are rejected."""
+        monkeypatch.setenv("BROWSER_TYPE", "netscape")
+        with pytest.raises(ValidationError):
+            BrowserSettings()
+
 
 class TestAppSettings:
     """Test main application settings."""
@@ -108,6 +166,7 @@ class TestAppSettings:
         assert isinstance(app.email, EmailSettings)
         assert isinstance(app.scheduler, SchedulerSettings)
         assert isinstance(app.scrapy, ScrapySettings)
+        assert isinstance(app.browser, BrowserSettings)
 
     def test_directory_creation(self):
         """Test required directories are created on initialization."""
@@ -124,3 +183,59 @@ class TestAppSettings:
         app = AppSettings()
         assert app.database.host == "custom-host"
         assert app.scheduler.interval_hours == 2
+
+
+class TestLazySettings:
+    """Test singletons are built on first use instead of at import."""
+
+    def test_built_once_on_first_access(self):
+        """Test the factory runs on the first attribute read only."""
+        factory = MagicMock(return_value=MagicMock(value=1))
+        lazy = Lazy(factory)
+
+        factory.assert_not_called()
+        assert lazy.value == 1
+        assert lazy.value == 1
+        factory.assert_called_once()
+
+    def test_concurrent_first_access_builds_once(self):
+        """Test threads racing on first access share one instance."""
+        factory = MagicMock(side_effect=lambda: object())
+        lazy = Lazy(factory)
+
+        threads = [threading.Thread(target=lazy.resolve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        factory.assert_called_once()
+
+    def test_attribute_writes_forwarded(self):
+        """Test setting an attribute on the proxy sets it on the instance."""
+        lazy = Lazy(lambda: EmailSettings())
+
+        lazy.digest = True
+
+        assert lazy.resolve().digest is True
+
+    def test_global_settings_proxy(self):
+        """Test the global settings behave like an AppSettings instance."""
+        assert isinstance(settings.resolve(), AppSettings)
+        assert settings.email is settings.resolve().email
+
+    def test_import_does_not_build_settings(self):
+        """Test importing the settings module reads no configuration."""
+        code = (
+            "from jobsearchtools.config.settings import settings; "
+            "print(settings.initialized)"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        assert result.stdout.strip() == "False"
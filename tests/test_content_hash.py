@@ -0,0 +1,137 @@
+"""Tests for skipping listing pages with unchanged jobs."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from scrapy import Spider
+from scrapy.exceptions import IgnoreRequest
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+
+from jobsearchtools.job_scraper.job_scraper.content_hash import (
+    ContentHashMiddleware,
+    listing_region,
+)
+from jobsearchtools.job_scraper.job_scraper.signals import page_unchanged
+from jobsearchtools.job_scraper.job_scraper.spiders.static.citi import CitiSpider
+from jobsearchtools.job_scraper.job_scraper.spiders.static.mastercard import (
+    MastercardSpider,
+)
+from jobsearchtools.job_scraper.job_scraper.spiders.static.sura import SuraSpider
+
+URL = "https://jobs.citi.com/location/bogota-jobs/287/3686110-3688685-3688689/4"
+
+
+def listing_page(jobs, extra=""):
+    """Build a Citi listing page with the given job titles."""
+    rows = "".join(f"<li><h3>{job}</h3></li>" for job in jobs)
+    body = (
+        f"<html><body>{extra}<section id='search-results-list'><ul>{rows}</ul>"
+        "</section></body></html>"
+    )
+    return HtmlResponse(URL, body=body, encoding="utf-8", request=Request(URL))
+
+
+@pytest.fixture
+def run(tmp_path):
+    """Return a function running one crawl of the Citi spider."""
+
+    def crawl(*responses, reason="finished", errors=0):
+        crawler = get_crawler(CitiSpider, {"CONTENT_HASH_ENABLED": True})
+        crawler.spider = CitiSpider.from_crawler(crawler)
+        crawler.stats.open_spider()
+        if errors:
+            crawler.stats.set_value("log_count/ERROR", errors)
+        mw = ContentHashMiddleware(crawler, tmp_path, max_age_hours=24)
+        mw.spider_opened(crawler.spider)
+        received = MagicMock()
+        crawler.signals.connect(received, signal=page_unchanged)
+        skipped = 0
+        for response in responses:
+            try:
+                mw.process_response(response.request, response)
+            except IgnoreRequest:
+                skipped += 1
+        mw.spider_closed(crawler.spider, reason)
+        return skipped, received, crawler.stats
+
+    return crawl
+
+
+class TestContentHashMiddleware:
+    """Test listing pages are skipped when their jobs did not change."""
+
+    def test_unchanged_listing_skipped_next_run(self, run):
+        """Test the same jobs are not parsed twice, even if the page changed."""
+        run(listing_page(["Analyst"], extra="<p>ad 1</p>"))
+
+        skipped, received, stats = run(listing_page(["Analyst"], extra="<p>ad 2</p>"))
+
+        assert skipped == 1
+        received.assert_called_once()
+        assert stats.get_value("content_hash/unchanged") == 1
+
+    def test_changed_listing_parsed(self, run):
+        """Test a new job on the page lets it through."""
+        run(listing_page(["Analyst"]))
+
+        skipped, _, stats = run(listing_page(["Analyst", "Engineer"]))
+
+        assert skipped == 0
+        assert stats.get_value("content_hash/changed") == 1
+
+    def test_interrupted_run_not_remembered(self, run):
+        """Test hashes of a run that did not finish are discarded."""
+        run(listing_page(["Analyst"]), reason="shutdown")
+
+        skipped, _, _ = run(listing_page(["Analyst"]))
+
+        assert skipped == 0
+
+    def test_run_with_errors_not_remembered(self, run):
+        """Test hashes are discarded when downloads or writes failed."""
+        run(listing_page(["Analyst"]), errors=2)
+
+        skipped, _, _ = run(listing_page(["Analyst"]))
+
+        assert skipped == 0
+
+    def test_detail_pages_never_hashed(self, run):
+        """Test responses for other callbacks pass through."""
+        response = listing_page(["Analyst"])
+        response.request.callback = MagicMock()
+        run(response)
+
+        skipped, _, _ = run(response)
+
+        assert skipped == 0
+
+
+class TestListingRegion:
+    """Test spiders expose the part of their pages holding jobs."""
+
+    def test_successfactors_rows(self):
+        """Test SuccessFactors spiders hash their result rows only."""
+        body = (
+            "<html><body><p>Visitors: 1</p><table><tr class='data-row'>"
+            "<td>Analyst</td></tr></table></body></html>"
+        )
+        response = HtmlResponse("https://x.com/search/", body=body, encoding="utf-8")
+
+        region = listing_region(SuraSpider(), response)
+
+        assert b"Analyst" in region
+        assert b"Visitors" not in region
+
+    def test_mastercard_embedded_json(self):
+        """Test the Mastercard region is the embedded job JSON."""
+        body = '<script>phApp.ddo = {"jobs": [1]}; var x = 1;</script>'
+        response = HtmlResponse("https://x.com/", body=body, encoding="utf-8")
+
+        assert listing_region(MastercardSpider(), response) == b'{"jobs": [1]}'
+
+    def test_spider_without_region(self):
+        """Test spiders that do not opt in are never hashed."""
+        response = HtmlResponse("https://x.com/", body=b"<html></html>")
+
+        assert listing_region(Spider("plain"), response) == b""
@@ -0,0 +1,221 @@
+"""Tests for Scrapy extensions."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jobsearchtools.job_scraper.job_scraper.cache import JsonFileStore
+from jobsearchtools.job_scraper.job_scraper.extensions import (
+    SPIDER_RUN_COLUMNS,
+    EmailNotificationExtension,
+    SpiderHealthMonitorExtension,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_run_buffer():
+    """Clear the run records shared between extension instances."""
+    SpiderHealthMonitorExtension._pending_runs = []
+    SpiderHealthMonitorExtension._open_spiders = 0
+    yield
+    SpiderHealthMonitorExtension._pending_runs = []
+    SpiderHealthMonitorExtension._open_spiders = 0
+
+
+@pytest.fixture
+def mock_connect():
+    """Patch the database connection factory used by the extensions."""
+    conn = MagicMock()
+    with patch(
+        "jobsearchtools.job_scraper.job_scraper.extensions._database_connector",
+        return_value=lambda: conn,
+    ):
+        yield conn
+
+
+def make_monitor(name, stats_values):
+    """Create a health monitor for a spider with the given stats."""
+    stats = MagicMock()
+    stats.get_value.side_effect = lambda key, default=None: stats_values.get(
+        key, default
+    )
+    spider = MagicMock()
+    spider.name = name
+    return SpiderHealthMonitorExtension(stats), spider
+
+
+class TestSpiderHealthMonitorExtension:
+    """Test spider run records written to spider_runs."""
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.execute_values")
+    def test_runs_written_once_all_spiders_close(
+        self, mock_execute_values, mock_connect
+    ):
+        """Test runs of one process are inserted in a single statement."""
+        first, first_spider = make_monitor(
+            "avianca", {"item_scraped_count": 5, "new_jobs_count": 2}
+        )
+        second, second_spider = make_monitor(
+            "citi", {"item_scraped_count": 0, "log_count/ERROR": 3}
+        )
+        first.spider_opened(first_spider)
+        second.spider_opened(second_spider)
+
+        first.spider_closed(first_spider, "finished")
+        mock_execute_values.assert_not_called()
+
+        second.spider_closed(second_spider, "shutdown")
+        mock_execute_values.assert_called_once()
+        assert "INSERT INTO spider_runs" in mock_execute_values.call_args[0][1]
+        rows = [
+            dict(zip(SPIDER_RUN_COLUMNS, row, strict=True))
+            for row in mock_execute_values.call_args[0][2]
+        ]
+        assert [row["spider_name"] for row in rows] == ["avianca", "citi"]
+        assert rows[0]["status"] == "completed"
+        assert rows[0]["items_scraped"] == 5
+        assert rows[0]["items_saved"] == 2
+        assert rows[1]["status"] == "failed"
+        assert rows[1]["error_count"] == 3
+        assert rows[1]["close_reason"] == "shutdown"
+        mock_connect.commit.assert_called_once()
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.execute_values")
+    def test_peak_memory_from_memusage_stat(self, mock_execute_values, mock_connect):
+        """Test the MemoryUsage stat is recorded as the peak memory."""
+        monitor, spider = make_monitor("avianca", {"memusage/max": 123456})
+        monitor.spider_opened(spider)
+        monitor.spider_closed(spider, "finished")
+
+        row = dict(
+            zip(SPIDER_RUN_COLUMNS, mock_execute_values.call_args[0][2][0], strict=True)
+        )
+        assert row["peak_memory_bytes"] == 123456
+        assert row["duration_seconds"] >= 0
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.execute_values")
+    def test_write_errors_are_logged_not_raised(
+        self, mock_execute_values, mock_connect
+    ):
+        """Test a failing insert does not break spider shutdown."""
+        mock_execute_values.side_effect = Exception("DB down")
+        monitor, spider = make_monitor("avianca", {})
+        monitor.spider_opened(spider)
+
+        monitor.spider_closed(spider, "finished")
+
+        mock_connect.close.assert_called_once()
+        assert SpiderHealthMonitorExtension._pending_runs == []
+
+    def test_unchanged_pages_not_reported_as_empty(self, mock_connect, caplog):
+        """Test a run that only saw 304 pages is not flagged as broken."""
+        monitor, spider = make_monitor(
+            "avianca", {"item_scraped_count": 0, "pages_unchanged_count": 1}
+        )
+        monitor.spider_opened(spider)
+
+        monitor.spider_closed(spider, "finished")
+
+        assert "scraped 0 items" not in caplog.text
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.execute_values")
+    def test_known_jobs_not_reported_as_empty(
+        self, mock_execute_values, mock_connect, caplog
+    ):
+        """Test a run that only saw stored jobs is not flagged as broken."""
+        monitor, spider = make_monitor(
+            "avianca", {"item_scraped_count": 0, "known_jobs/requests_saved": 25}
+        )
+        monitor.spider_opened(spider)
+
+        monitor.spider_closed(spider, "finished")
+
+        assert "scraped 0 items" not in caplog.text
+        row = dict(
+            zip(SPIDER_RUN_COLUMNS, mock_execute_values.call_args[0][2][0], strict=True)
+        )
+        assert row["known_jobs_skipped"] == 25
+
+    def test_empty_run_reported(self, mock_connect, caplog):
+        """Test a run without items, unchanged pages or known jobs is flagged."""
+        monitor, spider = make_monitor("avianca", {"item_scraped_count": 0})
+        monitor.spider_opened(spider)
+
+        monitor.spider_closed(spider, "finished")
+
+        assert "scraped 0 items" in caplog.text
+
+
+class TestEmailNotificationExtension:
+    """Test per-spider emails are queued."""
+
+    @pytest.fixture
+    def stats(self):
+        """Create stats of a crawl that found one new job."""
+        stats = MagicMock()
+        stats.get_value.side_effect = lambda key, default=None: {
+            "new_jobs": [{"title": "Pilot"}],
+            "new_jobs_count": 1,
+        }.get(key, default)
+        return stats
+
+    @pytest.fixture
+    def spider(self):
+        """Create a spider stand-in."""
+        spider = MagicMock()
+        spider.name = "avianca"
+        return spider
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.notification_queue")
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.email_notifier")
+    def test_new_jobs_queued_not_sent(self, mock_notifier, mock_queue, stats, spider):
+        """Test closing a spider queues its email instead of sending it."""
+        EmailNotificationExtension(stats).spider_closed(spider, "finished")
+
+        mock_queue.put.assert_called_once_with(
+            "new_jobs", {"jobs": [{"title": "Pilot"}], "spider_name": "avianca"}
+        )
+        mock_notifier.send_new_jobs_notification.assert_not_called()
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.notification_queue")
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.email_notifier")
+    def test_digest_mode_defers_email(
+        self, mock_notifier, mock_queue, stats, spider, tmp_path
+    ):
+        """Test scheduler workers leave their new jobs to the cycle digest."""
+        ext = EmailNotificationExtension(stats, digest_dir=tmp_path)
+        ext.spider_closed(spider, "finished")
+
+        mock_queue.put.assert_not_called()
+        assert JsonFileStore(tmp_path / "avianca.json").load() == {
+            "jobs": [{"title": "Pilot"}],
+            "spider_name": "avianca",
+        }
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.notification_queue")
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.email_notifier")
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.settings")
+    def test_standalone_crawl_queues_email_in_digest_mode(
+        self, mock_settings, mock_notifier, mock_queue, stats, spider
+    ):
+        """Test a crawl outside the scheduler still queues its new jobs."""
+        mock_settings.email.digest = True
+
+        EmailNotificationExtension(stats).spider_closed(spider, "finished")
+
+        mock_queue.put.assert_called_once_with(
+            "new_jobs", {"jobs": [{"title": "Pilot"}], "spider_name": "avianca"}
+        )
+
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.deferToThread")
+    @patch("jobsearchtools.job_scraper.job_scraper.extensions.email_notifier")
+    def test_queue_drained_on_stop_only_if_enabled(
+        self, mock_notifier, mock_defer, stats
+    ):
+        """Test standalone crawls deliver the queue once the engine stopped."""
+        assert EmailNotificationExtension(stats).engine_stopped() is None
+        mock_defer.assert_not_called()
+
+        EmailNotificationExtension(stats, drain_on_stop=True).engine_stopped()
+
+        mock_defer.assert_called_once()
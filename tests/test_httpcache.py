@@ -0,0 +1,159 @@
+"""Tests for conditional requests of listing pages."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from scrapy import Spider
+from scrapy.exceptions import IgnoreRequest
+from scrapy.http import HtmlResponse, Request, Response
+from scrapy.utils.test import get_crawler
+
+from jobsearchtools.job_scraper.job_scraper.httpcache import (
+    ConditionalCacheMiddleware,
+)
+from jobsearchtools.job_scraper.job_scraper.signals import page_unchanged
+
+URL = "https://jobs.avianca.com/search/"
+DETAIL_URL = "https://jobs.avianca.com/job/Bogota-Pilot/111/"
+
+
+class ListingSpider(Spider):
+    """Spider with a listing and a detail callback."""
+
+    name = "avianca"
+
+    def parse(self, response):
+        """Parse a listing page."""
+
+    def parse_detail(self, response, item):
+        """Complete an item on its detail page."""
+        item["description"] = "Fly planes"
+        yield item
+
+
+@pytest.fixture
+def middleware(tmp_path):
+    """Create the cache middleware storing pages in a temporary directory."""
+    crawler = get_crawler(
+        Spider,
+        {
+            "HTTPCACHE_ENABLED": True,
+            "HTTPCACHE_DIR": str(tmp_path),
+            "HTTPCACHE_POLICY": "jobsearchtools.job_scraper.job_scraper.httpcache."
+            "ConditionalRequestPolicy",
+        },
+    )
+    crawler.spider = Spider.from_crawler(crawler, name="avianca")
+    crawler.stats.open_spider()
+    mw = ConditionalCacheMiddleware.from_crawler(crawler)
+    mw.spider_opened(crawler.spider)
+    yield mw
+    mw.spider_closed(crawler.spider)
+
+
+def fetch(middleware, status=200, headers=None, request=None):
+    """Send a request through the middleware with a canned response."""
+    request = request or Request(URL)
+    assert middleware.process_request(request) is None
+    response = HtmlResponse(
+        URL, status=status, headers=headers or {}, body=b"<html></html>"
+    )
+    if status == 304:
+        response = Response(URL, status=304, headers=headers or {})
+    return request, middleware.process_response(request, response)
+
+
+class TestConditionalCacheMiddleware:
+    """Test pages are revalidated and unchanged ones skipped."""
+
+    def test_validators_sent_on_next_fetch(self, middleware):
+        """Test a stored ETag and Last-Modified become conditional headers."""
+        fetch(
+            middleware,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"},
+        )
+
+        request = Request(URL)
+        middleware.process_request(request)
+
+        assert request.headers[b"If-None-Match"] == b'"v1"'
+        assert request.headers[b"If-Modified-Since"].startswith(b"Mon, 05 Oct")
+
+    def test_unchanged_page_skipped_with_signal(self, middleware):
+        """Test a 304 drops the request and sends page_unchanged."""
+        fetch(middleware, headers={"ETag": '"v1"'})
+        received = MagicMock()
+        middleware.crawler.signals.connect(received, signal=page_unchanged)
+
+        with pytest.raises(IgnoreRequest):
+            fetch(middleware, status=304)
+
+        received.assert_called_once()
+        assert received.call_args.kwargs["request"].url == URL
+        assert middleware.stats.get_value("httpcache/unchanged") == 1
+
+    def test_changed_page_parsed(self, middleware):
+        """Test a page that changed since the last run is returned."""
+        fetch(middleware, headers={"ETag": '"v1"'})
+
+        _, response = fetch(middleware, headers={"ETag": '"v2"'})
+
+        assert response.status == 200
+        assert "cached" not in response.flags
+
+    def test_pages_without_validators_not_stored(self, middleware):
+        """Test pages the server cannot revalidate are fetched in full."""
+        fetch(middleware)
+
+        request = Request(URL)
+        middleware.process_request(request)
+
+        assert b"If-None-Match" not in request.headers
+        assert middleware.stats.get_value("httpcache/uncacheable") == 1
+
+    def test_playwright_requests_bypass_cache(self, middleware):
+        """Test browser-rendered pages are never cached."""
+        request = Request(URL, meta={"playwright": True})
+        fetch(middleware, headers={"ETag": '"v1"'}, request=request)
+
+        assert middleware.stats.get_value("httpcache/store") is None
+
+    def test_detail_pages_always_downloaded(self, middleware):
+        """Test a detail page is never revalidated, so its item is kept."""
+        spider = ListingSpider()
+
+        def detail_request():
+            return Request(
+                DETAIL_URL,
+                callback=spider.parse_detail,
+                cb_kwargs={"item": {"job_id": "avianca_111"}},
+            )
+
+        fetch(middleware, headers={"ETag": '"v1"'}, request=detail_request())
+        request = detail_request()
+        middleware.process_request(request)
+        assert b"If-None-Match" not in request.headers
+
+        # Even a 304 is passed on instead of dropping the request
+        not_modified = Response(DETAIL_URL, status=304)
+        assert middleware.process_response(request, not_modified) is not_modified
+
+        response = HtmlResponse(DETAIL_URL, body=b"<html></html>", request=request)
+        items = list(request.callback(response, **request.cb_kwargs))
+
+        assert items == [{"job_id": "avianca_111", "description": "Fly planes"}]
+        assert middleware.stats.get_value("httpcache/unchanged") is None
+
+    def test_listing_flag_overrides_callback(self, middleware):
+        """Test meta["conditional_cache"] opts a request in or out."""
+        spider = ListingSpider()
+        opted_out = Request(URL, meta={"conditional_cache": False})
+        opted_in = Request(
+            DETAIL_URL,
+            callback=spider.parse_detail,
+            meta={"conditional_cache": True},
+        )
+
+        policy = middleware.policy
+        assert not policy.should_cache_request(opted_out)
+        assert policy.should_cache_request(opted_in)
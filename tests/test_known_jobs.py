@@ -0,0 +1,128 @@
+"""Tests for the known jobs lookup used to skip detail requests."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+
+from jobsearchtools.job_scraper.job_scraper.cache import JsonFileStore
+from jobsearchtools.job_scraper.job_scraper.known_jobs import KnownJobsLookup
+from jobsearchtools.job_scraper.job_scraper.spiders.static.avianca import (
+    AviancaSpider,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a cache file store in a temporary directory."""
+    return JsonFileStore(tmp_path / "known_jobs" / "test.json")
+
+
+@pytest.fixture
+def mock_connection():
+    """Create a mock database connection and cursor."""
+    conn = MagicMock()
+    conn.closed = False
+    cursor = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    return conn, cursor
+
+
+class TestKnownJobsLookup:
+    """Test cache and database backed job id lookups."""
+
+    def test_unknown_ids_checked_in_one_query(self, store, mock_connection):
+        """Test ids missing from the cache are looked up together."""
+        conn, cursor = mock_connection
+        cursor.fetchall.return_value = [("a",)]
+        lookup = KnownJobsLookup(store, ttl_hours=24, connect=lambda: conn)
+
+        assert lookup.filter_known(["a", "b"]) == {"a"}
+        cursor.execute.assert_called_once()
+        assert sorted(cursor.execute.call_args[0][1][0]) == ["a", "b"]
+
+    def test_cache_file_answers_next_run(self, store, mock_connection):
+        """Test confirmed ids are persisted and reused without a query."""
+        conn, cursor = mock_connection
+        cursor.fetchall.return_value = [("a",)]
+        lookup = KnownJobsLookup(store, ttl_hours=24, connect=lambda: conn)
+        lookup.filter_known(["a"])
+        lookup.remember(["c"])
+        lookup.close()
+
+        cursor.reset_mock()
+        next_run = KnownJobsLookup(store, ttl_hours=24, connect=lambda: conn)
+
+        assert next_run.filter_known(["a", "c"]) == {"a", "c"}
+        cursor.execute.assert_not_called()
+
+    def test_expired_cache_is_ignored(self, store):
+        """Test a cache older than its TTL is not trusted."""
+        created_at = datetime.now(UTC) - timedelta(hours=48)
+        store.save({"created_at": created_at.isoformat(), "job_ids": ["a"]})
+
+        lookup = KnownJobsLookup(store, ttl_hours=24)
+
+        assert lookup.filter_known(["a"]) == set()
+
+    def test_database_errors_fall_back_to_cache(self, store, mock_connection):
+        """Test a failing query only returns cached ids."""
+        conn, cursor = mock_connection
+        cursor.execute.side_effect = Exception("DB down")
+        lookup = KnownJobsLookup(store, ttl_hours=24, connect=lambda: conn)
+        lookup.remember(["a"])
+
+        assert lookup.filter_known(["a", "b"]) == {"a"}
+
+    def test_known_jobs_refreshed_on_their_day(self, store):
+        """Test each known job is reported unknown one day per period."""
+        lookup = KnownJobsLookup(store, ttl_hours=24, refresh_days=7)
+        lookup.remember(["a", "b", "c"])
+
+        due_days = [
+            [day for day in range(7) if lookup.refresh_due(job_id, day)]
+            for job_id in ("a", "b", "c")
+        ]
+
+        assert all(len(days) == 1 for days in due_days)
+        day = due_days[0][0]
+        with patch("jobsearchtools.job_scraper.job_scraper.known_jobs.date") as mock:
+            mock.today.return_value.toordinal.return_value = day
+            assert "a" not in lookup.filter_known(["a", "b", "c"])
+
+
+class TestSpiderSkipsKnownJobs:
+    """Test spiders skip detail requests for stored jobs."""
+
+    def test_avianca_skips_known_detail_pages(self, store):
+        """Test known listings are skipped instead of followed."""
+        html = """
+        <table>
+          <tr class="data-row">
+            <td><a class="jobTitle-link" href="/job/Bogota-Pilot/111/">Pilot</a></td>
+          </tr>
+          <tr class="data-row">
+            <td><a class="jobTitle-link" href="/job/Bogota-Crew/222/">Crew</a></td>
+          </tr>
+        </table>
+        """
+        url = "https://jobs.avianca.com/search/"
+        response = HtmlResponse(
+            url=url, body=html, encoding="utf-8", request=Request(url)
+        )
+        crawler = get_crawler(AviancaSpider)
+        spider = AviancaSpider.from_crawler(crawler)
+        spider.known_jobs = KnownJobsLookup(store, ttl_hours=24)
+        spider.known_jobs.remember(["avianca_111"])
+
+        results = list(spider.parse(response))
+
+        items = [r for r in results if not hasattr(r, "callback")]
+        requests = [r for r in results if hasattr(r, "callback")]
+        assert items == []
+        assert [r.url for r in requests] == [
+            "https://jobs.avianca.com/job/Bogota-Crew/222/"
+        ]
+        assert crawler.stats.get_value("known_jobs/requests_saved") == 1
@@ -0,0 +1,34 @@
+"""Tests for the SQL migrations applied by the Docker entrypoint."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+MIGRATIONS_DIR = (
+    Path(__file__).parent.parent
+    / "src/jobsearchtools/job_scraper/job_scraper/migrations"
+)
+
+# Statements that need their table to exist already
+TABLE_REFERENCES = re.compile(
+    r"ALTER TABLE (\w+)"
+    r"|COMMENT ON TABLE (\w+)"
+    r"|COMMENT ON COLUMN (\w+)\."
+    r"|CREATE INDEX IF NOT EXISTS \w+\s+ON (\w+)"
+    r"|AFTER UPDATE OF \w+ ON (\w+)"
+)
+CREATED_TABLE = re.compile(r"CREATE TABLE IF NOT EXISTS (\w+)")
+
+
+@pytest.mark.parametrize(
+    "migration", sorted(MIGRATIONS_DIR.glob("*.sql")), ids=lambda path: path.name
+)
+def test_migration_applies_to_empty_database(migration):
+    """Test every table a migration changes is created earlier in the file."""
+    sql = migration.read_text(encoding="utf-8")
+
+    for match in TABLE_REFERENCES.finditer(sql):
+        table = next(group for group in match.groups() if group)
+        created = {m.group(1) for m in CREATED_TABLE.finditer(sql, 0, match.start())}
+        assert table in created, f"{table} is used before it is created"
@@ -0,0 +1,340 @@
+"""Tests for the persistent notification queue and its dispatcher."""
+
+import base64
+import os
+import socket
+import socketserver
+import threading
+import time
+from email import message_from_bytes
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jobsearchtools.notifications import queue as queue_module
+from jobsearchtools.notifications.email_notifier import EmailNotifier
+from jobsearchtools.notifications.queue import (
+    CLAIM_TIMEOUT,
+    NotificationDispatcher,
+    NotificationQueue,
+)
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    """Local SMTP server that keeps received messages in memory."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        """Listen on a free local port."""
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.messages: list[bytes] = []
+        self.logins: list[str] = []
+        # Reply code for MAIL FROM, e.g. 451 to simulate an outage
+        self.mail_reply = "250 OK"
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on."""
+        return self.server_address[1]
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue: EHLO, AUTH PLAIN, MAIL, RCPT, DATA, QUIT."""
+
+    def reply(self, line: str) -> None:
+        """Send one reply line."""
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        """Serve one SMTP session."""
+        self.reply("220 localhost SMTP stand-in")
+        for raw in self.rfile:
+            command = raw.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250 AUTH PLAIN")
+            elif verb == "AUTH":
+                credentials = base64.b64decode(command.split()[-1]).split(b"\0")
+                self.server.logins.append(credentials[1].decode())
+                self.reply("235 Authenticated")
+            elif verb == "MAIL":
+                self.reply(self.server.mail_reply)
+            elif verb in ("RCPT", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                    lines.append(data)
+                self.server.messages.append(b"".join(lines))
+                self.reply("250 Queued")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+@pytest.fixture
+def smtp_server():
+    """Run the SMTP stand-in for the duration of a test."""
+    server = SMTPStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def notifier(smtp_server):
+    """Create a notifier sending to the SMTP stand-in."""
+    with patch("jobsearchtools.notifications.email_notifier.settings") as mock:
+        mock.email.enabled = True
+        mock.email.smtp_host = "127.0.0.1"
+        mock.email.smtp_port = smtp_server.port
+        mock.email.smtp_user = "scraper@test.com"
+        mock.email.smtp_password = "testpass"  # noqa: S105
+        mock.email.from_address = "from@test.com"
+        mock.email.to_address = "to@test.com"
+        mock.email.use_tls = False
+        mock.email.smtp_timeout = 5.0
+        mock.email.smtp_keepalive_interval = 30.0
+        mock.email.smtp_idle_timeout = 300.0
+        mock.email.max_jobs = 200
+        mock.email.digest_max_jobs = 50
+        mock.email.digest_split = True
+        yield EmailNotifier()
+
+
+@pytest.fixture
+def silent_server():
+    """Accept SMTP connections but never answer them."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    yield listener
+    listener.close()
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Create an empty queue in a temporary directory."""
+    return NotificationQueue(tmp_path / "notification_queue", max_size=3)
+
+
+JOB = {
+    "title": "Data Engineer",
+    "company": "Avianca",
+    "location": "Bogota",
+    "url": "https://jobs.avianca.com/job/1",
+}
+
+
+class TestNotificationQueue:
+    """Test entries are stored, claimed and bounded on disk."""
+
+    def test_entries_claimed_in_order(self, queue):
+        """Test the oldest due entry is claimed first and only once."""
+        queue.put("new_jobs", {"jobs": [JOB], "spider_name": "first"})
+        queue.put("new_jobs", {"jobs": [JOB], "spider_name": "second"})
+
+        claimed, entry = queue.claim()
+
+        assert entry["payload"]["spider_name"] == "first"
+        assert claimed.suffix == ".sending"
+        assert len(queue) == 1
+        assert queue.claim()[1]["payload"]["spider_name"] == "second"
+        assert queue.claim() is None
+
+    def test_completed_entry_removed(self, queue):
+        """Test a delivered entry leaves the queue."""
+        queue.put("digest", {"jobs_by_spider": {}})
+        claimed, _ = queue.claim()
+
+        queue.complete(claimed)
+
+        assert list(queue.directory.iterdir()) == []
+
+    def test_retried_entry_not_due_until_backoff(self, queue):
+        """Test a retried entry waits for its next attempt time."""
+        queue.put("digest", {"jobs_by_spider": {}})
+        claimed, entry = queue.claim()
+
+        queue.retry(claimed, entry, delay=60)
+
+        assert queue.claim() is None
+        assert queue.claim(now=time.time() + 61) is not None
+
+    def test_oldest_dropped_when_full(self, queue):
+        """Test the queue never holds more than its maximum size."""
+        paths = [queue.put("digest", {"n": n}) for n in range(4)]
+
+        assert len(queue) == 3
+        assert (queue.directory / "failed" / paths[0].name).exists()
+
+    def test_stale_claim_released(self, queue):
+        """Test an entry claimed by a process that died is queued again."""
+        queue.put("digest", {"jobs_by_spider": {}})
+        claimed, _ = queue.claim()
+        stale = time.time() - CLAIM_TIMEOUT - 1
+        os.utime(claimed, (stale, stale))
+
+        assert queue.claim() is not None
+
+
+class TestNotificationDispatcher:
+    """Test queued notifications are delivered over SMTP."""
+
+    def test_new_jobs_delivered(self, queue, notifier, smtp_server):
+        """Test a queued notification reaches the SMTP server once."""
+        queue.put("new_jobs", {"jobs": [JOB], "spider_name": "avianca"})
+        dispatcher = NotificationDispatcher(queue, notifier)
+
+        assert dispatcher.dispatch_pending() == 1
+        assert dispatcher.dispatch_pending() == 0
+
+        assert smtp_server.logins == ["scraper@test.com"]
+        assert len(smtp_server.messages) == 1
+        message = message_from_bytes(smtp_server.messages[0])
+        assert message["Subject"] == "New Job Listings Found - AVIANCA"
+        assert len(queue) == 0
+
+    def test_digest_delivered(self, queue, notifier, smtp_server):
+        """Test a queued digest is sent as a digest email."""
+        queue.put("digest", {"jobs_by_spider": {"avianca": [JOB]}})
+
+        NotificationDispatcher(queue, notifier).dispatch_pending()
+
+        message = message_from_bytes(smtp_server.messages[0])
+        assert message["Subject"].startswith("New Job Listings Digest")
+
+    def test_failed_delivery_retried_with_backoff(self, queue, notifier, smtp_server):
+        """Test a rejected message is retried later, then given up on."""
+        smtp_server.mail_reply = "451 Try again later"
+        queue.put("new_jobs", {"jobs": [JOB], "spider_name": "avianca"})
+        dispatcher = NotificationDispatcher(
+            queue, notifier, max_attempts=2, retry_backoff=60
+        )
+
+        assert dispatcher.dispatch_pending() == 0
+        retried = next(queue.directory.glob("*.json"))
+        assert retried.stat().st_size > 0
+        assert queue.claim() is None
+
+        claimed, entry = queue.claim(now=time.time() + 61)
+        dispatcher._deliver(claimed, entry)
+
+        assert len(queue) == 0
+        assert len(list((queue.directory / "failed").iterdir())) == 1
+        assert smtp_server.messages == []
+
+    def test_backoff_doubles_up_to_maximum(self, queue):
+        """Test retry delays grow exponentially and are capped."""
+        dispatcher = NotificationDispatcher(
+            queue, MagicMock(), retry_backoff=30, max_backoff=100
+        )
+
+        assert [dispatcher.backoff(n) for n in range(1, 5)] == [30, 60, 100, 100]
+
+    def test_worker_thread_delivers_in_background(self, queue, notifier, smtp_server):
+        """Test the started dispatcher drains the queue on its own."""
+        dispatcher = NotificationDispatcher(queue, notifier, poll_interval=0.05)
+        dispatcher.start()
+        try:
+            queue.put("new_jobs", {"jobs": [JOB], "spider_name": "avianca"})
+            dispatcher.notify()
+            deadline = time.monotonic() + 5
+            while not smtp_server.messages and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            dispatcher.stop(timeout=5)
+
+        assert len(smtp_server.messages) == 1
+        assert not dispatcher.running
+
+    def test_slow_delivery_not_sent_twice(self, queue, monkeypatch):
+        """Test a claim kept fresh by a slow sender is not taken over."""
+        monkeypatch.setattr(queue_module, "CLAIM_HEARTBEAT", 0.05)
+        monkeypatch.setattr(queue_module, "CLAIM_TIMEOUT", 0.3)
+        slow, other = MagicMock(), MagicMock()
+        slow.send_new_jobs_notification.side_effect = lambda *args: (
+            time.sleep(1) or True
+        )
+        queue.put("new_jobs", {"jobs": [JOB], "spider_name": "avianca"})
+        sender = threading.Thread(
+            target=NotificationDispatcher(queue, slow).dispatch_pending
+        )
+        sender.start()
+        time.sleep(0.6)
+
+        assert NotificationDispatcher(queue, other).dispatch_pending() == 0
+        sender.join()
+
+        slow.send_new_jobs_notification.assert_called_once()
+        other.send_new_jobs_notification.assert_not_called()
+        assert list(queue.directory.iterdir()) == []
+
+
+def test_dispatcher_reuses_smtp_session(queue, notifier, smtp_server):
+    """Test several queued notifications are sent over one login."""
+    for spider_name in ("avianca", "citi", "visa"):
+        queue.put("new_jobs", {"jobs": [JOB], "spider_name": spider_name})
+
+    NotificationDispatcher(queue, notifier).dispatch_pending()
+
+    assert len(smtp_server.messages) == 3
+    assert smtp_server.logins == ["scraper@test.com"]
+    assert notifier.sends_per_session == 3.0
+
+
+class TestUnresponsiveServer:
+    """Test a server that stops answering cannot hang the dispatcher."""
+
+    def test_send_times_out(self, queue, notifier, silent_server):
+        """Test a silent server fails the delivery after the SMTP timeout."""
+        with patch("jobsearchtools.notifications.email_notifier.settings") as mock:
+            mock.email.smtp_host = "127.0.0.1"
+            mock.email.smtp_port = silent_server.getsockname()[1]
+            mock.email.smtp_timeout = 0.2
+            queue.put("new_jobs", {"jobs": [JOB], "spider_name": "avianca"})
+            dispatcher = NotificationDispatcher(queue, notifier)
+
+            started = time.monotonic()
+            assert dispatcher.dispatch_pending() == 0
+
+        assert time.monotonic() - started < 5
+        assert len(queue) == 1
+
+    def test_stop_does_not_wait_for_hung_send(self, queue):
+        """Test stop returns while a send holds the SMTP session."""
+        notifier = MagicMock()
+        release = threading.Event()
+        notifier.send_new_jobs_notification.side_effect = lambda *args: release.wait(5)
+        queue.put("new_jobs", {"jobs": [JOB], "spider_name": "avianca"})
+        dispatcher = NotificationDispatcher(queue, notifier, poll_interval=0.05)
+        dispatcher.start()
+        deadline = time.monotonic() + 5
+        while not notifier.send_new_jobs_notification.called:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        dispatcher.stop(timeout=0.1)
+
+        assert dispatcher.running
+        notifier.close.assert_not_called()
+        release.set()
+
+    def test_close_skipped_while_session_in_use(self, notifier):
+        """Test close gives up instead of waiting for a hung send."""
+        notifier._session = MagicMock()
+        with notifier._session_lock:
+            assert notifier.close(timeout=0.05) is False
+
+        notifier._session.quit.assert_not_called()
+        assert notifier.close(timeout=0.05) is True
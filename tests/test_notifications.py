@@ -1,5 +1,7 @@
 """Tests for email notification system."""
 
+import smtplib
+from email import message_from_string
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,23 +9,30 @@ import pytest
 from jobsearchtools.notifications.email_notifier import EmailNotifier
 
 
+@pytest.fixture
+def mock_settings():
+    """Create mock email settings for the notifier."""
+    with patch("jobsearchtools.notifications.email_notifier.settings") as mock:
+        mock.email.enabled = True
+        mock.email.smtp_host = "smtp.test.com"
+        mock.email.smtp_port = 587
+        mock.email.smtp_user = "test@test.com"
+        mock.email.smtp_password = "testpass"  # noqa: S105
+        mock.email.from_address = "from@test.com"
+        mock.email.to_address = "to@test.com"
+        mock.email.use_tls = True
+        mock.email.smtp_timeout = 5.0
+        mock.email.smtp_keepalive_interval = 30.0
+        mock.email.smtp_idle_timeout = 300.0
+        mock.email.max_jobs = 200
+        mock.email.digest_max_jobs = 50
+        mock.email.digest_split = True
+        yield mock
+
+
 class TestEmailNotifier:
     """Test email notification functionality."""
 
-    @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings for testing."""
-        with patch("jobsearchtools.notifications.email_notifier.settings") as mock:
-            mock.email.enabled = True
-            mock.email.smtp_host = "smtp.test.com"
-            mock.email.smtp_port = 587
-            mock.email.smtp_user = "test@test.com"
-            mock.email.smtp_password = "testpass"  # noqa: S105
-            mock.email.from_address = "from@test.com"
-            mock.email.to_address = "to@test.com"
-            mock.email.use_tls = True
-            yield mock
-
     def test_initialization_enabled(self, mock_settings):
         """Test notifier initializes when enabled."""
         notifier = EmailNotifier()
@@ -49,7 +58,7 @@ class TestEmailNotifier:
     def test_send_notification_success(self, mock_smtp, mock_settings):
         """Test successful email notification."""
         mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
 
         notifier = EmailNotifier()
         jobs = [
@@ -71,7 +80,7 @@ class TestEmailNotifier:
     def test_send_multiple_jobs(self, mock_smtp, mock_settings):
         """Test notification with multiple jobs."""
         mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
 
         notifier = EmailNotifier()
         jobs = [
@@ -128,3 +137,153 @@ class TestEmailNotifier:
         # HTML should contain the description (possibly truncated with "...")
         assert "AAAA" in html  # Part of description should be present
         assert "Description" in html or "description" in html.lower()
+
+    def test_html_email_capped_with_more_tail(self, mock_settings):
+        """Test jobs beyond the cap are summarized instead of rendered."""
+        mock_settings.email.max_jobs = 2
+        jobs = [
+            {"title": f"Job {n}", "company": "Corp", "url": f"http://e.com/{n}"}
+            for n in range(5)
+        ]
+
+        html = EmailNotifier()._generate_html_email(jobs, "test_spider")
+
+        assert html.count('class="job-card"') == 2
+        assert "<strong>5</strong> new position(s)" in html
+        assert "+3 more" in html
+        assert html.rstrip().endswith("</html>")
+
+
+class TestDigest:
+    """Test cycle digests grouping every spider's new jobs."""
+
+    JOBS = {
+        "citi": [{"title": "Analyst", "company": "Citi", "url": "http://c/1"}],
+        "avianca": [
+            {"title": "Pilot", "company": "Avianca", "url": "http://a/1"},
+            {"title": "Crew", "company": "Avianca", "url": "http://a/2"},
+        ],
+    }
+
+    @pytest.fixture
+    def capped_settings(self, mock_settings):
+        """Cap digests at two jobs."""
+        mock_settings.email.digest_max_jobs = 2
+        return mock_settings
+
+    @pytest.fixture
+    def mock_server(self):
+        """Patch the SMTP client and return the connected server."""
+        with patch("smtplib.SMTP") as mock_smtp:
+            server = MagicMock()
+            mock_smtp.return_value = server
+            yield server
+
+    def test_digest_spills_over_one_session(self, capped_settings, mock_server):
+        """Test jobs beyond the cap go out in a second message, one login."""
+        assert EmailNotifier().send_digest(self.JOBS) is True
+
+        mock_server.login.assert_called_once()
+        assert mock_server.sendmail.call_count == 2
+
+    def test_digest_capped_without_split(self, capped_settings, mock_server):
+        """Test a single capped digest reports the jobs left out."""
+        capped_settings.email.digest_split = False
+
+        assert EmailNotifier().send_digest(self.JOBS) is True
+
+        mock_server.sendmail.assert_called_once()
+        message = message_from_string(mock_server.sendmail.call_args[0][2])
+        html = message.get_payload()[0].get_payload(decode=True).decode()
+        assert "+1 more" in html
+
+    def test_digest_grouped_by_company(self, capped_settings):
+        """Test the digest lists each company once with its jobs."""
+        jobs = sorted(
+            [job for jobs in self.JOBS.values() for job in jobs],
+            key=lambda job: job["company"],
+        )
+
+        html = EmailNotifier()._generate_digest_html(jobs, 3, 2)
+
+        assert html.count("Avianca (2)") == 1
+        assert html.index("Avianca (2)") < html.index("Pilot") < html.index("Citi (1)")
+
+    def test_empty_digest_not_sent(self, capped_settings, mock_server):
+        """Test a cycle without new jobs sends nothing."""
+        assert EmailNotifier().send_digest({"citi": []}) is False
+        mock_server.sendmail.assert_not_called()
+
+
+class TestSmtpSession:
+    """Test the SMTP session is reused between sends."""
+
+    JOBS = [{"title": "Pilot", "company": "Avianca", "url": "http://a/1"}]
+
+    @pytest.fixture
+    def mock_smtp(self):
+        """Patch the SMTP client with one returning a new server per connect."""
+        with patch("smtplib.SMTP") as mock_smtp:
+            mock_smtp.side_effect = lambda *args, **kwargs: MagicMock()
+            yield mock_smtp
+
+    def test_session_reused_between_sends(self, mock_settings, mock_smtp):
+        """Test consecutive notifications share one handshake."""
+        notifier = EmailNotifier()
+
+        assert notifier.send_new_jobs_notification(self.JOBS, "avianca")
+        assert notifier.send_new_jobs_notification(self.JOBS, "avianca")
+
+        mock_smtp.assert_called_once()
+        assert notifier.session_stats["messages"] == 2
+        assert notifier.sends_per_session == 2.0
+
+    def test_idle_session_checked_with_noop(self, mock_settings, mock_smtp):
+        """Test a session idle past the keepalive interval reconnects if dead."""
+        notifier = EmailNotifier()
+        notifier.send_new_jobs_notification(self.JOBS, "avianca")
+        stale = notifier._session
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected()
+        notifier._session_used_at -= 60
+
+        assert notifier.send_new_jobs_notification(self.JOBS, "avianca")
+
+        assert mock_smtp.call_count == 2
+        assert notifier.session_stats["reconnects"] == 1
+        stale.sendmail.assert_called_once()
+
+    def test_session_closed_after_idle_timeout(self, mock_settings, mock_smtp):
+        """Test a session unused for too long is replaced without NOOP."""
+        notifier = EmailNotifier()
+        notifier.send_new_jobs_notification(self.JOBS, "avianca")
+        stale = notifier._session
+        notifier._session_used_at -= 600
+
+        notifier.send_new_jobs_notification(self.JOBS, "avianca")
+
+        stale.noop.assert_not_called()
+        stale.quit.assert_called_once()
+        assert mock_smtp.call_count == 2
+
+    def test_reconnect_when_server_dropped_session(self, mock_settings, mock_smtp):
+        """Test a send on a dropped session is retried on a new one."""
+        notifier = EmailNotifier()
+        notifier.send_new_jobs_notification(self.JOBS, "avianca")
+        notifier._session.sendmail.side_effect = smtplib.SMTPServerDisconnected()
+
+        assert notifier.send_new_jobs_notification(self.JOBS, "avianca") is True
+
+        assert mock_smtp.call_count == 2
+        assert notifier._session.sendmail.call_count == 1
+        assert notifier.session_stats["messages"] == 2
+
+    def test_close_quits_session(self, mock_settings, mock_smtp):
+        """Test closing the notifier ends the SMTP session."""
+        notifier = EmailNotifier()
+        notifier.send_new_jobs_notification(self.JOBS, "avianca")
+        session = notifier._session
+
+        notifier.close()
+
+        session.quit.assert_called_once()
+        assert notifier._session is None
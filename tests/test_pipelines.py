@@ -0,0 +1,452 @@
+"""Tests for the PostgreSQL item pipeline."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jobsearchtools.job_scraper.job_scraper.pipelines import (
+    ADDED_COLUMNS,
+    INDEXES,
+    PostgreSQLPipeline,
+    job_fingerprint,
+)
+
+
+@pytest.fixture
+def mock_settings():
+    """Create mock settings for the pipeline."""
+    with patch("jobsearchtools.job_scraper.job_scraper.pipelines.settings") as mock:
+        mock.database.password = "testpass"  # noqa: S105
+        mock.database.pool_size = 5
+        mock.database.write_mode = "batch"
+        mock.database.batch_size = 3
+        mock.database.batch_flush_seconds = 3600
+        mock.database.known_jobs_index = False
+        mock.database.known_jobs_max_ids = 10
+        yield mock
+
+
+@pytest.fixture
+def mock_pool():
+    """Patch the connection pool and expose the pooled connection."""
+    with patch(
+        "jobsearchtools.job_scraper.job_scraper.pipelines.psycopg2.pool"
+        ".ThreadedConnectionPool"
+    ) as pool_class:
+        conn = MagicMock()
+        # Schema check: history function and trigger already installed
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (True, True)
+        pool_class.return_value.getconn.return_value = conn
+        yield conn
+
+
+@pytest.fixture
+def spider():
+    """Create a mock spider with a stats collector."""
+    spider = MagicMock()
+    spider.name = "test_spider"
+    return spider
+
+
+def make_item(job_id):
+    """Build a minimal job item."""
+    return {
+        "job_id": job_id,
+        "title": f"Job {job_id}",
+        "company": "TestCorp",
+        "url": f"https://example.com/{job_id}",
+    }
+
+
+class TestJobFingerprint:
+    """Test the content fingerprint used for change detection."""
+
+    def test_whitespace_and_date_types_ignored(self):
+        """Test formatting differences do not change the fingerprint."""
+        posted = datetime(2026, 10, 1, 9, 30)
+        first = job_fingerprint({"title": "Data  Engineer\n", "date_posted": posted})
+        second = job_fingerprint({"title": "Data Engineer", "date_posted": posted})
+
+        assert first == second
+        assert len(first) == 64
+
+    def test_content_change_detected(self):
+        """Test a changed field produces a different fingerprint."""
+        assert job_fingerprint({"location": "Bogota"}) != job_fingerprint(
+            {"location": "Medellin"}
+        )
+
+    def test_bookkeeping_fields_ignored(self, mock_settings, mock_pool):
+        """Test extraction time and opened flag are not part of the content."""
+        pipeline = PostgreSQLPipeline()
+        first = {**make_item("a"), "date_extracted": "2026-10-01T00:00:00"}
+        second = {**make_item("a"), "date_extracted": "2026-10-02T00:00:00"}
+        second["was_opened"] = True
+
+        assert pipeline._prepare_row(first)[-1] == pipeline._prepare_row(second)[-1]
+
+
+class TestImmediateWriteMode:
+    """Test the per-item upsert mode."""
+
+    @pytest.fixture
+    def immediate_settings(self, mock_settings):
+        """Switch the pipeline settings to per-item writes."""
+        mock_settings.database.write_mode = "immediate"
+        return mock_settings
+
+    @pytest.fixture
+    def cursor(self, mock_pool):
+        """Return the cursor the pipeline writes with."""
+        return mock_pool.cursor.return_value.__enter__.return_value
+
+    def test_new_job_tracked(self, immediate_settings, cursor, spider):
+        """Test an inserted row is reported as a new job."""
+        cursor.fetchone.return_value = {"inserted": True}
+        pipeline = PostgreSQLPipeline()
+
+        assert pipeline.process_item(make_item("a"), spider)
+
+        sql, row = cursor.execute.call_args[0]
+        assert "ON CONFLICT (job_id) DO UPDATE" in sql
+        assert "jobs.fingerprint IS DISTINCT FROM EXCLUDED.fingerprint" in sql
+        assert row[-1] == pipeline._prepare_row(make_item("a"))[-1]
+        assert pipeline.new_jobs_count == 1
+
+    def test_changed_job_counted_as_update(self, immediate_settings, cursor, spider):
+        """Test an updated row is not reported as a new job."""
+        cursor.fetchone.return_value = {"inserted": False}
+        pipeline = PostgreSQLPipeline()
+
+        assert pipeline.process_item(make_item("a"), spider)
+        pipeline.close_spider(spider)
+
+        assert pipeline.new_jobs == []
+        spider.crawler.stats.set_value.assert_any_call("updated_jobs_count", 1)
+
+    def test_unchanged_job_dropped(self, immediate_settings, cursor, spider):
+        """Test a job skipped by the upsert's WHERE clause is dropped."""
+        cursor.fetchone.return_value = None
+        pipeline = PostgreSQLPipeline()
+
+        assert pipeline.process_item(make_item("a"), spider) is None
+        assert pipeline.new_jobs_count == 0
+        assert pipeline.updated_jobs_count == 0
+
+    def test_failed_detail_keeps_stored_job(self, immediate_settings, cursor, spider):
+        """Test an item missing its detail page does not overwrite the job."""
+        cursor.fetchone.return_value = (1,)
+        pipeline = PostgreSQLPipeline()
+        item = {**make_item("a"), "description": None, "detail_failed": True}
+
+        assert pipeline.process_item(item, spider) is None
+        sql, params = cursor.execute.call_args[0]
+        assert sql.startswith("SELECT 1 FROM jobs")
+        assert params == ("a",)
+
+    def test_failed_detail_of_new_job_stored(self, immediate_settings, cursor, spider):
+        """Test a new job is stored even though its detail page failed."""
+        cursor.fetchone.side_effect = [None, {"inserted": True}]
+        pipeline = PostgreSQLPipeline()
+        item = {**make_item("a"), "description": None, "detail_failed": True}
+
+        assert pipeline.process_item(item, spider)
+        assert pipeline.new_jobs_count == 1
+
+
+class TestBatchWriteMode:
+    """Test the buffered write-behind mode."""
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_items_buffered_until_batch_size(
+        self, mock_execute_values, mock_settings, mock_pool, spider
+    ):
+        """Test no database write happens before the batch is full."""
+        mock_execute_values.return_value = []
+        pipeline = PostgreSQLPipeline()
+
+        pipeline.process_item(make_item("a"), spider)
+        pipeline.process_item(make_item("b"), spider)
+        mock_execute_values.assert_not_called()
+
+        pipeline.process_item(make_item("c"), spider)
+        mock_execute_values.assert_called_once()
+        rows = mock_execute_values.call_args[0][2]
+        assert [row[0] for row in rows] == ["a", "b", "c"]
+        mock_pool.commit.assert_called_once()
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_new_jobs_tracked_from_returned_ids(
+        self, mock_execute_values, mock_settings, mock_pool, spider
+    ):
+        """Test only ids the upsert inserted are counted as new."""
+        mock_execute_values.return_value = [("b", True)]
+        pipeline = PostgreSQLPipeline()
+
+        for job_id in ("a", "b", "c"):
+            pipeline.process_item(make_item(job_id), spider)
+
+        assert pipeline.new_jobs_count == 1
+        assert [job["job_id"] for job in pipeline.new_jobs] == ["b"]
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_duplicates_within_batch_written_once(
+        self, mock_execute_values, mock_settings, mock_pool, spider
+    ):
+        """Test repeated job_ids in one batch produce a single row."""
+        mock_execute_values.return_value = [("a", True)]
+        pipeline = PostgreSQLPipeline()
+
+        pipeline.process_item(make_item("a"), spider)
+        pipeline.process_item(make_item("a"), spider)
+        pipeline.close_spider(spider)
+
+        rows = mock_execute_values.call_args[0][2]
+        assert len(rows) == 1
+        assert pipeline.new_jobs_count == 1
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_close_spider_flushes_remaining_items(
+        self, mock_execute_values, mock_settings, mock_pool, spider
+    ):
+        """Test close_spider writes the partial batch and publishes stats."""
+        mock_execute_values.return_value = [("a", True)]
+        pipeline = PostgreSQLPipeline()
+
+        pipeline.process_item(make_item("a"), spider)
+        pipeline.close_spider(spider)
+
+        mock_execute_values.assert_called_once()
+        spider.crawler.stats.set_value.assert_any_call("new_jobs_count", 1)
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_flush_interval_triggers_write(
+        self, mock_execute_values, mock_settings, mock_pool, spider
+    ):
+        """Test an elapsed flush interval writes a partial batch."""
+        mock_execute_values.return_value = []
+        pipeline = PostgreSQLPipeline()
+        pipeline.batch_flush_seconds = 0
+
+        pipeline.process_item(make_item("a"), spider)
+
+        mock_execute_values.assert_called_once()
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_flush_error_rolls_back(
+        self, mock_execute_values, mock_settings, mock_pool, spider
+    ):
+        """Test a failed flush rolls back and does not count new jobs."""
+        mock_execute_values.side_effect = Exception("DB down")
+        pipeline = PostgreSQLPipeline()
+
+        pipeline.process_item(make_item("a"), spider)
+        pipeline.close_spider(spider)
+
+        mock_pool.rollback.assert_called_once()
+        assert pipeline.new_jobs_count == 0
+
+
+class TestCopyWriteMode:
+    """Test the COPY-based bulk ingest mode."""
+
+    @pytest.fixture
+    def copy_settings(self, mock_settings):
+        """Switch the pipeline settings to copy mode."""
+        mock_settings.database.write_mode = "copy"
+        return mock_settings
+
+    def test_rows_streamed_with_copy_expert(self, copy_settings, mock_pool, spider):
+        """Test full buffers are streamed into the staging table as CSV."""
+        cursor = mock_pool.cursor.return_value.__enter__.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, buf: copied.append(buf.read())
+        pipeline = PostgreSQLPipeline()
+
+        for job_id in ("a", "b", "c"):
+            pipeline.process_item(make_item(job_id), spider)
+
+        cursor.copy_expert.assert_called_once()
+        assert "COPY jobs_staging" in cursor.copy_expert.call_args[0][0]
+        lines = copied[0].splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith("test_spider,a,Job a,TestCorp")
+
+    def test_open_spider_discards_stale_staged_rows(
+        self, copy_settings, mock_pool, spider
+    ):
+        """Test rows staged by a crashed run are deleted before staging again."""
+        cursor = mock_pool.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 2
+        pipeline = PostgreSQLPipeline()
+
+        pipeline.open_spider(spider)
+
+        cursor.execute.assert_any_call(
+            "DELETE FROM jobs_staging WHERE spider_name = %s", ("test_spider",)
+        )
+        statements = [call[0][0] for call in cursor.execute.call_args_list]
+        assert statements.index(
+            "DELETE FROM jobs_staging WHERE spider_name = %s"
+        ) > max(i for i, sql in enumerate(statements) if "jobs_staging (" in sql)
+
+    def test_close_spider_merges_and_reports_new_jobs(
+        self, copy_settings, mock_pool, spider
+    ):
+        """Test the merge result feeds the new_jobs stats."""
+        cursor = mock_pool.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [
+            {**make_item("b"), "fingerprint": "b" * 64, "inserted": True},
+            {**make_item("c"), "fingerprint": "c" * 64, "inserted": False},
+        ]
+        pipeline = PostgreSQLPipeline()
+
+        pipeline.process_item(make_item("a"), spider)
+        pipeline.process_item(make_item("b"), spider)
+        pipeline.close_spider(spider)
+
+        cursor.copy_expert.assert_called_once()
+        merge_sql = cursor.execute.call_args_list[0][0][0]
+        assert "FROM jobs_staging" in merge_sql
+        assert "ON CONFLICT (job_id) DO UPDATE" in merge_sql
+        assert pipeline.new_jobs_count == 1
+        assert pipeline.updated_jobs_count == 1
+        spider.crawler.stats.set_value.assert_any_call("new_jobs", [make_item("b")])
+
+
+class TestKnownJobsIndex:
+    """Test the preloaded job_id index."""
+
+    @pytest.fixture
+    def index_settings(self, mock_settings):
+        """Enable the index in the pipeline settings."""
+        mock_settings.database.known_jobs_index = True
+        return mock_settings
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_unchanged_jobs_dropped_without_query(
+        self, mock_execute_values, index_settings, mock_pool, spider
+    ):
+        """Test jobs stored with the same fingerprint never reach the database."""
+        pipeline = PostgreSQLPipeline()
+        unchanged = make_item("test_spider_a")
+        changed = make_item("test_spider_b")
+        stored = {**changed, "title": "Old title"}
+        cursor = mock_pool.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [
+            ("test_spider_a", pipeline._prepare_row(unchanged)[-1]),
+            ("test_spider_b", pipeline._prepare_row(stored)[-1]),
+        ]
+        mock_execute_values.return_value = []
+        del spider.job_id_prefix  # Use the default "<name>_" prefix
+        pipeline.open_spider(spider)
+
+        assert pipeline.process_item(unchanged, spider) is None
+        assert pipeline.process_item(changed, spider)
+        assert pipeline.process_item(make_item("test_spider_c"), spider)
+        pipeline.close_spider(spider)
+
+        index_query = cursor.execute.call_args_list[-1][0]
+        assert "fingerprint" in index_query[0]
+        assert index_query[1][0] == "test\\_spider\\_%"
+        rows = mock_execute_values.call_args[0][2]
+        assert [row[0] for row in rows] == ["test_spider_b", "test_spider_c"]
+        spider.crawler.stats.set_value.assert_any_call("known_jobs/hits", 1)
+        spider.crawler.stats.set_value.assert_any_call("known_jobs/misses", 2)
+
+    @patch("jobsearchtools.job_scraper.job_scraper.pipelines.execute_values")
+    def test_failed_write_not_recorded(
+        self, mock_execute_values, index_settings, mock_pool, spider
+    ):
+        """Test a job whose write failed is written again when seen again."""
+        cursor = mock_pool.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = []
+        mock_execute_values.side_effect = Exception("DB down")
+        pipeline = PostgreSQLPipeline()
+        pipeline.open_spider(spider)
+        pipeline._flush_buffer(spider)
+
+        pipeline.process_item(make_item("test_spider_a"), spider)
+        pipeline._flush_buffer(spider)
+        mock_execute_values.side_effect = None
+        mock_execute_values.return_value = [("test_spider_a", True)]
+        pipeline.process_item(make_item("test_spider_a"), spider)
+        pipeline._flush_buffer(spider)
+
+        assert mock_execute_values.call_count == 2
+        assert pipeline.new_jobs_count == 1
+        assert pipeline.process_item(make_item("test_spider_a"), spider) is None
+
+    def test_failed_detail_checked_against_index(
+        self, index_settings, mock_pool, spider
+    ):
+        """Test the index answers whether a job with a failed detail is stored."""
+        cursor = mock_pool.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [("test_spider_a", "stored")]
+        pipeline = PostgreSQLPipeline()
+        pipeline.open_spider(spider)
+        cursor.execute.reset_mock()
+
+        item = {**make_item("test_spider_a"), "detail_failed": True}
+        assert pipeline.process_item(item, spider) is None
+        cursor.execute.assert_not_called()
+
+    def test_index_disabled_above_memory_cap(self, index_settings, mock_pool, spider):
+        """Test the pipeline falls back to queries when too many ids exist."""
+        cursor = mock_pool.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [(f"test_spider_{i}", None) for i in range(11)]
+        pipeline = PostgreSQLPipeline()
+        pipeline.open_spider(spider)
+
+        assert pipeline.job_index is None
+
+    def test_index_skipped_without_prefix(self, index_settings, mock_pool, spider):
+        """Test spiders without a job_id prefix do not preload an index."""
+        spider.job_id_prefix = None
+        pipeline = PostgreSQLPipeline()
+        pipeline.open_spider(spider)
+
+        assert pipeline.job_index is None
+
+
+def test_schema_installs_history_trigger_once(mock_settings, mock_pool):
+    """Test the history trigger is only created when it is missing."""
+    cursor = mock_pool.cursor.return_value.__enter__.return_value
+    cursor.fetchone.return_value = (False, False)
+    PostgreSQLPipeline()._create_schema()
+
+    statements = [call[0][0] for call in cursor.execute.call_args_list]
+    assert "pg_advisory_xact_lock" in statements[0]
+    joined = " ".join(statements)
+    assert "ADD COLUMN IF NOT EXISTS fingerprint" in joined
+    assert "CREATE TABLE IF NOT EXISTS job_versions" in joined
+    assert "CREATE TRIGGER jobs_record_version" in joined
+
+    cursor.reset_mock()
+    cursor.fetchone.return_value = (True, True)
+    PostgreSQLPipeline()._create_schema()
+
+    joined = " ".join(call[0][0] for call in cursor.execute.call_args_list)
+    assert "record_job_version() RETURNS trigger" not in joined
+    assert "CREATE TRIGGER" not in joined
+
+
+def test_schema_skips_existing_columns_and_indexes(mock_settings, mock_pool):
+    """Test no ALTER or CREATE INDEX locks the tables once they are up to date."""
+    cursor = mock_pool.cursor.return_value.__enter__.return_value
+    cursor.fetchall.side_effect = [
+        [
+            (table, column)
+            for table, columns in ADDED_COLUMNS.items()
+            for column in columns
+        ],
+        [(name,) for name in INDEXES],
+    ]
+    PostgreSQLPipeline()._create_schema()
+
+    joined = " ".join(call[0][0] for call in cursor.execute.call_args_list)
+    assert "ALTER TABLE" not in joined
+    assert "CREATE INDEX" not in joined
+    assert "CREATE TABLE IF NOT EXISTS jobs" in joined
@@ -0,0 +1,104 @@
+"""Tests for readiness waits on Playwright-rendered listings."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from scrapy.statscollectors import MemoryStatsCollector
+from scrapy.utils.test import get_crawler
+
+from jobsearchtools.job_scraper.job_scraper.readiness import (
+    ListingReady,
+    ReadyResult,
+    listing_ready,
+    record_ready_stats,
+)
+
+
+def make_page(counts):
+    """Build a page whose listing count follows ``counts``, then stays."""
+    remaining = list(counts)
+
+    async def count():
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    page = MagicMock()
+    page.wait_for_selector = AsyncMock()
+    page.wait_for_load_state = AsyncMock()
+    page.locator.return_value.count = count
+    return page
+
+
+class TestListingReady:
+    """Test the listing readiness wait."""
+
+    def test_ready_once_count_is_stable(self):
+        """Test the wait ends once the listing stops growing."""
+        page = make_page([3, 8, 12, 12])
+        ready = ListingReady("li.job", stable_ms=30, timeout_ms=5000, poll_ms=5)
+
+        result = asyncio.run(ready(page))
+
+        assert result.outcome == "ready"
+        assert result.listings == 12
+        assert result.wait_ms < 1000
+        page.wait_for_load_state.assert_not_awaited()
+
+    def test_ceiling_stops_changing_listing(self):
+        """Test a listing that never settles is cut off at the ceiling."""
+        page = make_page(list(range(1000)))
+        ready = ListingReady("li.job", stable_ms=1000, timeout_ms=50, poll_ms=5)
+
+        result = asyncio.run(ready(page))
+
+        assert result.outcome == "timeout"
+        assert 50 <= result.wait_ms < 1000
+
+    def test_missing_listing_times_out(self):
+        """Test a page without listings reports a timeout."""
+        page = make_page([0])
+        page.wait_for_selector.side_effect = PlaywrightTimeoutError("timeout")
+
+        result = asyncio.run(ListingReady("li.job", timeout_ms=50)(page))
+
+        assert result == ReadyResult(result.wait_ms, "timeout", 0)
+
+    def test_waits_for_network_idle(self):
+        """Test the network idle signal is awaited when requested."""
+        page = make_page([5])
+        ready = ListingReady("li.job", network_idle=True, stable_ms=0)
+
+        asyncio.run(ready(page))
+
+        page.wait_for_load_state.assert_awaited_once()
+        assert page.wait_for_load_state.await_args.args == ("networkidle",)
+
+    def test_page_method_wraps_wait(self):
+        """Test the helper builds a callable page method."""
+        page_method = listing_ready("li.job", network_idle=True)
+
+        assert isinstance(page_method.method, ListingReady)
+        assert page_method.method.network_idle is True
+
+
+class TestReadyStats:
+    """Test readiness waits are recorded as a histogram."""
+
+    @pytest.fixture
+    def stats(self):
+        """Create an in-memory stats collector."""
+        return MemoryStatsCollector(get_crawler())
+
+    def test_waits_counted_per_bucket(self, stats):
+        """Test each wait lands in the bucket of its duration."""
+        record_ready_stats(stats, ReadyResult(120.0, "ready", 10))
+        record_ready_stats(stats, ReadyResult(700.0, "ready", 10))
+        record_ready_stats(stats, ReadyResult(30000.0, "timeout", 3))
+
+        assert stats.get_value("browser_ready/wait_ms/le_250") == 1
+        assert stats.get_value("browser_ready/wait_ms/le_1000") == 1
+        assert stats.get_value("browser_ready/wait_ms/le_inf") == 1
+        assert stats.get_value("browser_ready/outcome/timeout") == 1
+        assert stats.get_value("browser_ready/wait_count") == 3
+        assert stats.get_value("browser_ready/wait_ms_max") == 30000.0
@@ -1,14 +1,28 @@
 """Tests for SpiderScheduler service."""
 
+import os
+import subprocess
+import sys
+from datetime import UTC, datetime
+from multiprocessing import Pipe
 from unittest.mock import MagicMock, patch
 
-from jobsearchtools.scheduler import SpiderScheduler
+import pytest
+
+from jobsearchtools.job_scraper.job_scraper.cache import JsonFileStore
+from jobsearchtools.scheduler import (
+    SpiderScheduler,
+    _combine_summaries,
+    _crawl,
+    _cycle_worker,
+    adapt_interval,
+)
 
 
 class TestSpiderScheduler:
     """Test cases for SpiderScheduler."""
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
     def test_initialization(self, mock_scheduler_class):
         """Test scheduler initializes with correct configuration."""
         mock_scheduler_instance = MagicMock()
@@ -19,7 +33,7 @@ class TestSpiderScheduler:
         assert scheduler.scheduler == mock_scheduler_instance
         mock_scheduler_class.assert_called_once()
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
     def test_discovers_all_spiders(self, mock_scheduler_class):
         """Test scheduler discovers all configured spiders."""
         scheduler = SpiderScheduler()
@@ -31,45 +45,182 @@ class TestSpiderScheduler:
         assert "bbva" in scheduler.spider_names
         assert "visa" in scheduler.spider_names
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_discovery_imports_no_spider(self, mock_scheduler_class):
+        """Test spiders are listed from the registry without importing them."""
+        with patch(
+            "jobsearchtools.job_scraper.job_scraper.spider_registry.SpiderSpec.load"
+        ) as load:
+            scheduler = SpiderScheduler()
+
+        load.assert_not_called()
+        assert scheduler.browser_spiders == {"bbva", "visa"}
+
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
     def test_spider_names_are_unique(self, mock_scheduler_class):
         """Test no duplicate spider names."""
         scheduler = SpiderScheduler()
 
         assert len(scheduler.spider_names) == len(set(scheduler.spider_names))
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
-    @patch("jobsearchtools.scheduler.CrawlerProcess")
-    def test_run_spiders_creates_crawler_process(
-        self, mock_crawler_class, mock_scheduler_class
-    ):
-        """Test run_spiders creates and starts CrawlerProcess."""
+    @patch("scrapy.crawler.CrawlerProcess")
+    def test_crawl_creates_crawler_process(self, mock_crawler_class):
+        """Test _crawl creates and starts CrawlerProcess."""
         mock_process = MagicMock()
         mock_crawler_class.return_value = mock_process
 
-        scheduler = SpiderScheduler()
-        scheduler.run_spiders()
+        _crawl(["avianca"])
 
         mock_crawler_class.assert_called_once()
         mock_process.start.assert_called_once()
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
-    @patch("jobsearchtools.scheduler.CrawlerProcess")
-    def test_run_spiders_crawls_all_discovered_spiders(
-        self, mock_crawler_class, mock_scheduler_class
-    ):
-        """Test all discovered spiders are added to crawler."""
+    @patch("scrapy.crawler.CrawlerProcess")
+    def test_crawl_runs_all_given_spiders(self, mock_crawler_class):
+        """Test all spiders are added to the crawler and summarized."""
         mock_process = MagicMock()
         mock_crawler_class.return_value = mock_process
+        mock_process.create_crawler.return_value.stats.get_stats.return_value = {
+            "item_scraped_count": 3,
+            "new_jobs": [{"job_id": "a"}],
+            "new_jobs_count": 1,
+        }
 
-        scheduler = SpiderScheduler()
-        spider_count = len(scheduler.spider_names)
-        scheduler.run_spiders()
+        summary = _crawl(["avianca", "citi"])
 
         # Each spider should be crawled
-        assert mock_process.crawl.call_count == spider_count
+        assert mock_process.crawl.call_count == 2
+        assert summary["spiders"]["citi"]["items"] == 3
+        assert summary["spiders"]["citi"]["new_jobs"] == [{"job_id": "a"}]
+        assert summary["spiders"]["citi"]["errors"] == 0
+
+    @patch("jobsearchtools.scheduler._crawl")
+    def test_cycle_worker_reports_over_pipe(self, mock_crawl):
+        """Test the worker sends its summary back to the scheduler."""
+        mock_crawl.return_value = {"spiders": {}, "duration": 1.0}
+        receiver, sender = Pipe(duplex=False)
+
+        with patch("jobsearchtools.scheduler.configure_logging"):
+            _cycle_worker(["avianca"], sender)
+
+        assert receiver.recv() == {
+            "ok": True,
+            "summary": {"spiders": {}, "duration": 1.0},
+        }
+
+    @patch("jobsearchtools.scheduler._crawl")
+    def test_cycle_worker_reports_errors(self, mock_crawl):
+        """Test worker failures are reported instead of raised."""
+        mock_crawl.side_effect = Exception("Crawler error")
+        receiver, sender = Pipe(duplex=False)
+
+        with patch("jobsearchtools.scheduler.configure_logging"):
+            _cycle_worker(["avianca"], sender)
+
+        result = receiver.recv()
+        assert result["ok"] is False
+        assert "Crawler error" in result["error"]
+
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_run_spiders_uses_worker_process(self, mock_scheduler_class):
+        """Test run_spiders runs the whole cycle in a worker process."""
+        scheduler = SpiderScheduler()
+        summary = {"spiders": {}, "duration": 1.0, "workers": 2, "failed_workers": []}
+
+        with (
+            patch.object(scheduler, "_run_in_workers", return_value=summary) as run,
+            patch.object(scheduler, "_update_last_run_time") as update,
+        ):
+            assert scheduler.run_spiders() == summary
+
+        groups = run.call_args[0][0]
+        assert sorted(sum(groups, [])) == sorted(scheduler.spider_names)
+        assert update.call_args[1]["status"] == "completed"
+
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_partition_separates_browser_spiders(self, mock_scheduler_class):
+        """Test static spiders are spread out and browser spiders kept apart."""
+        scheduler = SpiderScheduler()
+
+        with patch("jobsearchtools.scheduler.settings") as mock_settings:
+            mock_settings.scheduler.workers = 3
+            groups = scheduler._partition_spiders(scheduler.spider_names)
+
+        assert len(groups) == 3
+        assert sorted(groups[-1]) == ["bbva", "visa"]
+        assert all("bbva" not in group for group in groups[:-1])
+        assert sorted(sum(groups, [])) == sorted(scheduler.spider_names)
+
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_partition_single_worker_still_splits_kinds(self, mock_scheduler_class):
+        """Test a single worker setting keeps static and browser spiders apart."""
+        scheduler = SpiderScheduler()
+
+        with patch("jobsearchtools.scheduler.settings") as mock_settings:
+            mock_settings.scheduler.workers = 1
+            groups = scheduler._partition_spiders(scheduler.spider_names)
+
+        assert len(groups) == 2
+        assert sorted(groups[1]) == ["bbva", "visa"]
+
+    def test_combine_summaries_merges_workers(self):
+        """Test worker summaries are merged into one cycle summary."""
+        spider_stats = {"items": 1, "new_jobs": [], "new_jobs_count": 0, "errors": 0}
+        results = [
+            (
+                ["avianca"],
+                {
+                    "ok": True,
+                    "summary": {
+                        "spiders": {"avianca": spider_stats},
+                        "peak_rss_kb": 100,
+                    },
+                },
+            ),
+            (
+                ["citi"],
+                {
+                    "ok": True,
+                    "summary": {"spiders": {"citi": spider_stats}, "peak_rss_kb": 300},
+                },
+            ),
+            (["bbva"], {"ok": False, "error": "Worker exited without a result"}),
+        ]
+
+        summary = _combine_summaries(results, duration=5.0)
+
+        assert set(summary["spiders"]) == {"avianca", "citi"}
+        assert summary["peak_rss_kb"] == 300
+        assert summary["workers"] == 3
+        assert summary["failed_workers"] == [
+            {"spiders": ["bbva"], "error": "Worker exited without a result"}
+        ]
+
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_worker_ignoring_sigterm_is_killed(self, mock_scheduler_class, caplog):
+        """Test a timed-out worker that survives SIGTERM cannot hang the cycle."""
+        scheduler = SpiderScheduler()
+        worker = MagicMock()
+        worker.name = "spider-cycle-worker-0"
+        # Alive until killed
+        worker.is_alive.side_effect = lambda: not worker.kill.called
+        receiver, sender = Pipe(duplex=False)
+
+        with patch("jobsearchtools.scheduler.settings") as mock_settings:
+            mock_settings.scheduler.cycle_timeout_minutes = 0
+            results = scheduler._wait_for_workers(
+                {receiver: ["bbva"]}, [worker], started=0.0
+            )
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
+        assert results == [
+            (["bbva"], {"ok": False, "error": "Exceeded the 0 minute timeout"})
+        ]
+        worker.terminate.assert_called_once()
+        worker.kill.assert_called_once()
+        assert all(call.args for call in worker.join.call_args_list)
+        assert "killing it" in caplog.text
+        sender.close()
+
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
     def test_shutdown_stops_scheduler(self, mock_scheduler_class):
         """Test shutdown() stops scheduler gracefully."""
         mock_scheduler_instance = MagicMock()
@@ -81,22 +232,83 @@ class TestSpiderScheduler:
 
         mock_scheduler_instance.shutdown.assert_called_once_with(wait=True)
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
-    @patch("jobsearchtools.scheduler.CrawlerProcess")
-    def test_handles_crawler_errors_gracefully(
-        self, mock_crawler_class, mock_scheduler_class
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_handles_crawler_errors_gracefully(self, mock_scheduler_class):
+        """Test scheduler handles worker errors."""
+        scheduler = SpiderScheduler()
+
+        with (
+            patch.object(
+                scheduler, "_run_in_workers", side_effect=RuntimeError("Crawler error")
+            ),
+            patch.object(scheduler, "_update_last_run_time") as update,
+        ):
+            # Should not raise exception, just log it
+            assert scheduler.run_spiders() is None
+
+        assert update.call_args[1]["status"] == "failed"
+
+    @patch("jobsearchtools.scheduler.notification_queue")
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_digest_queued_once_per_cycle(
+        self, mock_scheduler_class, mock_queue, tmp_path
     ):
-        """Test scheduler handles CrawlerProcess errors."""
-        mock_process = MagicMock()
-        mock_process.start.side_effect = Exception("Crawler error")
-        mock_crawler_class.return_value = mock_process
+        """Test digest mode queues every spider's new jobs after the cycle."""
+        scheduler = SpiderScheduler()
+        job = {"title": "Pilot", "company": "Avianca"}
 
+        def run_in_workers(groups, digest_dir):
+            JsonFileStore(digest_dir / "avianca.json").save(
+                {"jobs": [job], "spider_name": "avianca"}
+            )
+            return {"spiders": {}}
+
+        with (
+            patch("jobsearchtools.scheduler.settings") as mock_settings,
+            patch.object(scheduler, "_partition_spiders"),
+            patch.object(scheduler, "_run_in_workers", side_effect=run_in_workers),
+            patch.object(scheduler, "_log_cycle_summary"),
+            patch.object(scheduler, "_update_last_run_time"),
+        ):
+            mock_settings.email.digest = True
+            mock_settings.data_dir = tmp_path
+            scheduler.run_spiders(["avianca", "citi"])
+
+        mock_queue.put.assert_called_once_with(
+            "digest", {"jobs_by_spider": {"avianca": [job]}}
+        )
+        assert list((tmp_path / "digests").iterdir()) == []
+
+    @patch("jobsearchtools.scheduler.notification_queue")
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
+    def test_digest_sent_when_workers_fail(
+        self, mock_scheduler_class, mock_queue, tmp_path
+    ):
+        """Test jobs saved before a worker failed still reach the digest."""
         scheduler = SpiderScheduler()
+        job = {"title": "Pilot", "company": "Avianca"}
 
-        # Should not raise exception, just log it
-        scheduler.run_spiders()  # Should handle error gracefully
+        def run_in_workers(groups, digest_dir):
+            JsonFileStore(digest_dir / "avianca.json").save(
+                {"jobs": [job], "spider_name": "avianca"}
+            )
+            raise RuntimeError("All spider workers failed: timeout")
 
-    @patch("jobsearchtools.scheduler.BlockingScheduler")
+        with (
+            patch("jobsearchtools.scheduler.settings") as mock_settings,
+            patch.object(scheduler, "_partition_spiders"),
+            patch.object(scheduler, "_run_in_workers", side_effect=run_in_workers),
+            patch.object(scheduler, "_update_last_run_time"),
+        ):
+            mock_settings.email.digest = True
+            mock_settings.data_dir = tmp_path
+            assert scheduler.run_spiders(["avianca"]) is None
+
+        mock_queue.put.assert_called_once_with(
+            "digest", {"jobs_by_spider": {"avianca": [job]}}
+        )
+
+    @patch("apscheduler.schedulers.blocking.BlockingScheduler")
     def test_scheduler_uses_configured_timezone(self, mock_scheduler_class):
         """Test scheduler uses timezone from settings."""
         from jobsearchtools.config.settings import settings
@@ -106,3 +318,105 @@ class TestSpiderScheduler:
         # Verify scheduler was initialized with correct timezone
         call_kwargs = mock_scheduler_class.call_args[1]
         assert call_kwargs["timezone"] == settings.scheduler.timezone
+
+
+class TestAdaptiveScheduling:
+    """Test per-spider adaptive intervals."""
+
+    def test_interval_halves_after_new_jobs(self):
+        """Test a run with new jobs polls the spider more often."""
+        assert adapt_interval(8, [0, 3], min_hours=1, max_hours=48) == 4
+
+    def test_interval_grows_after_quiet_runs(self):
+        """Test several runs without new jobs poll the spider less often."""
+        assert adapt_interval(8, [2, 0, 0, 0], min_hours=1, max_hours=48) == 12
+        assert adapt_interval(8, [2, 0, 0], min_hours=1, max_hours=48) == 8
+
+    def test_interval_clamped_to_bounds(self):
+        """Test the interval never leaves the configured range."""
+        assert adapt_interval(1.5, [5], min_hours=1, max_hours=48) == 1
+        assert adapt_interval(40, [0, 0, 0], min_hours=1, max_hours=48) == 48
+
+    @pytest.fixture
+    def adaptive_scheduler(self, tmp_path):
+        """Create a scheduler with a temporary schedule store."""
+        with patch("apscheduler.schedulers.blocking.BlockingScheduler"):
+            scheduler = SpiderScheduler()
+        scheduler.spider_names = ["avianca", "citi", "visa"]
+        scheduler.schedule_store = JsonFileStore(tmp_path / "schedule.json")
+        return scheduler
+
+    def test_due_spiders_run_in_one_cycle(self, adaptive_scheduler):
+        """Test due spiders share one cycle and get their own intervals."""
+        adaptive_scheduler.schedule_store.save(
+            {
+                "citi": {
+                    "interval_hours": 8.0,
+                    "history": [0],
+                    "last_run_at": datetime.now(UTC).isoformat(),
+                }
+            }
+        )
+        summary = {
+            "spiders": {
+                "avianca": {"new_jobs_count": 2},
+                "visa": {"new_jobs_count": 0},
+            }
+        }
+
+        with (
+            patch("jobsearchtools.scheduler.settings") as mock_settings,
+            patch.object(
+                adaptive_scheduler, "_run_cycle", return_value=summary
+            ) as run_cycle,
+            patch.object(adaptive_scheduler, "_update_last_run_time") as update,
+        ):
+            mock_settings.scheduler.interval_hours = 8
+            mock_settings.scheduler.min_interval_hours = 1
+            mock_settings.scheduler.max_interval_hours = 48
+            adaptive_scheduler.run_due_spiders()
+
+        run_cycle.assert_called_once_with(["avianca", "visa"])
+        update.assert_not_called()
+        state = adaptive_scheduler.schedule_store.load()
+        assert state["avianca"]["history"] == [2]
+        assert state["avianca"]["interval_hours"] == 4
+        assert state["visa"]["history"] == [0]
+        assert state["citi"]["history"] == [0]
+
+    def test_unreported_spider_waits_for_its_interval(self, adaptive_scheduler):
+        """Test a failed spider is not retried at the next check."""
+        with patch.object(adaptive_scheduler, "_run_cycle", return_value=None):
+            adaptive_scheduler.run_due_spiders()
+
+        state = adaptive_scheduler.schedule_store.load()
+        assert state["avianca"]["history"] == []
+        assert state["avianca"]["last_run_at"]
+        assert adaptive_scheduler._due_spiders(datetime.now(UTC)) == []
+
+    def test_schedule_adaptive_adds_single_job(self, adaptive_scheduler):
+        """Test adaptive mode checks due spiders with one non-overlapping job."""
+        adaptive_scheduler._schedule_adaptive()
+
+        adaptive_scheduler.scheduler.add_job.assert_called_once()
+        kwargs = adaptive_scheduler.scheduler.add_job.call_args[1]
+        assert kwargs["id"] == "adaptive_run_job"
+        assert kwargs["max_instances"] == 1
+        assert kwargs["next_run_time"] <= datetime.now(UTC)
+
+
+def test_import_skips_crawler_and_apscheduler():
+    """Test importing the scheduler module loads no crawl machinery."""
+    code = (
+        "import sys, jobsearchtools.scheduler; "
+        "print([m for m in ('scrapy.crawler', 'apscheduler') if m in sys.modules])"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+    assert result.stdout.strip() == "[]"
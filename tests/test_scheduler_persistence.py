@@ -5,6 +5,7 @@ Tests the new functionality that ensures spiders run at least every N hours
 even after container restarts or PC shutdowns.
 """
 
+import threading
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -31,6 +32,8 @@ def scheduler():
         mock_settings.scheduler.interval_hours = 4
         mock_settings.scheduler.timezone = "America/Bogota"
         mock_settings.scheduler.max_instances = 1
+        mock_settings.scheduler.workers = None
+        mock_settings.scheduler.adaptive = False
 
         with patch.object(
             SpiderScheduler, "_discover_spiders", return_value=["test_spider"]
@@ -138,10 +141,15 @@ class TestSchedulerStatePersistence:
 
         with (
             patch.object(scheduler, "_get_db_connection", return_value=conn),
-            patch("jobsearchtools.scheduler.CrawlerProcess") as mock_process,
+            patch.object(scheduler, "_run_in_workers") as mock_worker,
             patch.object(scheduler, "_update_last_run_time") as mock_update,
         ):
-            mock_process.return_value.start.return_value = None
+            mock_worker.return_value = {
+                "spiders": {},
+                "duration": 1.0,
+                "workers": 1,
+                "failed_workers": [],
+            }
             scheduler.run_spiders()
 
             # Check that status was updated to running and completed
@@ -157,10 +165,10 @@ class TestSchedulerStatePersistence:
 
         with (
             patch.object(scheduler, "_get_db_connection", return_value=conn),
-            patch("jobsearchtools.scheduler.CrawlerProcess") as mock_process,
+            patch.object(scheduler, "_run_in_workers") as mock_worker,
             patch.object(scheduler, "_update_last_run_time") as mock_update,
         ):
-            mock_process.return_value.start.side_effect = Exception("Test error")
+            mock_worker.side_effect = RuntimeError("Test error")
             scheduler.run_spiders()
 
             # Check that status was updated to running and failed
@@ -252,3 +260,21 @@ class TestSchedulerStatePersistence:
             # Should create new connection
             mock_connect.assert_called_once()
             assert result is new_conn
+
+    def test_db_connection_per_thread(self, scheduler):
+        """Test threads running jobs never share a connection."""
+        import psycopg2
+
+        with patch.object(
+            psycopg2, "connect", side_effect=lambda **kw: MagicMock(closed=False)
+        ):
+            main = scheduler._get_db_connection()
+            other = []
+            thread = threading.Thread(
+                target=lambda: other.append(scheduler._get_db_connection())
+            )
+            thread.start()
+            thread.join()
+
+            assert other[0] is not main
+            assert scheduler._get_db_connection() is main
@@ -17,6 +17,12 @@ class TestScrapySettings:
         assert isinstance(settings.SPIDER_MODULES, list)
         assert len(settings.SPIDER_MODULES) > 0
 
+    def test_spider_loader_uses_registry(self):
+        """Test spiders are loaded through the static registry."""
+        assert settings.SPIDER_LOADER_CLASS.endswith(
+            "spider_registry.RegistrySpiderLoader"
+        )
+
     def test_robotstxt_obey(self):
         """Test robots.txt setting exists."""
         assert hasattr(settings, "ROBOTSTXT_OBEY")
@@ -38,6 +44,31 @@ class TestScrapySettings:
         middlewares = settings.DOWNLOADER_MIDDLEWARES
         assert any("SetRandomUserAgentMiddleware" in key for key in middlewares)
 
+    def test_conditional_http_cache(self):
+        """Test listing pages are cached and revalidated."""
+        assert settings.HTTPCACHE_ENABLED is True
+        assert settings.HTTPCACHE_POLICY.endswith("ConditionalRequestPolicy")
+        assert any(
+            "ConditionalCacheMiddleware" in key
+            for key in settings.DOWNLOADER_MIDDLEWARES
+        )
+
+    def test_domain_throttle(self):
+        """Test per-host throttling is wired from the app settings."""
+        assert settings.DOMAIN_THROTTLE_ENABLED is True
+        assert isinstance(settings.DOWNLOAD_SLOTS, dict)
+        assert any("DomainThrottleExtension" in key for key in settings.EXTENSIONS)
+
+    def test_default_download_slots(self):
+        """Test a default install fetches the known job boards in parallel."""
+        assert settings.DOWNLOAD_SLOTS["jobs.avianca.com"] == {
+            "concurrency": 4,
+            "delay": 0.25,
+        }
+        assert settings.DOWNLOAD_SLOTS["bbva.wd3.myworkdayjobs.com"]["concurrency"] == 2
+        assert settings.DOWNLOAD_SLOTS["jobs.citi.com"]["concurrency"] == 2
+        assert set(settings.DOMAIN_THROTTLE_POLICIES) == set(settings.DOWNLOAD_SLOTS)
+
     def test_pipeline_configured(self):
         """Test PostgreSQL pipeline is configured."""
         assert hasattr(settings, "ITEM_PIPELINES")
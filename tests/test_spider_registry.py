@@ -0,0 +1,104 @@
+"""Tests for the static spider registry and its Scrapy spider loader."""
+
+import os
+import pkgutil
+import subprocess
+import sys
+from importlib import import_module
+from unittest.mock import patch
+
+import pytest
+from scrapy import Request, Spider
+from scrapy.utils.spider import iter_spider_classes
+
+from jobsearchtools.job_scraper.job_scraper.spider_registry import (
+    SPIDERS,
+    SPIDERS_PACKAGE,
+    RegistrySpiderLoader,
+    available_spiders,
+)
+
+
+def spider_classes() -> dict[str, type[Spider]]:
+    """Import every spider module and collect the spider classes by name."""
+    classes = {}
+    package = import_module(SPIDERS_PACKAGE)
+    for info in pkgutil.walk_packages(package.__path__, f"{SPIDERS_PACKAGE}."):
+        for spider_class in iter_spider_classes(import_module(info.name)):
+            classes[spider_class.name] = spider_class
+    return classes
+
+
+class TestRegistry:
+    """Test the registry describes the spiders that exist."""
+
+    def test_registry_lists_every_spider(self):
+        """Test no spider module is missing from the registry."""
+        assert sorted(spec.name for spec in SPIDERS) == sorted(spider_classes())
+
+    @pytest.mark.parametrize("spec", SPIDERS, ids=lambda spec: spec.name)
+    def test_entry_matches_spider_class(self, spec):
+        """Test each entry's class, domain and browser flag are correct."""
+        spider_class = spec.load()
+        handlers = (spider_class.custom_settings or {}).get("DOWNLOAD_HANDLERS", {})
+
+        assert spider_class.name == spec.name
+        assert spec.domain in spider_class.allowed_domains
+        assert spec.browser == bool(handlers)
+
+    def test_browser_spiders_skipped_without_playwright(self):
+        """Test browser spiders are not offered if Playwright is missing."""
+        with patch(
+            "jobsearchtools.job_scraper.job_scraper.spider_registry.browser_available",
+            return_value=False,
+        ):
+            specs = available_spiders()
+
+        assert specs
+        assert not any(spec.browser for spec in specs)
+
+
+class TestRegistrySpiderLoader:
+    """Test Scrapy loads spiders through the registry."""
+
+    def test_load_and_list(self):
+        """Test a registered spider loads and all names are listed."""
+        loader = RegistrySpiderLoader()
+
+        assert loader.load("citi").name == "citi"
+        assert loader.list() == [spec.name for spec in SPIDERS]
+
+    def test_unknown_spider_raises_key_error(self):
+        """Test an unknown name raises the KeyError Scrapy expects."""
+        with pytest.raises(KeyError):
+            RegistrySpiderLoader().load("missing")
+
+    def test_find_by_request_matches_domain(self):
+        """Test requests are matched to spiders by domain and subdomain."""
+        loader = RegistrySpiderLoader()
+
+        assert loader.find_by_request(Request("https://jobs.citi.com/x")) == ["citi"]
+        assert loader.find_by_request(Request("https://www.corporate.visa.com/")) == [
+            "visa"
+        ]
+        assert loader.find_by_request(Request("https://example.com/")) == []
+
+    def test_loading_one_spider_imports_only_its_module(self):
+        """Test a static spider loads without the browser spiders."""
+        code = (
+            "import sys\n"
+            "from jobsearchtools.job_scraper.job_scraper.spider_registry import "
+            "RegistrySpiderLoader, SPIDERS\n"
+            "RegistrySpiderLoader().load('avianca')\n"
+            "print([s.name for s in SPIDERS if s.module in sys.modules])\n"
+            "print('scrapy_playwright' in sys.modules)\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        assert result.stdout.split("\n")[:2] == ["['avianca']", "False"]
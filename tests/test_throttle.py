@@ -0,0 +1,127 @@
+"""Tests for per-host politeness budgets."""
+
+from types import SimpleNamespace
+
+import pytest
+from scrapy.exceptions import NotConfigured
+from scrapy.http import Request, Response
+from scrapy.utils.test import get_crawler
+
+from jobsearchtools.job_scraper.job_scraper.throttle import (
+    DomainThrottleExtension,
+    HostPolicy,
+    next_delay,
+)
+
+POLICY = HostPolicy(concurrency=4, min_delay=0.25, max_delay=30, target_latency=1.0)
+
+
+class TestNextDelay:
+    """Test the delay adjustment rules."""
+
+    def test_fast_host_approaches_min_delay(self):
+        """Test quick responses bring the delay down to the minimum."""
+        delay = 2.0
+        for _ in range(10):
+            delay = next_delay(POLICY, delay, latency=0.2, status=200)
+
+        assert delay == 0.25
+
+    def test_slow_host_slowed_beyond_latency(self):
+        """Test responses above the target latency raise the delay."""
+        delay = next_delay(POLICY, 0.25, latency=4.0, status=200)
+
+        assert delay == 4.0  # 4s / 4 requests, times 4x over target
+
+    def test_throttling_status_doubles_delay(self):
+        """Test 429/503 back off within the maximum delay."""
+        assert next_delay(POLICY, 3.0, latency=0.1, status=429) == 6.0
+        assert next_delay(POLICY, 20.0, latency=0.1, status=503) == 30
+
+    def test_retry_after_honoured(self):
+        """Test the server's Retry-After sets the delay floor."""
+        delay = next_delay(POLICY, 1.0, latency=0.1, status=429, retry_after=12)
+
+        assert delay == 12
+
+    def test_error_pages_never_speed_up(self):
+        """Test fast error responses keep the current delay."""
+        assert next_delay(POLICY, 2.0, latency=0.05, status=404) == 2.0
+
+
+class TestDomainThrottleExtension:
+    """Test delays are applied to download slots and reported."""
+
+    @pytest.fixture
+    def crawler(self):
+        """Create a crawler with a policy for one host and a fake downloader."""
+        crawler = get_crawler(
+            settings_dict={
+                "DOMAIN_THROTTLE_ENABLED": True,
+                "DOWNLOAD_DELAY": 1.0,
+                "DOMAIN_THROTTLE_MAX_DELAY": 60,
+                "DOMAIN_THROTTLE_TARGET_LATENCY": 2.0,
+                "DOMAIN_THROTTLE_POLICIES": {
+                    "jobs.avianca.com": {
+                        "concurrency": 4,
+                        "min_delay": 0.25,
+                        "max_delay": 30,
+                        "target_latency": 1.0,
+                    }
+                },
+            }
+        )
+        crawler.stats.open_spider()
+        slots = {
+            "jobs.avianca.com": SimpleNamespace(delay=1.0),
+            "jobs.citi.com": SimpleNamespace(delay=1.0),
+        }
+        crawler.engine = SimpleNamespace(downloader=SimpleNamespace(slots=slots))
+        return crawler
+
+    def download(self, ext, host, status=200, latency=0.1, headers=None):
+        """Send a response for a host through the extension."""
+        url = f"https://{host}/search/"
+        request = Request(
+            url, meta={"download_slot": host, "download_latency": latency}
+        )
+        response = Response(url, status=status, headers=headers, request=request)
+        ext.response_downloaded(response, request, None)
+        return ext.crawler.engine.downloader.slots[host].delay
+
+    def test_policy_applied_per_host(self, crawler):
+        """Test configured hosts go faster than the project-wide default."""
+        ext = DomainThrottleExtension.from_crawler(crawler)
+
+        fast = self.download(ext, "jobs.avianca.com")
+        default = self.download(ext, "jobs.citi.com")
+
+        assert fast < 1.0
+        assert default == 1.0  # DOWNLOAD_DELAY is the floor
+        assert crawler.stats.get_value("throttle/jobs.avianca.com/delay") == round(
+            fast, 3
+        )
+        assert crawler.stats.get_value("throttle/jobs.citi.com/delay") == 1.0
+
+    def test_throttled_responses_counted(self, crawler):
+        """Test 429 answers raise the delay and are counted."""
+        ext = DomainThrottleExtension.from_crawler(crawler)
+
+        delay = self.download(
+            ext, "jobs.citi.com", status=429, headers={"Retry-After": "5"}
+        )
+
+        assert delay == 5.0
+        assert crawler.stats.get_value("throttle/jobs.citi.com/throttled_count") == 1
+
+    def test_disabled_with_autothrottle(self):
+        """Test the extension steps aside when AutoThrottle is on."""
+        crawler = get_crawler(
+            settings_dict={
+                "DOMAIN_THROTTLE_ENABLED": True,
+                "AUTOTHROTTLE_ENABLED": True,
+            }
+        )
+
+        with pytest.raises(NotConfigured):
+            DomainThrottleExtension.from_crawler(crawler)